@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Benchmark habit analytics served from rollups against raw completion scans.
+
+Seeds a database with ``--completions`` habit completions spread over
+``--users`` users, builds the rollups, then times the analytics read path
+(rollups) against the equivalent aggregation over raw ``habit_completions``.
+
+Examples:
+  python benchmarks/bench_habit_analytics.py --completions 10000000
+  python benchmarks/bench_habit_analytics.py --completions 100000 --db sqlite://:memory:
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tortoise import Tortoise  # noqa: E402
+from tortoise.functions import Count, Sum  # noqa: E402
+from src.database import TORTOISE_ORM  # noqa: E402
+from src.database.models import Habit, HabitCompletion, User  # noqa: E402
+from src.database.models.enums import Frequency, RollupPeriod  # noqa: E402
+from src.server.services.habit_service import HabitRollupService  # noqa: E402
+
+HABITS_PER_USER = 5
+INSERT_CHUNK_SIZE = 10_000
+
+
+async def seed(completions: int, users: int) -> list:
+    """Create users, habits and ``completions`` completion rows."""
+    habit_count = users * HABITS_PER_USER
+    days_per_habit = max(1, completions // habit_count)
+    first_day = date.today() - timedelta(days=days_per_habit - 1)
+
+    user_rows = [
+        User(id=uuid.uuid4(), clerk_id=f"bench_{i}", email=f"bench_{i}@example.com")
+        for i in range(users)
+    ]
+    await User.bulk_create(user_rows, batch_size=1000)
+
+    habits = [
+        Habit(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            name=f"Habit {n}",
+            frequency=(Frequency.DAILY, Frequency.WEEKLY)[n % 2],
+            target_days=None if n % 2 == 0 else [0, 2, 4],
+        )
+        for user in user_rows
+        for n in range(HABITS_PER_USER)
+    ]
+    await Habit.bulk_create(habits, batch_size=1000)
+
+    inserted = 0
+    batch = []
+    for offset in range(days_per_habit):
+        day = first_day + timedelta(days=offset)
+        for habit in habits:
+            batch.append(
+                HabitCompletion(
+                    habit_id=habit.id, completion_date=day, completed_count=1
+                )
+            )
+            if len(batch) >= INSERT_CHUNK_SIZE:
+                await HabitCompletion.bulk_create(batch)
+                inserted += len(batch)
+                batch = []
+                print(f"\r  inserted {inserted:,} completions", end="", flush=True)
+    if batch:
+        await HabitCompletion.bulk_create(batch)
+        inserted += len(batch)
+    print(f"\r  inserted {inserted:,} completions")
+    return user_rows
+
+
+async def raw_scan(user: User, date_from: date, date_to: date) -> list:
+    """The query analytics would need without rollups."""
+    return (
+        await HabitCompletion.filter(
+            habit__user=user,
+            completion_date__gte=date_from,
+            completion_date__lte=date_to,
+            deleted_at__isnull=True,
+        )
+        .annotate(total=Sum("completed_count"), days=Count("id"))
+        .group_by("habit_id")
+        .values("habit_id", "total", "days")
+    )
+
+
+async def timed(func, repeat: int) -> list:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name: str, samples: list) -> None:
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(
+        f"  {name:<28} median {statistics.median(samples):8.2f} ms   p95 {p95:8.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--completions", type=int, default=10_000_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--db", default="sqlite:///tmp/orga_bench_habits.sqlite3")
+    args = parser.parse_args()
+
+    config = {**TORTOISE_ORM, "connections": {"default": args.db}}
+    await Tortoise.init(config=config)
+    await Tortoise.generate_schemas()
+
+    try:
+        if not await HabitCompletion.exists():
+            print(f"Seeding {args.completions:,} completions...")
+            start = time.perf_counter()
+            await seed(args.completions, args.users)
+            print(f"  seeded in {time.perf_counter() - start:.1f}s")
+
+            print("Building rollups...")
+            start = time.perf_counter()
+            written = await HabitRollupService.rebuild()
+            print(f"  {written:,} rollup rows in {time.perf_counter() - start:.1f}s")
+
+        user = await User.filter(clerk_id__startswith="bench_").first()
+        date_to = date.today()
+        date_from = date_to - timedelta(weeks=52)
+
+        print(f"Analytics for one user, {date_from} .. {date_to}:")
+        for period in (RollupPeriod.WEEK, RollupPeriod.MONTH):
+            samples = await timed(
+                lambda: HabitRollupService.get_analytics(
+                    user, period, date_from, date_to
+                ),
+                args.repeat,
+            )
+            report(f"rollups ({period.value})", samples)
+        report(
+            "raw completion scan",
+            await timed(lambda: raw_scan(user, date_from, date_to), args.repeat),
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Startup, memory and shutdown benchmark of the production server.
+
+Starts ``src.cli.serve`` once per worker count in ``--workers`` and records
+how long it takes until the first request is answered and until every worker
+has completed its startup, the proportional memory (PSS) of the process tree
+and per worker, ``GET /health`` throughput, and how long a graceful shutdown
+takes. Memory is read from ``/proc`` and only reported on Linux.
+
+Examples:
+  python benchmarks/bench_server_startup.py --workers 1,2,4,8
+  python benchmarks/bench_server_startup.py --requests 5000 --output startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import httpx
+
+ROOT = Path(__file__).parent.parent
+READY_LINE = "Application startup complete."
+
+
+class ServerProcess:
+    """A ``src.cli.serve`` process whose log lines are counted as they arrive."""
+
+    def __init__(self, workers: int, port: int, env: dict):
+        self.workers = workers
+        self.started = time.perf_counter()
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "src.cli.serve",
+                "--workers",
+                str(workers),
+                "--port",
+                str(port),
+                "--host",
+                "127.0.0.1",
+            ],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        self.ready_seconds: Optional[float] = None
+        self.all_ready = threading.Event()
+        # Keeps reading so that request logs never fill the pipe.
+        threading.Thread(target=self._read_log, daemon=True).start()
+
+    def _read_log(self) -> None:
+        ready = 0
+        for line in self.process.stderr:
+            if READY_LINE in line:
+                ready += 1
+                if ready == self.workers:
+                    self.ready_seconds = time.perf_counter() - self.started
+                    self.all_ready.set()
+
+    def stop(self, timeout: float) -> float:
+        """Send SIGTERM and return the seconds until the process exited."""
+        started = time.perf_counter()
+        self.process.send_signal(signal.SIGTERM)
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        return time.perf_counter() - started
+
+
+def process_tree(pid: int) -> List[int]:
+    try:
+        children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    except OSError:
+        return [pid]
+    return [pid] + [int(child) for child in children]
+
+
+def pss_mb(pid: int) -> Optional[float]:
+    """Proportional set size in MB: shared pages are split between processes."""
+    try:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+async def first_response(url: str, timeout: float) -> float:
+    """Poll ``/health`` until it answers; returns the time of the answer."""
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return time.perf_counter()
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.01)
+    raise TimeoutError(f"{url} did not answer within {timeout}s")
+
+
+async def throughput(url: str, requests: int, concurrency: int) -> float:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                (await client.get("/health")).raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+async def measure(workers: int, args, env: dict) -> dict:
+    url = f"http://127.0.0.1:{args.port}"
+    server = ServerProcess(workers, args.port, env)
+    try:
+        answered = await first_response(url, args.timeout)
+        first_seconds = answered - server.started
+        if not await asyncio.to_thread(server.all_ready.wait, args.timeout):
+            raise TimeoutError(f"{workers} workers did not start in {args.timeout}s")
+        pids = process_tree(server.process.pid)
+        memory = [pss_mb(pid) for pid in pids]
+        total_mb = None if None in memory else sum(memory)
+        requests_per_second = await throughput(url, args.requests, args.concurrency)
+    finally:
+        stop_seconds = server.stop(args.timeout)
+    return {
+        "workers": workers,
+        "first_response_s": first_seconds,
+        "all_ready_s": server.ready_seconds,
+        "pss_total_mb": total_mb,
+        "pss_per_worker_mb": None if total_mb is None else total_mb / workers,
+        "health_req_per_s": requests_per_second,
+        "shutdown_s": stop_seconds,
+    }
+
+
+def report(results: List[dict]) -> None:
+    print(
+        f"\n{'workers':>7}{'first resp':>12}{'all ready':>11}{'PSS MB':>9}"
+        f"{'MB/worker':>11}{'req/s':>9}{'shutdown':>10}"
+    )
+
+    def number(value: Optional[float], spec: str) -> str:
+        return "n/a" if value is None else format(value, spec)
+
+    for result in results:
+        print(
+            f"{result['workers']:>7}"
+            f"{result['first_response_s']:>11.2f}s"
+            f"{result['all_ready_s']:>10.2f}s"
+            f"{number(result['pss_total_mb'], '.1f'):>9}"
+            f"{number(result['pss_per_worker_mb'], '.1f'):>11}"
+            f"{result['health_req_per_s']:>9,.0f}"
+            f"{result['shutdown_s']:>9.2f}s"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers", default="1,2,4", help="Comma-separated worker counts"
+    )
+    parser.add_argument("--port", type=int, default=8097)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--db", default="sqlite:///tmp/orga_bench_startup.sqlite3")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.db,
+        "JWT_SECRET": os.getenv("JWT_SECRET", "bench-secret-not-for-production-use"),
+        "QUERY_STATS": "false",
+        "DEBUG": "False",
+    }
+    results = []
+    for workers in (int(count) for count in args.workers.split(",")):
+        print(f"Starting {workers} workers...")
+        results.append(await measure(workers, args, env))
+
+    report(results)
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "arguments": vars(args) | {"output": str(args.output)},
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""Load generator for the FastAPI server.
+
+Drives ``src.server.app`` with a weighted mix of task list, get, create and
+patch requests and reports throughput, latency percentiles and histograms,
+and DB queries per endpoint. By default the app runs in-process through an
+ASGI transport; pass ``--url`` to load a running uvicorn server instead (it
+must share ``DATABASE_URL`` and ``JWT_SECRET`` with this script, which seeds
+the users it sends requests for, and run with ``QUERY_STATS=true`` to report
+DB queries).
+
+The request plan is generated up front from ``--seed`` on top of a
+deterministic synthetic dataset, so the same arguments replay exactly the
+same requests and runs of different releases can be compared.
+
+Examples:
+  python benchmarks/load_test.py --scenario mixed --requests 5000
+  python benchmarks/load_test.py --scenario read-heavy --concurrency 50 --output run.json
+  python benchmarks/load_test.py --url http://127.0.0.1:8000 --db sqlite://db.sqlite3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+SCENARIOS = {
+    "mixed": {"list": 50, "get": 30, "create": 10, "patch": 10},
+    "read-heavy": {"list": 70, "get": 28, "create": 1, "patch": 1},
+    "write-heavy": {"list": 20, "get": 20, "create": 30, "patch": 30},
+}
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+LIST_PARAMS = (
+    {},
+    {"status": "pending"},
+    {"status": "in_progress", "sort_by": "due_date", "sort_order": "asc"},
+    {"priority": 3},
+    {"sort_by": "priority"},
+    {"page": 2},
+    {"search": "report"},
+)
+
+
+@dataclass
+class PlannedRequest:
+    user_index: int
+    endpoint: str
+    method: str
+    path: str
+    params: Optional[dict] = None
+    body: Optional[dict] = None
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.queries: List[int] = []
+        self.query_ms: List[float] = []
+
+    def percentile(self, fraction: float) -> float:
+        samples = sorted(self.latencies_ms)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    def histogram(self) -> Dict[str, int]:
+        counts = {f"<={bucket}ms": 0 for bucket in HISTOGRAM_BUCKETS_MS}
+        counts["slower"] = 0
+        for latency in self.latencies_ms:
+            for bucket in HISTOGRAM_BUCKETS_MS:
+                if latency <= bucket:
+                    counts[f"<={bucket}ms"] += 1
+                    break
+            else:
+                counts["slower"] += 1
+        return counts
+
+    def summary(self) -> dict:
+        requests = len(self.latencies_ms)
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "p50_ms": self.percentile(0.50),
+            "p90_ms": self.percentile(0.90),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": max(self.latencies_ms),
+            "queries_per_request": (
+                sum(self.queries) / len(self.queries) if self.queries else None
+            ),
+            "query_ms_per_request": (
+                sum(self.query_ms) / len(self.query_ms) if self.query_ms else None
+            ),
+            "histogram": self.histogram(),
+        }
+
+
+def build_plan(
+    task_ids: List[List[str]], scenario: str, requests: int, seed: int
+) -> List[PlannedRequest]:
+    """The full, reproducible sequence of requests for a run."""
+    rnd = random.Random(seed)
+    weights = SCENARIOS[scenario]
+    plan = []
+    for n in range(requests):
+        user_index = rnd.randrange(len(task_ids))
+        operation = rnd.choices(list(weights), list(weights.values()))[0]
+        task_id = rnd.choice(task_ids[user_index])
+        if operation == "list":
+            request = PlannedRequest(
+                user_index,
+                "GET /tasks",
+                "GET",
+                "/tasks/",
+                params=rnd.choice(LIST_PARAMS),
+            )
+        elif operation == "get":
+            request = PlannedRequest(
+                user_index, "GET /tasks/{id}", "GET", f"/tasks/{task_id}"
+            )
+        elif operation == "create":
+            body = {
+                "title": f"Load test task {n}",
+                "priority": rnd.randint(0, 4),
+                "due_date": (
+                    date.today() + timedelta(days=rnd.randint(0, 30))
+                ).isoformat(),
+            }
+            request = PlannedRequest(
+                user_index, "POST /tasks", "POST", "/tasks/", body=body
+            )
+        else:
+            body = rnd.choice(
+                [
+                    {"completion_percentage": rnd.randrange(0, 100, 10)},
+                    {"priority": rnd.randint(0, 4)},
+                    {"status": "in_progress"},
+                ]
+            )
+            request = PlannedRequest(
+                user_index, "PATCH /tasks/{id}", "PATCH", f"/tasks/{task_id}", body=body
+            )
+        plan.append(request)
+    return plan
+
+
+async def prepare_users(users: int, tasks_per_user: int, seed: int) -> tuple:
+    """Seed the synthetic dataset once and return tokens and task ids per user."""
+    from src.database.models import Task, User
+    from src.database.seeds.synthetic_seeds import (
+        SyntheticProfile,
+        seed_synthetic_range,
+    )
+    from src.server.utils.jwt import create_access_token
+
+    prefix = f"user_synthetic_{seed}_"
+    if await User.filter(clerk_id__startswith=prefix).count() < users:
+        print(f"Seeding {users:,} users...")
+        existing = await User.filter(clerk_id__startswith=prefix).count()
+        await seed_synthetic_range(
+            existing, users, seed, SyntheticProfile(tasks_per_user=tasks_per_user)
+        )
+
+    tokens, task_ids = [], []
+    for index in range(users):
+        user = await User.get(clerk_id=f"{prefix}{index}")
+        ids = await (
+            Task.filter(user=user, deleted_at__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        tokens.append(create_access_token(user_id=str(user.id)))
+        task_ids.append([str(task_id) for task_id in ids])
+    return tokens, task_ids
+
+
+async def drive(client, plan, tokens, concurrency: int, track) -> tuple:
+    """Send the planned requests from ``concurrency`` workers."""
+    stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+    queue = iter(plan)
+
+    async def worker():
+        for request in queue:
+            headers = {"Authorization": f"Bearer {tokens[request.user_index]}"}
+            with track() as log:
+                started = time.perf_counter()
+                response = await client.request(
+                    request.method,
+                    request.path,
+                    params=request.params,
+                    json=request.body,
+                    headers=headers,
+                )
+                elapsed = (time.perf_counter() - started) * 1000
+            endpoint = stats[request.endpoint]
+            endpoint.latencies_ms.append(elapsed)
+            if response.status_code >= 400:
+                endpoint.errors += 1
+            if "X-DB-Queries" in response.headers:
+                endpoint.queries.append(int(response.headers["X-DB-Queries"]))
+                endpoint.query_ms.append(float(response.headers["X-DB-Time-Ms"]))
+            elif log is not None:
+                endpoint.queries.append(log.count)
+                endpoint.query_ms.append(log.seconds * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+def report(stats: Dict[str, EndpointStats], seconds: float) -> dict:
+    total = sum(len(s.latencies_ms) for s in stats.values())
+    print(f"\n{total:,} requests in {seconds:.2f}s ({total / seconds:,.0f} req/s)\n")
+    print(
+        f"{'endpoint':<20}{'reqs':>7}{'errors':>8}{'p50':>9}{'p90':>9}"
+        f"{'p99':>9}{'max':>9}{'queries':>9}{'db ms':>8}"
+    )
+    summaries = {}
+    for name in sorted(stats):
+        summary = summaries[name] = stats[name].summary()
+        queries = summary["queries_per_request"]
+        query_ms = summary["query_ms_per_request"]
+        print(
+            f"{name:<20}{summary['requests']:>7}{summary['errors']:>8}"
+            f"{summary['p50_ms']:>9.2f}{summary['p90_ms']:>9.2f}"
+            f"{summary['p99_ms']:>9.2f}{summary['max_ms']:>9.2f}"
+            f"{queries if queries is None else format(queries, '.1f'):>9}"
+            f"{query_ms if query_ms is None else format(query_ms, '.2f'):>8}"
+        )
+
+    print("\nLatency histograms")
+    for name, summary in summaries.items():
+        print(f"  {name}")
+        requests = summary["requests"]
+        for bucket, count in summary["histogram"].items():
+            bar = "#" * round(40 * count / requests)
+            print(f"    {bucket:>9} {count:>7} {bar}")
+
+    return {
+        "requests": total,
+        "seconds": seconds,
+        "throughput": total / seconds,
+        "endpoints": summaries,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tasks-per-user", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--url", help="Load a running server instead of in-process")
+    parser.add_argument("--db", default="sqlite:///tmp/orga_load_test.sqlite3")
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    # Settings are read at import time, so configure them before importing the app.
+    os.environ["DATABASE_URL"] = args.db
+    os.environ.setdefault("JWT_SECRET", "load-test-secret-not-for-production-use")
+    # A few users send every request, so the per-user rate limit would reject most.
+    os.environ.setdefault("RATE_LIMIT_PER_SECOND", "0")
+
+    import httpx
+    from contextlib import nullcontext
+    from tortoise import Tortoise
+    from src.database import init
+    from src.database import query_counter
+    from src.server.app import app
+
+    if args.url:
+        await init()
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+        lifespan = nullcontext()
+        track = nullcontext
+    else:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load-test"
+        )
+        lifespan = app.router.lifespan_context(app)
+        track = query_counter.track_queries
+
+    async with lifespan, client:
+        query_counter.install()
+        tokens, task_ids = await prepare_users(
+            args.users, args.tasks_per_user, args.seed
+        )
+        plan = build_plan(
+            task_ids, args.scenario, args.warmup + args.requests, args.seed
+        )
+        print(
+            f"Scenario {args.scenario}: {args.requests:,} requests, "
+            f"concurrency {args.concurrency}, seed {args.seed}"
+        )
+        await drive(client, plan[: args.warmup], tokens, args.concurrency, track)
+        stats, seconds = await drive(
+            client, plan[args.warmup :], tokens, args.concurrency, track
+        )
+        if args.url:
+            await Tortoise.close_connections()
+
+    result = report(stats, seconds)
+    if args.output:
+        result["arguments"] = {k: str(v) for k, v in vars(args).items()}
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,188 @@
+"""Production server: uvicorn in several pre-forked worker processes.
+
+The parent process imports the application once, binds the listening socket
+and forks ``--workers`` children that share both, so workers start without
+re-importing FastAPI, Tortoise and the routes, and share those pages
+copy-on-write. Each worker runs uvicorn with uvloop and httptools and opens
+its own database connections in the app's lifespan.
+
+On SIGTERM or SIGINT every worker stops accepting connections, finishes its
+in-flight requests (for up to ``--graceful-timeout`` seconds), runs the
+lifespan shutdown (background jobs, buffered writes, Tortoise connections)
+and exits; workers still running ``--graceful-timeout`` seconds later are
+killed. Workers that die otherwise are restarted. Periodic background jobs
+only run in the first worker.
+
+Usage:
+  python -m src.cli.serve --workers 4
+  python -m src.cli.serve --host 127.0.0.1 --port 8080 --graceful-timeout 10
+"""
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Dict
+
+import dotenv
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+dotenv.load_dotenv()
+
+import uvicorn  # noqa: E402
+
+# Seconds to wait before restarting a worker that died, against crash loops.
+RESTART_DELAY = 1.0
+
+HANDLED_SIGNALS = {signal.SIGTERM, signal.SIGINT, signal.SIGALRM}
+
+
+class Supervisor:
+    """Forks the workers, restarts the ones that die and stops them all."""
+
+    def __init__(self, config: uvicorn.Config, workers: int, graceful_timeout: int):
+        self.config = config
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.children: Dict[int, int] = {}  # pid -> worker index
+        self.stopping = False
+
+    def run(self) -> None:
+        sock = self.config.bind_socket()
+        # Objects created by the imports are never collected; freezing them
+        # keeps the collector from touching (and so copying) their pages.
+        gc.freeze()
+        # Installed before forking, so a signal during startup stops the
+        # workers already started instead of orphaning them.
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        signal.signal(signal.SIGALRM, self.kill)
+        for index in range(self.workers):
+            if not self.stopping:
+                self.spawn(index, sock)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index = self.children.pop(pid, None)
+            if index is None or self.stopping:
+                continue
+            logging.warning(
+                f"Worker {index} [{pid}] exited with status "
+                f"{os.waitstatus_to_exitcode(status)}, restarting"
+            )
+            time.sleep(RESTART_DELAY)
+            if not self.stopping:
+                self.spawn(index, sock)
+        sock.close()
+
+    def spawn(self, index: int, sock) -> None:
+        # Held back across the fork: the parent records the child before its
+        # handlers can run, and the child never runs the parent's handlers.
+        signal.pthread_sigmask(signal.SIG_BLOCK, HANDLED_SIGNALS)
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, HANDLED_SIGNALS)
+            return
+        # Worker: uvicorn installs its own handlers while serving; outside
+        # of that, signals keep their default action.
+        for sig in HANDLED_SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, HANDLED_SIGNALS)
+        if index > 0:
+            os.environ["BACKGROUND_JOBS"] = "false"
+        code = 0
+        try:
+            uvicorn.Server(self.config).run(sockets=[sock])
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            logging.exception(f"Worker {index} failed")
+            code = 1
+        finally:
+            # Skip the parent's cleanup inherited through fork.
+            os._exit(code)
+
+    def stop(self, sig: int, _frame) -> None:
+        """Ask every worker to shut down gracefully, then wait for them."""
+        if self.stopping:
+            return
+        self.stopping = True
+        logging.info(f"Stopping {len(self.children)} workers")
+        for pid in self.children:
+            self.signal_child(pid, signal.SIGTERM)
+        signal.alarm(self.graceful_timeout + 5)
+
+    def kill(self, _sig: int, _frame) -> None:
+        """Kill the workers that outlived the graceful timeout."""
+        for pid in self.children:
+            logging.error(f"Worker [{pid}] did not stop in time, killing it")
+            self.signal_child(pid, signal.SIGKILL)
+
+    @staticmethod
+    def signal_child(pid: int, sig: int) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the API server in several worker processes"
+    )
+    parser.add_argument("--host", default=os.getenv("UVICORN_HOST", "0.0.0.0"))
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("UVICORN_PORT", "8080"))
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        help="Worker processes (default: WEB_CONCURRENCY or the CPU count)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="Seconds to let in-flight requests finish on shutdown",
+    )
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--loop", choices=["uvloop", "asyncio"], default="uvloop")
+    parser.add_argument("--http", choices=["httptools", "h11"], default="httptools")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args()
+
+    # Preload: import the app (and everything it imports) before forking.
+    from src.server.app import app
+
+    config = uvicorn.Config(
+        app,
+        host=args.host,
+        port=args.port,
+        loop=args.loop,
+        http=args.http,
+        backlog=args.backlog,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        log_level=args.log_level,
+        access_log=args.access_log,
+    )
+    logging.basicConfig(level=args.log_level.upper())
+    logging.info(
+        f"Serving on {args.host}:{args.port} with {args.workers} workers "
+        f"({args.loop}, {args.http})"
+    )
+    Supervisor(config, max(1, args.workers), args.graceful_timeout).run()
+
+
+if __name__ == "__main__":
+    main()
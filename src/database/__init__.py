@@ -1,5 +1,11 @@
+from datetime import time
 from tortoise import Tortoise
 import os
+import sqlite3
+
+# The ORM hands datetime.time values to SQLite as is, which it cannot bind;
+# store them as ISO text like dates and datetimes.
+sqlite3.register_adapter(time, time.isoformat)
 
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite://db.sqlite3")
@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "habit_completion_rollups" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "deleted_at" TIMESTAMP,
+    "period" VARCHAR(5) NOT NULL /* DAY: day\nWEEK: week\nMONTH: month */,
+    "period_start" DATE NOT NULL,
+    "completed_count" INT NOT NULL DEFAULT 0,
+    "completion_days" INT NOT NULL DEFAULT 0,
+    "habit_id" CHAR(36) NOT NULL REFERENCES "habits" ("id") ON DELETE CASCADE,
+    "user_id" CHAR(36) NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_habit_compl_habit_i_0efc7e" UNIQUE ("habit_id", "period", "period_start")
+) /* Pre-aggregated completion counters per habit and calendar period. */;
+CREATE INDEX IF NOT EXISTS "idx_habit_compl_habit_i_79777f" ON "habit_completion_rollups" ("habit_id");
+CREATE INDEX IF NOT EXISTS "idx_habit_compl_user_id_181070" ON "habit_completion_rollups" ("user_id");
+CREATE INDEX IF NOT EXISTS "idx_habit_compl_user_id_4dd99d" ON "habit_completion_rollups" ("user_id", "period", "period_start");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "habit_completion_rollups";"""
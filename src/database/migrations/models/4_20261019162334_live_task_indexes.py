@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_user_id_062b44";
+        CREATE INDEX IF NOT EXISTS "idx_tasks_live_user_status" ON "tasks" ("user_id", "status") WHERE deleted_at IS NULL;
+        CREATE INDEX IF NOT EXISTS "idx_tasks_live_user_due" ON "tasks" ("user_id", "due_date") WHERE deleted_at IS NULL;
+        CREATE INDEX IF NOT EXISTS "idx_tasks_live_user_created" ON "tasks" ("user_id", "created_at") WHERE deleted_at IS NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_live_user_created";
+        DROP INDEX IF EXISTS "idx_tasks_live_user_due";
+        DROP INDEX IF EXISTS "idx_tasks_live_user_status";
+        CREATE INDEX "idx_tasks_user_id_062b44" ON "tasks" ("user_id", "status");"""
@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_tasks_user_updated" ON "tasks" ("user_id", "updated_at");
+        CREATE INDEX IF NOT EXISTS "idx_categories_user_updated" ON "categories" ("user_id", "updated_at");
+        CREATE INDEX IF NOT EXISTS "idx_habits_user_updated" ON "habits" ("user_id", "updated_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_habits_user_updated";
+        DROP INDEX IF EXISTS "idx_categories_user_updated";
+        DROP INDEX IF EXISTS "idx_tasks_user_updated";"""
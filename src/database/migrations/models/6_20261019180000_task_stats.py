@@ -0,0 +1,32 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "task_stats" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "deleted_at" TIMESTAMP,
+    "pending" INT NOT NULL DEFAULT 0,
+    "in_progress" INT NOT NULL DEFAULT 0,
+    "completed" INT NOT NULL DEFAULT 0,
+    "cancelled" INT NOT NULL DEFAULT 0,
+    "user_id" CHAR(36) NOT NULL UNIQUE REFERENCES "users" ("id") ON DELETE CASCADE
+) /* Live task counts per status for one user. */;
+        CREATE TABLE IF NOT EXISTS "task_due_counts" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "deleted_at" TIMESTAMP,
+    "due_date" DATE NOT NULL,
+    "open_count" INT NOT NULL DEFAULT 0,
+    "user_id" CHAR(36) NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_task_due_co_user_id_b29c52" UNIQUE ("user_id", "due_date")
+) /* Number of open (pending or in progress) live tasks per user and due date. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "task_due_counts";
+        DROP TABLE IF EXISTS "task_stats";"""
@@ -0,0 +1,30 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "task_time_logs" ADD "user_id" CHAR(36) REFERENCES "users" ("id") ON DELETE CASCADE;
+        UPDATE "task_time_logs" SET "user_id" = (SELECT "user_id" FROM "tasks" WHERE "tasks"."id" = "task_time_logs"."task_id");
+        CREATE UNIQUE INDEX IF NOT EXISTS "idx_time_logs_running_task" ON "task_time_logs" ("task_id") WHERE end_time IS NULL AND deleted_at IS NULL;
+        CREATE INDEX IF NOT EXISTS "idx_time_logs_running_user" ON "task_time_logs" ("user_id") WHERE end_time IS NULL AND deleted_at IS NULL;
+        CREATE TABLE IF NOT EXISTS "task_time_rollups" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "deleted_at" TIMESTAMP,
+    "day" DATE NOT NULL,
+    "seconds" INT NOT NULL DEFAULT 0,
+    "category_id" CHAR(36) REFERENCES "categories" ("id") ON DELETE CASCADE,
+    "user_id" CHAR(36) NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+) /* Tracked seconds per user, local day and task category. */;
+        CREATE INDEX IF NOT EXISTS "idx_task_time_r_user_id_9056da" ON "task_time_rollups" ("user_id", "day");
+        CREATE UNIQUE INDEX IF NOT EXISTS "idx_time_rollups_day_category" ON "task_time_rollups" ("user_id", "day", "category_id") WHERE category_id IS NOT NULL;
+        CREATE UNIQUE INDEX IF NOT EXISTS "idx_time_rollups_day_uncategorized" ON "task_time_rollups" ("user_id", "day") WHERE category_id IS NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "task_time_rollups";
+        DROP INDEX IF EXISTS "idx_time_logs_running_user";
+        DROP INDEX IF EXISTS "idx_time_logs_running_task";
+        ALTER TABLE "task_time_logs" DROP COLUMN "user_id";"""
@@ -0,0 +1,18 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # Merge duplicate live completions of a habit and day into the first row
+    # before the unique index can be created. Rollups counted them as separate
+    # days; rebuild them with HabitRollupService.rebuild() afterwards.
+    return """
+        UPDATE "habit_completions" SET "completed_count" = (SELECT SUM(d."completed_count") FROM "habit_completions" d WHERE d."habit_id" = "habit_completions"."habit_id" AND d."completion_date" = "habit_completions"."completion_date" AND d."deleted_at" IS NULL) WHERE "deleted_at" IS NULL AND "id" = (SELECT MIN(k."id") FROM "habit_completions" k WHERE k."habit_id" = "habit_completions"."habit_id" AND k."completion_date" = "habit_completions"."completion_date" AND k."deleted_at" IS NULL);
+        UPDATE "habit_completions" SET "deleted_at" = CURRENT_TIMESTAMP WHERE "deleted_at" IS NULL AND "id" <> (SELECT MIN(k."id") FROM "habit_completions" k WHERE k."habit_id" = "habit_completions"."habit_id" AND k."completion_date" = "habit_completions"."completion_date" AND k."deleted_at" IS NULL);
+        DROP INDEX IF EXISTS "idx_habit_compl_habit_i_d0e90f";
+        CREATE UNIQUE INDEX IF NOT EXISTS "idx_habit_completions_live_day" ON "habit_completions" ("habit_id", "completion_date") WHERE deleted_at IS NULL;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_habit_completions_live_day";
+        CREATE INDEX IF NOT EXISTS "idx_habit_compl_habit_i_d0e90f" ON "habit_completions" ("habit_id", "completion_date");"""
@@ -1,7 +1,15 @@
-from .base import BaseModel  # noqa: F401
+from .base import BaseModel, LiveIndex  # noqa: F401
 from .enums import *  # noqa: F403
 from .user import User, UserDevice  # noqa: F401
-from .task import Task, TaskDependency, TaskTimeLog, TaskReminder  # noqa: F401
+from .task import (
+    Task,  # noqa: F401
+    TaskDependency,  # noqa: F401
+    TaskTimeLog,  # noqa: F401
+    TaskTimeRollup,  # noqa: F401
+    TaskReminder,  # noqa: F401
+    TaskStats,  # noqa: F401
+    TaskDueCount,  # noqa: F401
+)  # noqa: F401
 from .category import Category  # noqa: F401
 from .habit import (
     HabitTemplate,  # noqa: F401
@@ -9,6 +17,7 @@ from .habit import (
     Habit,  # noqa: F401
     HabitCompletion,  # noqa: F401
     HabitStreak,  # noqa: F401
+    HabitCompletionRollup,  # noqa: F401
 )  # noqa: F401
 from .notification import NotificationQueue  # noqa: F401
 from .calendar import RecurrencePattern  # noqa: F401
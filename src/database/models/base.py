@@ -1,6 +1,7 @@
 from datetime import datetime
 from tortoise.models import Model
 from tortoise import fields
+from tortoise.indexes import Index
 import uuid
 
 
@@ -20,3 +21,24 @@ class BaseModel(Model):
     async def restore(self):
         self.deleted_at = None
         await self.save()
+
+
+class PartialIndex(Index):
+    """Index that only covers the rows matching ``where``, optionally unique."""
+
+    def __init__(self, *fields: str, name: str, where: str, unique: bool = False):
+        super().__init__(fields=fields, name=name)
+        self.extra = f" WHERE {where}"
+        if unique:
+            self.INDEX_TYPE = "UNIQUE"
+
+
+class LiveIndex(PartialIndex):
+    """Partial index that only covers rows which are not soft-deleted.
+
+    Queries filtering on ``deleted_at IS NULL`` can use it, and deleted rows
+    no longer bloat it.
+    """
+
+    def __init__(self, *fields: str, name: str, unique: bool = False):
+        super().__init__(*fields, name=name, where="deleted_at IS NULL", unique=unique)
@@ -1,4 +1,5 @@
 from tortoise import fields
+from tortoise.indexes import Index
 from .base import BaseModel
 
 
@@ -11,4 +12,7 @@ class Category(BaseModel):
 
     class Meta:
         table = "categories"
-        indexes = [("user_id",)]
+        indexes = [
+            ("user_id",),
+            Index(fields=("user_id", "updated_at"), name="idx_categories_user_updated"),
+        ]
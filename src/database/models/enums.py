@@ -53,3 +53,9 @@ class NotificationStatus(str, Enum):
     PENDING = "pending"
     SENT = "sent"
     FAILED = "failed"
+
+
+class RollupPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
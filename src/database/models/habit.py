@@ -1,7 +1,8 @@
 from tortoise import fields
+from tortoise.indexes import Index
 from datetime import time
-from .base import BaseModel
-from .enums import Frequency, MessageType
+from .base import BaseModel, LiveIndex
+from .enums import Frequency, MessageType, RollupPeriod
 
 
 class HabitTemplate(BaseModel):
@@ -61,6 +62,7 @@ class Habit(BaseModel):
         table = "habits"
         indexes = [
             ("user_id", "is_active"),
+            Index(fields=("user_id", "updated_at"), name="idx_habits_user_updated"),
             ("template_id",),
         ]
 
@@ -76,7 +78,13 @@ class HabitCompletion(BaseModel):
     class Meta:
         table = "habit_completions"
         indexes = [
-            ("habit_id", "completion_date"),
+            # One live row per habit and day.
+            LiveIndex(
+                "habit_id",
+                "completion_date",
+                name="idx_habit_completions_live_day",
+                unique=True,
+            ),
             ("completion_date",),
         ]
 
@@ -96,3 +104,29 @@ class HabitStreak(BaseModel):
             ("habit_id", "is_current"),
             ("habit_id", "start_date"),
         ]
+
+
+class HabitCompletionRollup(BaseModel):
+    """Pre-aggregated completion counters per habit and calendar period.
+
+    Rows are maintained incrementally whenever a completion is recorded so
+    analytics never have to scan ``habit_completions``.
+    """
+
+    user = fields.ForeignKeyField(
+        "models.User", related_name="habit_rollups", db_index=True
+    )
+    habit = fields.ForeignKeyField(
+        "models.Habit", related_name="rollups", db_index=True
+    )
+    period = fields.CharEnumField(RollupPeriod)
+    period_start = fields.DateField()
+    completed_count = fields.IntField(default=0)
+    completion_days = fields.IntField(default=0)
+
+    class Meta:
+        table = "habit_completion_rollups"
+        unique_together = (("habit", "period", "period_start"),)
+        indexes = [
+            ("user_id", "period", "period_start"),
+        ]
@@ -1,5 +1,6 @@
 from tortoise import fields
-from .base import BaseModel
+from tortoise.indexes import Index
+from .base import BaseModel, LiveIndex, PartialIndex
 from .enums import TaskStatus, Priority, NotificationType
 
 
@@ -26,7 +27,10 @@ class Task(BaseModel):
     class Meta:
         table = "tasks"
         indexes = [
-            ("user_id", "status"),
+            LiveIndex("user_id", "status", name="idx_tasks_live_user_status"),
+            LiveIndex("user_id", "due_date", name="idx_tasks_live_user_due"),
+            LiveIndex("user_id", "created_at", name="idx_tasks_live_user_created"),
+            Index(fields=("user_id", "updated_at"), name="idx_tasks_user_updated"),
             ("due_date", "priority"),
             ("status", "due_date"),
             ("parent_task_id",),
@@ -50,10 +54,15 @@ class TaskDependency(BaseModel):
         ]
 
 
+# Rows of timers that are still running.
+RUNNING_TIMER = "end_time IS NULL AND deleted_at IS NULL"
+
+
 class TaskTimeLog(BaseModel):
     task = fields.ForeignKeyField(
         "models.Task", related_name="time_logs", db_index=True
     )
+    user = fields.ForeignKeyField("models.User", related_name="time_logs", null=True)
     start_time = fields.DatetimeField()
     end_time = fields.DatetimeField(null=True)
     duration_minutes = fields.IntField(null=True)
@@ -61,7 +70,57 @@ class TaskTimeLog(BaseModel):
 
     class Meta:
         table = "task_time_logs"
-        indexes = [("task_id", "start_time")]
+        indexes = [
+            ("task_id", "start_time"),
+            # At most one running timer per task, and a small index to list a
+            # user's running timers; stopped logs are left out of both.
+            PartialIndex(
+                "task_id",
+                name="idx_time_logs_running_task",
+                where=RUNNING_TIMER,
+                unique=True,
+            ),
+            PartialIndex(
+                "user_id", name="idx_time_logs_running_user", where=RUNNING_TIMER
+            ),
+        ]
+
+
+class TaskTimeRollup(BaseModel):
+    """Tracked seconds per user, local day and task category.
+
+    Added to whenever a timer stops, so time reports never sum raw logs.
+    """
+
+    user = fields.ForeignKeyField("models.User", related_name="time_rollups")
+    day = fields.DateField()
+    category = fields.ForeignKeyField(
+        "models.Category", null=True, related_name="time_rollups"
+    )
+    seconds = fields.IntField(default=0)
+
+    class Meta:
+        table = "task_time_rollups"
+        indexes = [
+            ("user_id", "day"),
+            # One row per user, day and category. NULLs never compare equal,
+            # so rows without a category need an index of their own.
+            PartialIndex(
+                "user_id",
+                "day",
+                "category_id",
+                name="idx_time_rollups_day_category",
+                where="category_id IS NOT NULL",
+                unique=True,
+            ),
+            PartialIndex(
+                "user_id",
+                "day",
+                name="idx_time_rollups_day_uncategorized",
+                where="category_id IS NULL",
+                unique=True,
+            ),
+        ]
 
 
 class TaskReminder(BaseModel):
@@ -75,3 +134,36 @@ class TaskReminder(BaseModel):
     class Meta:
         table = "task_reminders"
         indexes = [("task_id",)]
+
+
+class TaskStats(BaseModel):
+    """Live task counts per status for one user.
+
+    Maintained incrementally by the task service so dashboards read one row
+    instead of counting tasks; the reconciliation job repairs any drift.
+    """
+
+    user = fields.OneToOneField("models.User", related_name="task_stats")
+    pending = fields.IntField(default=0)
+    in_progress = fields.IntField(default=0)
+    completed = fields.IntField(default=0)
+    cancelled = fields.IntField(default=0)
+
+    class Meta:
+        table = "task_stats"
+
+
+class TaskDueCount(BaseModel):
+    """Number of open (pending or in progress) live tasks per user and due date.
+
+    Overdue and due-today counts are read from these rows, so they stay
+    correct as days pass without rewriting any counter.
+    """
+
+    user = fields.ForeignKeyField("models.User", related_name="task_due_counts")
+    due_date = fields.DateField()
+    open_count = fields.IntField(default=0)
+
+    class Meta:
+        table = "task_due_counts"
+        unique_together = (("user", "due_date"),)
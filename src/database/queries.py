@@ -0,0 +1,122 @@
+"""Helpers for the few queries the ORM cannot express (recursive CTEs etc.).
+
+Raw SQL is written once with ``?`` placeholders and adapted to the active
+backend: SQLite keeps ``?`` and stores UUIDs and datetimes as text, Postgres
+(asyncpg) uses numbered ``$n`` placeholders and native types.
+
+``keyset_chunks`` walks large result sets by primary key in bounded chunks;
+``cursor_chunks`` streams a raw query through a Postgres server-side cursor.
+"""
+
+from datetime import date, datetime
+from itertools import count
+from typing import Any, AsyncIterator, List, Sequence, Tuple
+from uuid import UUID
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.queryset import QuerySet
+
+
+def get_connection(name: str = "default") -> BaseDBAsyncClient:
+    return Tortoise.get_connection(name)
+
+
+def dialect(connection: BaseDBAsyncClient) -> str:
+    """Short backend name: ``sqlite``, ``postgres``, ``mysql``..."""
+    return connection.capabilities.dialect
+
+
+def prepare(
+    connection: BaseDBAsyncClient, sql: str, values: Sequence[Any] = ()
+) -> Tuple[str, List[Any]]:
+    """Adapt ``?`` placeholders and parameter types to the connection."""
+    if dialect(connection) == "postgres":
+        numbers = count(1)
+        parts = sql.split("?")
+        sql = parts[0] + "".join(f"${next(numbers)}{part}" for part in parts[1:])
+        return sql, list(values)
+    return sql, [_to_sqlite(v) for v in values]
+
+
+def _to_sqlite(value: Any) -> Any:
+    # Same text formats the ORM writes, so rows stay readable through models.
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+async def execute(
+    sql: str, values: Sequence[Any] = (), connection: BaseDBAsyncClient = None
+) -> int:
+    """Run a raw statement and return the number of affected rows."""
+    connection = connection or get_connection()
+    sql, values = prepare(connection, sql, values)
+    rows_affected, _ = await connection.execute_query(sql, values)
+    return rows_affected
+
+
+async def fetch_all(
+    sql: str, values: Sequence[Any] = (), connection: BaseDBAsyncClient = None
+) -> List[dict]:
+    """Run a raw query and return rows as dictionaries."""
+    connection = connection or get_connection()
+    sql, values = prepare(connection, sql, values)
+    return await connection.execute_query_dict(sql, values)
+
+
+async def explain(sql: str, connection: BaseDBAsyncClient = None) -> List[str]:
+    """Return the backend's query plan for a statement, one line per step."""
+    connection = connection or get_connection()
+    if dialect(connection) == "postgres":
+        rows = await connection.execute_query_dict(f"EXPLAIN {sql}")
+        return [row["QUERY PLAN"] for row in rows]
+    rows = await connection.execute_query_dict(f"EXPLAIN QUERY PLAN {sql}")
+    return [row["detail"] for row in rows]
+
+
+async def keyset_chunks(
+    query: QuerySet, fields: Sequence[str], chunk_size: int = 1000
+) -> AsyncIterator[List[dict]]:
+    """Yield the rows of ``query`` as ``.values(*fields)`` dicts in id order.
+
+    Each chunk is a separate ``id > last_id`` query on the primary key, so
+    memory stays bounded and no transaction is held open between chunks.
+    ``fields`` must include ``id``.
+    """
+    last_id = None
+    while True:
+        chunk = query if last_id is None else query.filter(id__gt=last_id)
+        rows = await chunk.order_by("id").limit(chunk_size).values(*fields)
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        last_id = rows[-1]["id"]
+
+
+async def cursor_chunks(
+    sql: str,
+    values: Sequence[Any] = (),
+    chunk_size: int = 1000,
+    connection: BaseDBAsyncClient = None,
+) -> AsyncIterator[List[dict]]:
+    """Stream a raw query through a server-side cursor (Postgres only).
+
+    The cursor lives in a read transaction on one pooled connection, and
+    rows are fetched ``chunk_size`` at a time.
+    """
+    connection = connection or get_connection()
+    sql, values = prepare(connection, sql, values)
+    async with connection.acquire_connection() as raw:
+        async with raw.transaction():
+            cursor = await raw.cursor(sql, *values)
+            while True:
+                records = await cursor.fetch(chunk_size)
+                if records:
+                    yield [dict(record) for record in records]
+                if len(records) < chunk_size:
+                    return
@@ -0,0 +1,101 @@
+"""Count and time the SQL statements executed through Tortoise.
+
+``install()`` wraps the execute methods of every loaded Tortoise client class
+once. Statements are recorded into the ``QueryLog`` of the current context
+(see ``track_queries``), so concurrent requests are counted separately.
+"""
+
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+
+EXECUTE_METHODS = (
+    "execute_insert",
+    "execute_many",
+    "execute_query",
+    "execute_query_dict",
+    "execute_script",
+)
+
+
+@dataclass
+class QueryLog:
+    """Statements executed while tracking was active, with their duration."""
+
+    statements: List[Tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def seconds(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def repeated(self, threshold: int = 2) -> Dict[str, int]:
+        """Statements executed at least ``threshold`` times (N+1 candidates).
+
+        Tortoise always binds values as parameters, so the same SQL text run
+        repeatedly means the same query with different arguments.
+        """
+        counts = Counter(statement for statement, _ in self.statements)
+        return {sql: count for sql, count in counts.items() if count >= threshold}
+
+
+_current_log: ContextVar[Optional[QueryLog]] = ContextVar("query_log", default=None)
+# Set while a statement is being recorded, so a wrapped method calling another
+# wrapped method (e.g. a subclass calling super()) is only counted once.
+_recording: ContextVar[bool] = ContextVar("query_log_recording", default=False)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryLog]:
+    """Record every statement run in the current context into a new log."""
+    log = QueryLog()
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+
+
+def _wrap(method):
+    @functools.wraps(method)
+    async def wrapper(self, query, *args, **kwargs):
+        log = _current_log.get()
+        if log is None or _recording.get():
+            return await method(self, query, *args, **kwargs)
+        token = _recording.set(True)
+        started = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            log.statements.append((query, time.perf_counter() - started))
+            _recording.reset(token)
+
+    wrapper.__query_counter__ = True
+    return wrapper
+
+
+def _client_classes(cls=BaseDBAsyncClient):
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _client_classes(subclass)
+
+
+def install() -> None:
+    """Instrument all client classes loaded so far; safe to call repeatedly.
+
+    Call it after ``Tortoise.init`` so the configured backend is imported.
+    """
+    for cls in _client_classes():
+        for name in EXECUTE_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__query_counter__", False):
+                setattr(cls, name, _wrap(method))
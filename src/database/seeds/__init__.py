@@ -4,6 +4,7 @@ from .user_seeds import seed_users
 from .category_seeds import seed_categories
 from .task_seeds import seed_tasks
 from .seed_runner import run_all_seeds, clear_all_data
+from .synthetic_seeds import seed_synthetic
 
 __all__ = [
     "seed_users",
@@ -11,4 +12,5 @@ __all__ = [
     "seed_tasks",
     "run_all_seeds",
     "clear_all_data",
+    "seed_synthetic",
 ]
@@ -5,12 +5,18 @@ import asyncio
 import argparse
 import sys
 from pathlib import Path
+from tortoise import Tortoise
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.database.seeds.seed_runner import run_all_seeds, clear_all_data, seed_minimal
+from src.database.seeds.synthetic_seeds import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    SyntheticProfile,
+    seed_synthetic,
+)
 
 
 async def main():
@@ -24,6 +30,7 @@ Examples:
   python -m src.database.seeds.cli seed --minimal
   python -m src.database.seeds.cli clear
   python -m src.database.seeds.cli seed --clear-first
+  python -m src.database.seeds.cli seed --synthetic --users 1000000 --workers 8
         """,
     )
 
@@ -38,10 +45,42 @@ Examples:
     seed_group.add_argument(
         "--minimal", action="store_true", help="Seed minimal test dataset"
     )
+    seed_group.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Generate a large deterministic dataset for load testing",
+    )
     seed_parser.add_argument(
         "--clear-first", action="store_true", help="Clear existing data before seeding"
     )
 
+    # Synthetic seeding options
+    synthetic_group = seed_parser.add_argument_group("synthetic seeding")
+    synthetic_group.add_argument(
+        "--users", type=int, default=10_000, help="Number of users to generate"
+    )
+    synthetic_group.add_argument(
+        "--tasks-per-user",
+        type=int,
+        default=SyntheticProfile.tasks_per_user,
+        help="Average number of tasks per user",
+    )
+    synthetic_group.add_argument(
+        "--seed", type=int, default=42, help="Random seed (same seed, same data)"
+    )
+    synthetic_group.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel insert processes (Postgres only)",
+    )
+    synthetic_group.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Rows per bulk insert",
+    )
+
     # Clear command
     clear_parser = subparsers.add_parser(
         "clear", help="Clear all seed data from database"
@@ -60,6 +99,8 @@ Examples:
         if args.command == "seed":
             if args.minimal:
                 results = await seed_minimal()
+            elif args.synthetic:
+                results = await seed_synthetic_data(args)
             else:
                 # Default to full seeding
                 results = await run_all_seeds(clear_existing=args.clear_first)
@@ -79,6 +120,29 @@ Examples:
     except Exception as e:
         print(f"\n❌ Error during {args.command} operation: {e}")
         sys.exit(1)
+    finally:
+        await Tortoise.close_connections()
+
+
+async def seed_synthetic_data(args) -> dict:
+    """Run the synthetic seeder with the CLI options."""
+    from src.database import init
+
+    await init()
+    if args.clear_first:
+        await clear_all_data()
+
+    results = await seed_synthetic(
+        args.users,
+        seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        profile=SyntheticProfile(tasks_per_user=args.tasks_per_user),
+    )
+    print("\n🎉 Synthetic seeding completed!")
+    for kind, count in results.items():
+        print(f"   {kind}: {count:,}")
+    return results
 
 
 async def show_status():
@@ -97,8 +161,7 @@ async def show_status():
     task_count = await Task.all().count()
 
     # Count subtasks by checking for non-null parent_task_id
-    all_tasks = await Task.all()
-    subtask_count = sum(1 for task in all_tasks if task.parent_task_id is not None)
+    subtask_count = await Task.filter(parent_task_id__isnull=False).count()
 
     print(f"👥 Users: {user_count}")
     print(f"📁 Categories: {category_count}")
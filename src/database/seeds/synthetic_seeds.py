@@ -0,0 +1,378 @@
+"""Synthetic seed data generator for load testing at production scale.
+
+Every user's rows are generated from a random generator seeded with
+``(seed, user index)``, so the same seed always produces the same ids and
+content however the users are split into chunks or worker processes. Dates
+are relative to the day of the run.
+"""
+
+import asyncio
+import multiprocessing
+import random
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+from tortoise import Tortoise
+from src.database import TORTOISE_ORM
+from src.database.models import (
+    Category,
+    Habit,
+    HabitCompletion,
+    NotificationQueue,
+    Task,
+    User,
+)
+from src.database.models.enums import (
+    Frequency,
+    NotificationStatus,
+    NotificationType,
+    Priority,
+    TaskStatus,
+)
+from src.database.queries import dialect, get_connection
+from .category_seeds import CATEGORY_SEED_DATA
+from .task_seeds import SUBTASK_DATA, TASK_SEED_DATA
+from .user_seeds import USER_SEED_DATA
+
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Buffers are flushed in this order so foreign keys always resolve.
+ROW_KINDS = (
+    ("users", User),
+    ("categories", Category),
+    ("tasks", Task),
+    ("subtasks", Task),
+    ("habits", Habit),
+    ("habit_completions", HabitCompletion),
+    ("notifications", NotificationQueue),
+)
+
+TIMEZONES = sorted({user["timezone"] for user in USER_SEED_DATA} | {"UTC"})
+SUBTASK_TEMPLATES = [subtask for group in SUBTASK_DATA for subtask in group["subtasks"]]
+HABIT_NAMES = [
+    "Drink water",
+    "Read 20 pages",
+    "Morning run",
+    "Meditate",
+    "Journal",
+    "Stretch",
+    "Practice guitar",
+    "Learn a language",
+]
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+STATUS_WEIGHTS = {
+    TaskStatus.PENDING: 45,
+    TaskStatus.IN_PROGRESS: 20,
+    TaskStatus.COMPLETED: 30,
+    TaskStatus.CANCELLED: 5,
+}
+
+RowBatch = Dict[str, list]
+
+
+@dataclass
+class SyntheticProfile:
+    """Average amount of data generated for each user."""
+
+    tasks_per_user: int = 40
+    subtask_share: float = 0.2
+    habits_per_user: int = 3
+    habit_history_days: int = 60
+    notification_share: float = 0.3
+    deleted_share: float = 0.05
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _task_fields(rng: random.Random, today: date) -> dict:
+    status = rng.choices(list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values()))[0]
+    completion = {
+        TaskStatus.PENDING: 0,
+        TaskStatus.IN_PROGRESS: rng.randrange(10, 100, 10),
+        TaskStatus.COMPLETED: 100,
+        TaskStatus.CANCELLED: rng.randrange(0, 100, 10),
+    }[status]
+    due_date = (
+        today + timedelta(days=rng.randint(-60, 90)) if rng.random() < 0.8 else None
+    )
+    return {
+        "status": status,
+        "priority": rng.choice(list(Priority)),
+        "completion_percentage": completion,
+        "due_date": due_date,
+        "completed_at": (
+            datetime.combine(due_date or today, time(17)) - timedelta(days=1)
+            if status == TaskStatus.COMPLETED
+            else None
+        ),
+    }
+
+
+def generate_user_rows(
+    index: int, seed: int, profile: SyntheticProfile, today: date
+) -> RowBatch:
+    """Generate one user and everything they own."""
+    rng = random.Random(f"{seed}:{index}")
+    now = datetime.combine(today, time(12))
+    rows: RowBatch = {kind: [] for kind, _ in ROW_KINDS}
+
+    user = User(
+        id=_uuid(rng),
+        clerk_id=f"user_synthetic_{seed}_{index}",
+        email=f"synthetic_{seed}_{index}@example.com",
+        username=f"user{index}",
+        timezone=rng.choice(TIMEZONES),
+        default_reminder_minutes=rng.choice([5, 10, 15, 30, 60]),
+        preferred_notification_type=rng.choice(list(NotificationType)),
+    )
+    rows["users"].append(user)
+
+    category_ids = []
+    for data in rng.sample(CATEGORY_SEED_DATA, rng.randint(3, 6)):
+        category = Category(id=_uuid(rng), user_id=user.id, **data)
+        category_ids.append(category.id)
+        rows["categories"].append(category)
+
+    task_count = rng.randint(
+        profile.tasks_per_user // 2, profile.tasks_per_user * 3 // 2
+    )
+    for _ in range(task_count):
+        template = rng.choice(TASK_SEED_DATA)
+        deleted_at = now if rng.random() < profile.deleted_share else None
+        task = Task(
+            id=_uuid(rng),
+            user_id=user.id,
+            title=template["title"],
+            description=template["description"],
+            estimated_duration=template.get("estimated_duration"),
+            category_id=rng.choice(category_ids + [None]),
+            deleted_at=deleted_at,
+            **_task_fields(rng, today),
+        )
+        rows["tasks"].append(task)
+
+        if rng.random() < profile.subtask_share:
+            for subtask_template in rng.sample(SUBTASK_TEMPLATES, rng.randint(1, 3)):
+                rows["subtasks"].append(
+                    Task(
+                        id=_uuid(rng),
+                        user_id=user.id,
+                        parent_task_id=task.id,
+                        category_id=task.category_id,
+                        title=subtask_template["title"],
+                        description=subtask_template["description"],
+                        deleted_at=deleted_at,
+                        **_task_fields(rng, today),
+                    )
+                )
+
+        if (
+            task.due_date
+            and not deleted_at
+            and rng.random() < profile.notification_share
+        ):
+            scheduled = datetime.combine(task.due_date, time(9)) - timedelta(
+                minutes=user.default_reminder_minutes
+            )
+            sent = scheduled < now
+            rows["notifications"].append(
+                NotificationQueue(
+                    id=_uuid(rng),
+                    user_id=user.id,
+                    task_id=task.id,
+                    scheduled_time=scheduled,
+                    notification_type=user.preferred_notification_type,
+                    status=NotificationStatus.SENT
+                    if sent
+                    else NotificationStatus.PENDING,
+                    sent_at=scheduled if sent else None,
+                )
+            )
+
+    for name in rng.sample(
+        HABIT_NAMES, min(len(HABIT_NAMES), rng.randint(0, profile.habits_per_user * 2))
+    ):
+        weekly = rng.random() < 0.3
+        target_days = sorted(rng.sample(range(7), 3)) if weekly else None
+        habit = Habit(
+            id=_uuid(rng),
+            user_id=user.id,
+            name=name,
+            frequency=Frequency.WEEKLY if weekly else Frequency.DAILY,
+            target_days=[WEEKDAYS[day] for day in target_days] if weekly else None,
+        )
+        rows["habits"].append(habit)
+
+        adherence = rng.uniform(0.3, 0.95)
+        for offset in range(profile.habit_history_days):
+            day = today - timedelta(days=offset)
+            if target_days and day.weekday() not in target_days:
+                continue
+            if rng.random() < adherence:
+                rows["habit_completions"].append(
+                    HabitCompletion(
+                        id=_uuid(rng),
+                        habit_id=habit.id,
+                        completion_date=day,
+                        completed_count=1,
+                    )
+                )
+
+    return rows
+
+
+class ChunkWriter:
+    """Buffers generated rows and writes them with chunked ``bulk_create``."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.buffers: RowBatch = {kind: [] for kind, _ in ROW_KINDS}
+        self.counts: Counter = Counter()
+
+    async def add(self, rows: RowBatch) -> None:
+        for kind, batch in rows.items():
+            self.buffers[kind].extend(batch)
+        if max(len(batch) for batch in self.buffers.values()) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        for kind, model in ROW_KINDS:
+            batch = self.buffers[kind]
+            if batch:
+                await model.bulk_create(batch, batch_size=self.chunk_size)
+                self.counts[kind] += len(batch)
+                self.buffers[kind] = []
+
+
+async def seed_synthetic_range(
+    start: int,
+    stop: int,
+    seed: int,
+    profile: SyntheticProfile,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    today: Optional[date] = None,
+    progress: bool = False,
+) -> Counter:
+    """Generate and insert users ``start`` to ``stop - 1``."""
+    today = today or date.today()
+    writer = ChunkWriter(chunk_size)
+    for index in range(start, stop):
+        await writer.add(generate_user_rows(index, seed, profile, today))
+        if progress and (index + 1) % 1000 == 0:
+            print(
+                f"\r  📊 {index + 1 - start:,}/{stop - start:,} users",
+                end="",
+                flush=True,
+            )
+    await writer.flush()
+    if progress:
+        print()
+    return writer.counts
+
+
+def _seed_shard(
+    db_url: str,
+    shard: Tuple[int, int],
+    seed: int,
+    profile: SyntheticProfile,
+    chunk_size: int,
+    today: date,
+) -> Counter:
+    """Worker process entry point with its own database connection."""
+
+    async def run():
+        config = {**TORTOISE_ORM, "connections": {"default": db_url}}
+        await Tortoise.init(config=config)
+        try:
+            return await seed_synthetic_range(*shard, seed, profile, chunk_size, today)
+        finally:
+            await Tortoise.close_connections()
+
+    return asyncio.run(run())
+
+
+async def seed_synthetic(
+    users: int,
+    seed: int = 42,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    profile: Optional[SyntheticProfile] = None,
+) -> dict:
+    """Seed ``users`` synthetic users with categories, tasks, subtasks, habits,
+    completions and notifications, then rebuild the habit rollups and task
+    stats counters.
+
+    Args:
+        users: Number of users to generate.
+        seed: Seed for the random generators; the same seed gives the same data.
+        workers: Number of processes inserting in parallel (Postgres only,
+            SQLite allows a single writer).
+        chunk_size: Rows per ``bulk_create`` batch.
+        profile: Average amount of data per user.
+
+    Returns:
+        Dictionary with counts of created records.
+    """
+    from src.server.services.habit_service import HabitRollupService
+    from src.server.services.task_stats_service import TaskStatsService
+
+    profile = profile or SyntheticProfile()
+    today = date.today()
+    if workers > 1 and dialect(get_connection()) == "sqlite":
+        print("⚠️  SQLite allows a single writer, seeding in one process")
+        workers = 1
+
+    print(
+        f"🏭 Generating {users:,} synthetic users (seed {seed}, {workers} workers)..."
+    )
+    if workers == 1:
+        counts = await seed_synthetic_range(
+            0, users, seed, profile, chunk_size, today, progress=True
+        )
+    else:
+        step = -(-users // workers)
+        shards = [(start, min(users, start + step)) for start in range(0, users, step)]
+        db_url = TORTOISE_ORM["connections"]["default"]
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            results: List[Counter] = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool,
+                        _seed_shard,
+                        db_url,
+                        shard,
+                        seed,
+                        profile,
+                        chunk_size,
+                        today,
+                    )
+                    for shard in shards
+                )
+            )
+        counts = sum(results, Counter())
+
+    # Only the seeded users' data changed; other rows keep their aggregates.
+    prefix = f"user_synthetic_{seed}_"
+    print("📈 Rebuilding habit rollups...")
+    counts["habit_rollups"] = await HabitRollupService.rebuild(
+        await Habit.filter(user__clerk_id__startswith=prefix).values_list(
+            "id", flat=True
+        )
+    )
+    print("📈 Rebuilding task stats...")
+    await TaskStatsService.rebuild(
+        await User.filter(clerk_id__startswith=prefix).values_list("id", flat=True)
+    )
+
+    results = {kind: counts[kind] for kind, _ in ROW_KINDS}
+    results["habit_rollups"] = counts["habit_rollups"]
+    results["total"] = sum(results.values())
+    return results
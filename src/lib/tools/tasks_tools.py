@@ -17,16 +17,9 @@ def create_client():
 
 @tool
 async def get_today_tasks():
-    """Get today's tasks."""
+    """Get today's tasks, plus overdue and upcoming ones, in the user's timezone."""
     client = create_client()
-    due_date_from = date.today().isoformat()
-    response = await client.get(
-        "/tasks/",
-        params={
-            "due_date_from": due_date_from,
-            "due_date_to": due_date_from,
-        },
-    )
+    response = await client.get("/agenda/")
     return response.json()
 
 
@@ -1,9 +1,23 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from src.server.routes.routes_user import user_route
 from src.server.routes.routes_tasks import tasks_route
+from src.server.routes.routes_habits import habits_route
+from src.server.routes.routes_sync import sync_route
+from src.server.routes.routes_agenda import agenda_route
+from src.server.routes.routes_categories import categories_route
+from src.server.routes.routes_habit_templates import habit_templates_route
+from src.server.routes.routes_time_tracking import time_tracking_route
+from src.server.routes.routes_devices import devices_route
 from src.database import init as init_db
+from src.database import query_counter
+from src.server.services.habit_message_service import HabitMessageSelector
+from src.server.services.habit_template_service import HabitTemplateCatalog
+from src.server.services.push_service import PushGateway
+from src.server.middleware.rate_limit import RateLimitStore, rate_limit
+from src.server.middleware.query_stats import QueryStatsMiddleware, query_stats_enabled
+from src.worker.scheduler import configured_jobs
 from tortoise import Tortoise
 import logging
 
@@ -13,17 +27,36 @@ async def lifespan(_app: FastAPI):
     """Handle application startup and shutdown."""
     # Startup
     await init_db()
+    if query_stats_enabled():
+        query_counter.install()
+    await HabitTemplateCatalog.refresh()
+    jobs = configured_jobs()
+    for job in jobs:
+        job.start()
     yield
     # Shutdown
+    for job in jobs:
+        await job.stop()
+    await HabitMessageSelector.flush()
+    await PushGateway.close()
+    await RateLimitStore.close()
     await Tortoise.close_connections()
 
 
 app = FastAPI(lifespan=lifespan)
 
 
-# Include user routes
-app.include_router(user_route)
-app.include_router(tasks_route)
+# Include user routes, rate limited per user and route
+rate_limited = [Depends(rate_limit)]
+app.include_router(user_route, dependencies=rate_limited)
+app.include_router(tasks_route, dependencies=rate_limited)
+app.include_router(habits_route, dependencies=rate_limited)
+app.include_router(sync_route, dependencies=rate_limited)
+app.include_router(agenda_route, dependencies=rate_limited)
+app.include_router(categories_route, dependencies=rate_limited)
+app.include_router(habit_templates_route, dependencies=rate_limited)
+app.include_router(time_tracking_route, dependencies=rate_limited)
+app.include_router(devices_route, dependencies=rate_limited)
 
 
 @app.get("/health")
@@ -39,3 +72,5 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
 
 app.add_middleware(LoggingMiddleware)
+if query_stats_enabled():
+    app.add_middleware(QueryStatsMiddleware)
@@ -0,0 +1,45 @@
+import logging
+import os
+from typing import Callable, List
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from src.database.query_counter import QueryLog, track_queries
+
+
+# Identical statements run this many times in one request are reported as N+1.
+REPEATED_QUERY_THRESHOLD = int(os.getenv("QUERY_STATS_REPEAT_THRESHOLD", "3"))
+
+
+def query_stats_enabled() -> bool:
+    return (
+        os.getenv("QUERY_STATS", "").lower() == "true"
+        or os.getenv("DEBUG", "").lower() == "true"
+    )
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Count the DB statements of each request.
+
+    The count and total DB time are returned in the ``X-DB-Queries`` and
+    ``X-DB-Time-Ms`` headers, and statements repeated with different
+    parameters (the N+1 pattern) are logged as warnings. Listeners receive
+    ``(request, log)`` for every request, e.g. to enforce query budgets in
+    tests.
+    """
+
+    listeners: List[Callable[[Request, QueryLog], None]] = []
+
+    async def dispatch(self, request: Request, call_next):
+        with track_queries() as log:
+            response = await call_next(request)
+
+        response.headers["X-DB-Queries"] = str(log.count)
+        response.headers["X-DB-Time-Ms"] = f"{log.seconds * 1000:.2f}"
+        for statement, count in log.repeated(REPEATED_QUERY_THRESHOLD).items():
+            logging.warning(
+                f"Possible N+1 in {request.method} {request.url.path}: "
+                f"statement ran {count} times: {statement}"
+            )
+        for listener in self.listeners:
+            listener(request, log)
+        return response
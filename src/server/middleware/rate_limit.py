@@ -0,0 +1,217 @@
+"""Per-user, per-route request rate limiting with token buckets.
+
+Every (user, method, route) pair has a bucket of ``burst`` tokens refilled at
+``rate`` tokens per second; a request takes one token or is rejected with
+429 and a ``Retry-After`` header. The limiter runs as a router dependency,
+ahead of ``get_current_user``: it only verifies the JWT signature to read the
+user id, so a rejected request never touches the database.
+
+Buckets live in process memory. Deployments running several workers can set
+``RATE_LIMIT_REDIS_URL`` to share them through Redis (the optional ``redis``
+package); if Redis is unreachable, the process falls back to its local
+buckets instead of failing requests.
+"""
+
+import logging
+import math
+import os
+import time
+from typing import Callable, Dict, Optional, Protocol, Tuple
+from fastapi import Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.server.utils.jwt import decode_access_token
+from src.server.utils.responses import RateLimitExceededError
+
+# Missing credentials are left to ``get_current_user`` to reject.
+optional_security = HTTPBearer(auto_error=False)
+
+
+class RateLimitBackend(Protocol):
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        """Take a token from ``key``'s bucket.
+
+        Returns:
+            0 if a token was taken, otherwise the seconds until one is available.
+        """
+
+    async def close(self) -> None: ...
+
+
+class MemoryBackend:
+    """Token buckets in a dict, for one process.
+
+    Each bucket is ``(tokens, updated_at, full_at)``. When there are more than
+    ``MAX_BUCKETS``, buckets that have refilled completely are dropped, since
+    a missing bucket starts full anyway.
+    """
+
+    MAX_BUCKETS = 100_000
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        return self.take_now(key, rate, burst)
+
+    def take_now(self, key: str, rate: float, burst: int) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(burst)
+        else:
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        if bucket is None and len(self._buckets) >= self.MAX_BUCKETS:
+            self._prune(now)
+        self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+        return wait
+
+    def _prune(self, now: float) -> None:
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items() if bucket[2] > now
+        }
+        if len(self._buckets) >= self.MAX_BUCKETS:
+            logging.warning("Rate limit buckets full, resetting them")
+            self._buckets = {}
+
+    async def close(self) -> None:
+        self._buckets = {}
+
+
+# Refill and take atomically on the Redis server, using its clock so that
+# workers on different hosts agree. Returns the wait as a string because Lua
+# numbers are truncated to integers in replies.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = burst
+if bucket[1] then
+    tokens = math.min(burst, tonumber(bucket[1]) + (now - tonumber(bucket[2])) * rate)
+end
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBackend:
+    """Token buckets shared by all workers through Redis.
+
+    ``client`` is a ``redis.asyncio`` client. Errors are logged (once per
+    outage) and the request is counted in ``fallback``, the local buckets.
+    """
+
+    KEY_PREFIX = "ratelimit:"
+
+    def __init__(self, client, fallback: Optional[MemoryBackend] = None):
+        self.client = client
+        self.fallback = fallback or MemoryBackend()
+        self._script = client.register_script(TAKE_SCRIPT)
+        self._failing = False
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "RATE_LIMIT_REDIS_URL is set but the redis package is not installed"
+            ) from e
+        return cls(redis.from_url(url))
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        try:
+            wait = float(
+                await self._script(keys=[self.KEY_PREFIX + key], args=[rate, burst])
+            )
+        except Exception as e:
+            if not self._failing:
+                logging.warning(f"Rate limit backend unavailable, using local: {e}")
+                self._failing = True
+            return self.fallback.take_now(key, rate, burst)
+        self._failing = False
+        return wait
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+class RateLimitStore:
+    """The process-wide bucket backend, chosen from ``RATE_LIMIT_REDIS_URL``."""
+
+    _backend: Optional[RateLimitBackend] = None
+
+    @classmethod
+    def configure(cls, backend: Optional[RateLimitBackend] = None) -> RateLimitBackend:
+        if backend is None:
+            url = os.getenv("RATE_LIMIT_REDIS_URL")
+            backend = RedisBackend.from_url(url) if url else MemoryBackend()
+        cls._backend = backend
+        return backend
+
+    @classmethod
+    def backend(cls) -> RateLimitBackend:
+        return cls._backend or cls.configure()
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._backend is not None:
+            await cls._backend.close()
+            cls._backend = None
+
+
+class RateLimiter:
+    """Dependency enforcing ``rate`` requests per second per user and route,
+    with bursts of up to ``burst`` requests.
+
+    Defaults come from ``RATE_LIMIT_PER_SECOND`` (10) and ``RATE_LIMIT_BURST``
+    (60); a rate of 0 disables the limiter.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        self.rate = (
+            rate
+            if rate is not None
+            else float(os.getenv("RATE_LIMIT_PER_SECOND", "10"))
+        )
+        self.burst = (
+            burst if burst is not None else int(os.getenv("RATE_LIMIT_BURST", "60"))
+        )
+
+    async def __call__(
+        self,
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(
+            optional_security
+        ),
+    ) -> None:
+        if self.rate <= 0 or credentials is None:
+            return
+        try:
+            user_id = decode_access_token(credentials.credentials).user_id
+        except Exception:
+            return  # Rejected with 401 by get_current_user
+        route = request.scope.get("route")
+        path = route.path if route is not None else request.url.path
+        wait = await RateLimitStore.backend().take(
+            f"{user_id}:{request.method}:{path}", self.rate, self.burst
+        )
+        if wait > 0:
+            raise RateLimitExceededError(math.ceil(wait))
+
+
+rate_limit = RateLimiter()
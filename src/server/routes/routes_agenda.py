@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, status
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.task_schemas import AgendaResponse
+from src.server.services.agenda_service import AgendaService
+
+agenda_route = APIRouter(prefix="/agenda", tags=["agenda"])
+
+
+@agenda_route.get("/", response_model=AgendaResponse, status_code=status.HTTP_200_OK)
+async def get_agenda(current_user: User = Depends(get_current_user)):
+    """
+    Open tasks that are overdue, due today or due in the next 6 days.
+
+    Days follow the user's timezone. The agenda is cached until the user's
+    next task write or local midnight.
+
+    **Returns:**
+    - `overdue`, `today` and `upcoming` task lists, ordered by due date and
+      then priority (highest first)
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await AgendaService.get_agenda(current_user)
@@ -0,0 +1,119 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, status
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.category_schemas import (
+    CategoryCreate,
+    CategoryDeleteResponse,
+    CategoryResponse,
+    CategoryUpdate,
+)
+from src.server.services.category_service import CategoryService
+
+categories_route = APIRouter(prefix="/categories", tags=["categories"])
+
+
+@categories_route.get(
+    "/", response_model=List[CategoryResponse], status_code=status.HTTP_200_OK
+)
+async def get_categories(current_user: User = Depends(get_current_user)):
+    """
+    List the authenticated user's categories, ordered by name.
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await CategoryService.list_categories(current_user)
+
+
+@categories_route.post(
+    "/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_category(
+    category_data: CategoryCreate, current_user: User = Depends(get_current_user)
+):
+    """
+    Create a new category.
+
+    **Request Body:**
+    - **name**: Category name (required, 1-100 characters)
+    - **color**: Hex color such as `#FF6B6B` (default: `#666666`)
+
+    **Errors:**
+    - 422: Validation error
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await CategoryService.create_category(current_user, category_data)
+
+
+@categories_route.get(
+    "/{category_id}", response_model=CategoryResponse, status_code=status.HTTP_200_OK
+)
+async def get_category(
+    category_id: UUID, current_user: User = Depends(get_current_user)
+):
+    """
+    Retrieve a specific category by ID.
+
+    **Path Parameters:**
+    - **category_id**: UUID of the category
+
+    **Errors:**
+    - 404: Category not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await CategoryService.get_category(current_user, category_id)
+
+
+@categories_route.patch(
+    "/{category_id}", response_model=CategoryResponse, status_code=status.HTTP_200_OK
+)
+async def update_category(
+    category_id: UUID,
+    category_data: CategoryUpdate,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Rename or recolor a category.
+
+    **Path Parameters:**
+    - **category_id**: UUID of the category
+
+    **Errors:**
+    - 404: Category not found or doesn't belong to user
+    - 422: Validation error or no fields provided
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await CategoryService.update_category(
+        current_user, category_id, category_data
+    )
+
+
+@categories_route.delete(
+    "/{category_id}",
+    response_model=CategoryDeleteResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def delete_category(
+    category_id: UUID, current_user: User = Depends(get_current_user)
+):
+    """
+    Delete a category (soft delete).
+
+    **Path Parameters:**
+    - **category_id**: UUID of the category
+
+    **Errors:**
+    - 404: Category not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+
+    **Note:**
+    - Tasks in the category are kept and left without a category
+    """
+    moved = await CategoryService.delete_category(current_user, category_id)
+    return CategoryDeleteResponse(
+        message="Category deleted successfully",
+        deleted_category_id=category_id,
+        uncategorized_tasks=moved,
+    )
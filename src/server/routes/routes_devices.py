@@ -0,0 +1,64 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, status
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.device_schemas import DeviceRegister, DeviceResponse
+from src.server.services.device_service import DeviceService
+
+devices_route = APIRouter(prefix="/devices", tags=["devices"])
+
+
+@devices_route.post(
+    "/", response_model=DeviceResponse, status_code=status.HTTP_201_CREATED
+)
+async def register_device(
+    device_data: DeviceRegister, current_user: User = Depends(get_current_user)
+):
+    """
+    Register a device for push notifications.
+
+    Registering a token or endpoint again reactivates the existing device
+    instead of creating a duplicate.
+
+    **Request Body:**
+    - **device_type**: ios, android, web or desktop
+    - **push_token**: APNs / FCM token (required for ios and android)
+    - **endpoint_url**: Web Push endpoint (required for web and desktop)
+
+    **Errors:**
+    - 422: Validation error
+    - 401: Unauthorized (invalid or missing token)
+    """
+    device = await DeviceService.register_device(current_user, device_data)
+    return DeviceResponse.model_validate(device)
+
+
+@devices_route.get(
+    "/", response_model=List[DeviceResponse], status_code=status.HTTP_200_OK
+)
+async def get_devices(current_user: User = Depends(get_current_user)):
+    """
+    List the authenticated user's active devices.
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await DeviceService.list_devices(current_user)
+
+
+@devices_route.delete("/{device_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_device(
+    device_id: UUID, current_user: User = Depends(get_current_user)
+):
+    """
+    Unregister a device; it no longer receives notifications.
+
+    **Path Parameters:**
+    - **device_id**: UUID of the device
+
+    **Errors:**
+    - 404: Device not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+    """
+    await DeviceService.remove_device(current_user, device_id)
@@ -0,0 +1,45 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.habit_schemas import HabitTemplateCatalogResponse
+from src.server.services.habit_template_service import HabitTemplateCatalog
+from src.server.utils.etag import not_modified
+
+habit_templates_route = APIRouter(prefix="/habit-templates", tags=["habits"])
+
+
+@habit_templates_route.get(
+    "/",
+    response_model=HabitTemplateCatalogResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_habit_templates(
+    request: Request,
+    category: Optional[str] = Query(None, description="Only this category"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Browse the catalog of active habit templates, grouped by category.
+
+    Served from an in-memory snapshot as pre-serialized JSON; the database is
+    not queried.
+
+    **Query Parameters:**
+    - **category**: Only return templates of this category
+
+    **Returns:**
+    - Categories in alphabetical order, each with its templates ordered by
+      sort_order and name, including their active messages
+    - An ETag header; send it back in If-None-Match to get a 304 while the
+      catalog is unchanged
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    snapshot = await HabitTemplateCatalog.get()
+    body, etag = snapshot.response(category)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -0,0 +1,116 @@
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from typing import Optional
+from datetime import date, timedelta
+from uuid import UUID
+
+from src.database.models import User
+from src.database.models.enums import RollupPeriod
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.habit_schemas import (
+    HabitAnalyticsResponse,
+    HabitCompletionCreate,
+    HabitCompletionResponse,
+)
+from src.server.services.habit_service import HabitService, HabitRollupService
+from src.server.utils.responses import ValidationError
+
+
+habits_route = APIRouter(prefix="/habits", tags=["habits"])
+
+# Default analytics window, in periods, when date_from is not provided.
+DEFAULT_ANALYTICS_PERIODS = 12
+
+
+@habits_route.get(
+    "/analytics",
+    response_model=HabitAnalyticsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_habit_analytics(
+    period: RollupPeriod = Query(
+        RollupPeriod.WEEK, description="Rollup period (day, week or month)"
+    ),
+    date_from: Optional[date] = Query(
+        None, description="Start of the window (YYYY-MM-DD)"
+    ),
+    date_to: Optional[date] = Query(None, description="End of the window (YYYY-MM-DD)"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Completion rates for the authenticated user's habits.
+
+    Served from pre-aggregated rollups, so the cost depends on the number of
+    habits and periods in the window, not on the number of completions.
+
+    **Query Parameters:**
+    - **period**: Rollup period (day, week, month; default: week)
+    - **date_from**: Start of the window (default: 12 periods before date_to)
+    - **date_to**: End of the window (default: today)
+
+    **Returns:**
+    - Per-habit statistics per period, plus totals grouped by frequency and
+      by target days
+    """
+    date_to = date_to or date.today()
+    if date_from is None:
+        days_per_period = {
+            RollupPeriod.DAY: 1,
+            RollupPeriod.WEEK: 7,
+            RollupPeriod.MONTH: 31,
+        }[period]
+        date_from = date_to - timedelta(
+            days=days_per_period * (DEFAULT_ANALYTICS_PERIODS - 1)
+        )
+
+    if date_from > date_to:
+        raise ValidationError("date_from must not be after date_to")
+
+    return await HabitRollupService.get_analytics(
+        current_user, period, date_from, date_to
+    )
+
+
+@habits_route.post(
+    "/{habit_id}/completions",
+    response_model=HabitCompletionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_habit_completion(
+    habit_id: UUID,
+    completion_data: HabitCompletionCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Record a habit completion.
+
+    **Path Parameters:**
+    - **habit_id**: UUID of the habit
+
+    **Request Body:**
+    - Completion data following the HabitCompletionCreate schema
+
+    **Returns:**
+    - The completion row for that day
+
+    **Errors:**
+    - 404: Habit not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+
+    **Note:**
+    - Analytics rollups are updated in the background after the response
+    """
+    completion, new_days = await HabitService.record_completion(
+        current_user, habit_id, completion_data
+    )
+
+    background_tasks.add_task(
+        HabitRollupService.apply_completion,
+        current_user.id,
+        completion.habit_id,
+        completion.completion_date,
+        completion_data.completed_count,
+        new_days,
+    )
+
+    return HabitCompletionResponse.model_validate(completion)
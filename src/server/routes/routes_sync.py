@@ -0,0 +1,36 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.services.sync_service import SyncService
+
+sync_route = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@sync_route.get("/")
+async def sync(
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the previous sync (omit for a full sync)"
+    ),
+    limit: int = Query(500, ge=1, le=5000, description="Rows per type and page"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Return the tasks, categories and habits changed since the last sync.
+
+    **Query Parameters:**
+    - cursor: High-water mark returned by the previous call
+    - limit: Maximum rows per type in one page
+
+    **Returns:**
+    - `changes`: Changed rows per type (null fields omitted)
+    - `deleted`: Ids of rows deleted since the cursor, per type
+    - `cursor`: Value to send on the next call
+    - `has_more`: Whether to call again right away for the rest of the changes
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    - 422: Invalid cursor
+    """
+    return ORJSONResponse(await SyncService.changes(current_user, cursor, limit))
@@ -1,10 +1,21 @@
-from fastapi import APIRouter, Depends, Query, status
-from typing import Optional
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from typing import Dict, Optional
 from uuid import UUID
 import math
 
 from src.database.models import User
 from src.server.middleware.auth import get_current_user
+from src.server.schemas.category_schemas import CategorySummary
 from src.server.schemas.task_schemas import (
     TaskCreate,
     TaskUpdate,
@@ -13,16 +24,38 @@ from src.server.schemas.task_schemas import (
     TaskListResponse,
     TaskDeleteResponse,
     TaskListQueryParams,
+    TaskDependencyCreate,
+    TaskDependencyResponse,
+    TaskDependenciesResponse,
+    BlockedTask,
+    BlockedTasksResponse,
+    TaskScheduleResponse,
+    TaskTreeNode,
+    TaskImportResponse,
+    TaskStatsResponse,
+)
+from src.server.services.category_service import CategoryService
+from src.server.services.task_service import TaskService, MAX_TREE_DEPTH
+from src.server.services.task_export_service import TaskExportService
+from src.server.services.task_import_service import TaskImportService
+from src.server.services.task_stats_service import TaskStatsService
+from src.server.services.dependency_service import (
+    DependencyIndex,
+    TaskDependencyService,
 )
-from src.server.services.task_service import TaskService
 from src.database.models.enums import TaskStatus, Priority
+from src.server.utils.etag import make_etag, not_modified
+from src.server.utils.responses import ValidationError
 
 
 tasks_route = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-def _task_to_response(task) -> TaskResponse:
-    """Convert a Task model instance to TaskResponse."""
+def _task_to_response(task, categories: Dict[UUID, CategorySummary]) -> TaskResponse:
+    """Convert a Task model instance to TaskResponse.
+
+    ``categories`` is the user's category map (see ``CategoryService.summaries``).
+    """
     return TaskResponse(
         id=task.id,
         user_id=task.user_id,
@@ -40,11 +73,19 @@ def _task_to_response(task) -> TaskResponse:
         created_at=task.created_at,
         updated_at=task.updated_at,
         completed_at=task.completed_at,
+        category=categories.get(task.category_id) if task.category_id else None,
     )
 
 
+async def _task_with_category(user: User, task) -> TaskResponse:
+    categories = await CategoryService.summaries(user.id, [task.category_id])
+    return _task_to_response(task, categories)
+
+
 @tasks_route.get("/", response_model=TaskListResponse, status_code=status.HTTP_200_OK)
 async def get_tasks(
+    request: Request,
+    response: Response,
     # Query parameters for filtering
     status_filter: Optional[TaskStatus] = Query(
         None, alias="status", description="Filter by task status"
@@ -87,6 +128,9 @@ async def get_tasks(
     - **page_size**: Number of items per page (default: 20, max: 100)
     - **sort_by**: Field to sort by (created_at, updated_at, title, due_date, priority, status, completion_percentage)
     - **sort_order**: Sort order (asc or desc, default: desc)
+
+    The response has an ``ETag``; sending it back in ``If-None-Match``
+    returns ``304 Not Modified`` while none of the user's tasks changed.
     """
     # Create query parameters object
     query_params = TaskListQueryParams(
@@ -103,11 +147,25 @@ async def get_tasks(
         sort_order=sort_order,
     )
 
+    # A cheap probe decides freshness before running the list query
+    etag = make_etag(
+        current_user.id,
+        *await TaskService.tasks_version(current_user),
+        request.url.query,
+    )
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers["ETag"] = etag
+
     # Get tasks from service
     tasks, total_count = await TaskService.list_tasks(current_user, query_params)
 
     # Convert to response format
-    task_responses = [_task_to_response(task) for task in tasks]
+    categories = await CategoryService.summaries(
+        current_user.id, [task.category_id for task in tasks]
+    )
+    task_responses = [_task_to_response(task, categories) for task in tasks]
 
     # Calculate pagination info
     total_pages = math.ceil(total_count / page_size) if total_count > 0 else 1
@@ -121,13 +179,160 @@ async def get_tasks(
     )
 
 
+@tasks_route.get(
+    "/blocked", response_model=BlockedTasksResponse, status_code=status.HTTP_200_OK
+)
+async def get_blocked_tasks(current_user: User = Depends(get_current_user)):
+    """
+    List open tasks that have unfinished prerequisites.
+
+    **Returns:**
+    - Each blocked task with the IDs of the prerequisites blocking it
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    graph = await DependencyIndex.get(current_user.id)
+    blocked = graph.blocked_tasks()
+    return BlockedTasksResponse(
+        tasks=[
+            BlockedTask(task_id=task_id, blocked_by=blockers)
+            for task_id, blockers in sorted(blocked.items(), key=lambda i: str(i[0]))
+        ],
+        total=len(blocked),
+    )
+
+
+@tasks_route.get(
+    "/schedule", response_model=TaskScheduleResponse, status_code=status.HTTP_200_OK
+)
+async def get_task_schedule(current_user: User = Depends(get_current_user)):
+    """
+    Order the user's dependent tasks and compute the critical path.
+
+    **Returns:**
+    - **order**: Tasks with dependencies in topological order (prerequisites first)
+    - **critical_path**: Longest chain of open work by estimated duration
+    - **critical_path_duration**: Total estimated minutes along the critical path
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    - 422: The dependencies contain a cycle
+    """
+    graph = await DependencyIndex.get(current_user.id)
+    try:
+        critical_path, duration = graph.critical_path()
+        order = graph.topological_order()
+    except ValueError as e:
+        raise ValidationError(str(e))
+    return TaskScheduleResponse(
+        order=order,
+        critical_path=critical_path,
+        critical_path_duration=duration,
+    )
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@tasks_route.get(
+    "/stats", response_model=TaskStatsResponse, status_code=status.HTTP_200_OK
+)
+async def get_task_stats(current_user: User = Depends(get_current_user)):
+    """
+    Task counts for dashboards: by status, overdue and due today.
+
+    Served from counters maintained on every task write, so the cost does not
+    depend on the number of tasks.
+
+    **Returns:**
+    - Total live tasks, counts per status, and open tasks overdue or due today
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await TaskStatsService.get_stats(current_user)
+
+
+@tasks_route.get("/export", status_code=status.HTTP_200_OK)
+async def export_tasks(
+    format: str = Query(
+        "ndjson", pattern="^(ndjson|csv)$", description="Output format"
+    ),
+    gzip: bool = Query(False, description="Gzip the output"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream all of the user's tasks as NDJSON or CSV.
+
+    Rows are read and encoded in chunks, so memory stays constant however
+    many tasks are exported.
+
+    **Query Parameters:**
+    - **format**: `ndjson` (one task object per line) or `csv` (with header)
+    - **gzip**: Return a gzip file (`application/gzip`)
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    - 422: Unknown format
+    """
+    filename = f"tasks.{format}" + (".gz" if gzip else "")
+    return StreamingResponse(
+        TaskExportService.export(current_user, format, gzip),
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@tasks_route.post(
+    "/import", response_model=TaskImportResponse, status_code=status.HTTP_200_OK
+)
+async def import_tasks(
+    file: UploadFile = File(..., description="NDJSON or CSV file, optionally gzipped"),
+    format: Optional[str] = Query(
+        None,
+        pattern="^(ndjson|csv)$",
+        description="File format (default: from the file name, else ndjson)",
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Import tasks from an NDJSON or CSV file, such as one from `/tasks/export`.
+
+    The upload is parsed incrementally and inserted in batches; task IDs in
+    the file are kept, so rows whose ID already exists are skipped.
+
+    **Returns:**
+    - Counts of created and skipped rows, and the first rejected rows
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    - 422: Unknown format
+    """
+    name = (file.filename or "").lower()
+    compressed = name.endswith(".gz") or file.content_type == "application/gzip"
+    if format is None:
+        format = "csv" if name.removesuffix(".gz").endswith(".csv") else "ndjson"
+    return await TaskImportService.import_tasks(
+        current_user, file.file, format, compressed
+    )
+
+
 @tasks_route.get(
     "/{task_id}", response_model=TaskResponse, status_code=status.HTTP_200_OK
 )
-async def get_task_by_id(task_id: UUID, current_user: User = Depends(get_current_user)):
+async def get_task_by_id(
+    task_id: UUID,
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+):
     """
     Retrieve a specific task by ID.
 
+    The response has an ``ETag``; sending it back in ``If-None-Match``
+    returns ``304 Not Modified`` while the task is unchanged.
+
     **Path Parameters:**
     - **task_id**: UUID of the task to retrieve
 
@@ -139,7 +344,48 @@ async def get_task_by_id(task_id: UUID, current_user: User = Depends(get_current
     - 401: Unauthorized (invalid or missing token)
     """
     task = await TaskService.get_task_by_id(current_user, task_id)
-    return _task_to_response(task)
+    categories = await CategoryService.summaries(current_user.id, [task.category_id])
+    category = categories.get(task.category_id)
+    etag = make_etag(task.id, task.updated_at, category and category.model_dump())
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response.headers["ETag"] = etag
+    return _task_to_response(task, categories)
+
+
+@tasks_route.get(
+    "/{task_id}/tree", response_model=TaskTreeNode, status_code=status.HTTP_200_OK
+)
+async def get_task_tree(
+    task_id: UUID,
+    max_depth: int = Query(
+        MAX_TREE_DEPTH,
+        ge=0,
+        le=MAX_TREE_DEPTH,
+        description="Maximum subtask nesting to return",
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Retrieve a task with its whole subtask tree in a single query.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the root task
+
+    **Query Parameters:**
+    - **max_depth**: Maximum nesting to return (0 returns only the task itself)
+
+    **Returns:**
+    - The task with nested `subtasks`, plus `rollup_completion_percentage` and
+      `rollup_estimated_duration` aggregated over the leaf tasks of the full
+      subtree (including levels cut off by `max_depth`)
+
+    **Errors:**
+    - 404: Task not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await TaskService.get_task_tree(current_user, task_id, max_depth)
 
 
 @tasks_route.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -161,7 +407,7 @@ async def create_task(
     - 400: Bad request (e.g., parent task not found)
     """
     task = await TaskService.create_task(current_user, task_data)
-    return _task_to_response(task)
+    return await _task_with_category(current_user, task)
 
 
 @tasks_route.put(
@@ -190,7 +436,7 @@ async def update_task(
     - 400: Bad request (e.g., parent task not found)
     """
     task = await TaskService.update_task(current_user, task_id, task_data)
-    return _task_to_response(task)
+    return await _task_with_category(current_user, task)
 
 
 @tasks_route.patch(
@@ -219,7 +465,7 @@ async def patch_task(
     - 400: Bad request (e.g., parent task not found)
     """
     task = await TaskService.patch_task(current_user, task_id, task_data)
-    return _task_to_response(task)
+    return await _task_with_category(current_user, task)
 
 
 @tasks_route.delete(
@@ -242,10 +488,119 @@ async def delete_task(task_id: UUID, current_user: User = Depends(get_current_us
     **Note:**
     - This performs a soft delete (sets deleted_at timestamp)
     - The task will no longer appear in list/get operations
-    - Related subtasks are not automatically deleted
+    - Subtasks, reminders, time logs and pending notifications of the whole
+      subtree are deleted with it and can be brought back with
+      `POST /tasks/{task_id}/restore`
     """
-    task = await TaskService.delete_task(current_user, task_id)
+    task, counts = await TaskService.delete_task(current_user, task_id)
 
     return TaskDeleteResponse(
-        message="Task deleted successfully", deleted_task_id=task.id
+        message="Task deleted successfully",
+        deleted_task_id=task.id,
+        deleted_counts=counts,
+    )
+
+
+@tasks_route.post(
+    "/{task_id}/restore", response_model=TaskResponse, status_code=status.HTTP_200_OK
+)
+async def restore_task(task_id: UUID, current_user: User = Depends(get_current_user)):
+    """
+    Restore a soft-deleted task.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the deleted task
+
+    **Returns:**
+    - Restored task details
+
+    **Errors:**
+    - 404: Task not found, not deleted, or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+
+    **Note:**
+    - Everything deleted together with the task (subtasks, reminders, time
+      logs, pending notifications) is restored in the same operation
+    """
+    task, _ = await TaskService.restore_task(current_user, task_id)
+    return await _task_with_category(current_user, task)
+
+
+@tasks_route.get(
+    "/{task_id}/dependencies",
+    response_model=TaskDependenciesResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_task_dependencies(
+    task_id: UUID, current_user: User = Depends(get_current_user)
+):
+    """
+    List the prerequisites and dependents of a task.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the task
+
+    **Errors:**
+    - 404: Task not found or doesn't belong to user
+    - 401: Unauthorized (invalid or missing token)
+    """
+    prerequisites, dependents = await TaskDependencyService.get_dependencies(
+        current_user, task_id
+    )
+    return TaskDependenciesResponse(
+        task_id=task_id,
+        prerequisite_task_ids=prerequisites,
+        dependent_task_ids=dependents,
+    )
+
+
+@tasks_route.post(
+    "/{task_id}/dependencies",
+    response_model=TaskDependencyResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_task_dependency(
+    task_id: UUID,
+    dependency_data: TaskDependencyCreate,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Add a prerequisite to a task.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the dependent task
+
+    **Request Body:**
+    - **prerequisite_task_id**: Task that must be finished first
+
+    **Errors:**
+    - 404: Either task not found or doesn't belong to user
+    - 422: Dependency already exists or would create a cycle
+    - 401: Unauthorized (invalid or missing token)
+    """
+    dependency = await TaskDependencyService.add_dependency(
+        current_user, task_id, dependency_data.prerequisite_task_id
+    )
+    return TaskDependencyResponse.model_validate(dependency)
+
+
+@tasks_route.delete(
+    "/{task_id}/dependencies/{prerequisite_task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def remove_task_dependency(
+    task_id: UUID,
+    prerequisite_task_id: UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Remove a prerequisite from a task.
+
+    **Errors:**
+    - 404: Task not found or doesn't belong to user
+    - 422: Dependency not found
+    - 401: Unauthorized (invalid or missing token)
+    """
+    await TaskDependencyService.remove_dependency(
+        current_user, task_id, prerequisite_task_id
     )
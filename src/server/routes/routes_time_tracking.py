@@ -0,0 +1,137 @@
+from datetime import date, timedelta
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Body, Depends, Query, status
+from src.database.models import User
+from src.server.middleware.auth import get_current_user
+from src.server.schemas.time_schemas import (
+    TimeLogResponse,
+    TimerStart,
+    TimeReportResponse,
+)
+from src.server.services.agenda_service import get_zone
+from src.server.services.time_tracking_service import TimeTrackingService
+from src.server.utils.responses import ValidationError
+from tortoise import timezone
+
+time_tracking_route = APIRouter(prefix="/time", tags=["time-tracking"])
+
+# Default report window, in days, when date_from is not provided.
+DEFAULT_REPORT_DAYS = 7
+MAX_REPORT_DAYS = 366
+
+
+@time_tracking_route.post(
+    "/tasks/{task_id}/start",
+    response_model=TimeLogResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def start_timer(
+    task_id: UUID,
+    timer_data: Optional[TimerStart] = Body(None),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Start a timer on a task.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the task
+
+    **Request Body (optional):**
+    - **notes**: Notes for the time log
+
+    **Errors:**
+    - 404: Task not found or doesn't belong to user
+    - 422: A timer is already running on the task
+    - 401: Unauthorized (invalid or missing token)
+    """
+    log = await TimeTrackingService.start_timer(
+        current_user, task_id, timer_data.notes if timer_data else None
+    )
+    return TimeLogResponse.model_validate(log)
+
+
+@time_tracking_route.post(
+    "/tasks/{task_id}/stop",
+    response_model=TimeLogResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def stop_timer(task_id: UUID, current_user: User = Depends(get_current_user)):
+    """
+    Stop the running timer of a task.
+
+    **Path Parameters:**
+    - **task_id**: UUID of the task
+
+    **Returns:**
+    - The finished time log, with its duration in minutes
+
+    **Errors:**
+    - 404: Task not found or doesn't belong to user
+    - 422: No timer is running on the task
+    - 401: Unauthorized (invalid or missing token)
+
+    **Note:**
+    - The duration is added to the task's actual_duration and to the time
+      report of the days it spans
+    """
+    log = await TimeTrackingService.stop_timer(current_user, task_id)
+    return TimeLogResponse.model_validate(log)
+
+
+@time_tracking_route.get(
+    "/running",
+    response_model=List[TimeLogResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def get_running_timers(current_user: User = Depends(get_current_user)):
+    """
+    List the authenticated user's running timers, oldest first.
+
+    **Errors:**
+    - 401: Unauthorized (invalid or missing token)
+    """
+    return await TimeTrackingService.running_timers(current_user)
+
+
+@time_tracking_route.get(
+    "/report",
+    response_model=TimeReportResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_time_report(
+    date_from: Optional[date] = Query(
+        None, description="First day of the report (YYYY-MM-DD)"
+    ),
+    date_to: Optional[date] = Query(
+        None, description="Last day of the report (YYYY-MM-DD)"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Time spent per category and day.
+
+    Served from per-day rollups maintained when timers stop; raw time logs
+    are never summed. Days are the user's local days.
+
+    **Query Parameters:**
+    - **date_from**: First day (default: 6 days before date_to)
+    - **date_to**: Last day (default: today in the user's timezone)
+
+    **Returns:**
+    - Minutes per (day, category), and totals per category and per day
+
+    **Errors:**
+    - 422: date_from after date_to, or a window longer than 366 days
+    - 401: Unauthorized (invalid or missing token)
+    """
+    date_to = (
+        date_to or timezone.now().astimezone(get_zone(current_user.timezone)).date()
+    )
+    date_from = date_from or date_to - timedelta(days=DEFAULT_REPORT_DAYS - 1)
+    if date_from > date_to:
+        raise ValidationError("date_from must not be after date_to")
+    if (date_to - date_from).days >= MAX_REPORT_DAYS:
+        raise ValidationError(f"The report window is limited to {MAX_REPORT_DAYS} days")
+
+    return await TimeTrackingService.report(current_user, date_from, date_to)
@@ -1,7 +1,11 @@
+from typing import Optional
+from uuid import UUID
 from src.database.models import User
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from tortoise.exceptions import DoesNotExist
 from src.server.middleware.auth import get_current_user
+from src.server.services.user_service import UserService
 from src.server.utils.jwt import create_access_token
 import os
 
@@ -15,34 +19,63 @@ if os.getenv("DEBUG") == "True":
         return {"token": token}
 
 
-@user_route.get("/")
-async def get_users():
-    """Get all users."""
-    try:
-        users = await User.all()
-        # Convert to list of dictionaries for JSON serialization
-        users_data = []
-        for user in users:
-            users_data.append(
-                {
-                    "id": user.id,
-                    "clerk_id": user.clerk_id,
-                    "email": user.email,
-                    "username": user.username,
-                    "timezone": user.timezone,
-                    "default_reminder_minutes": user.default_reminder_minutes,
-                    "preferred_notification_type": user.preferred_notification_type,
-                    "created_at": user.created_at.isoformat()
-                    if user.created_at
-                    else None,
-                    "updated_at": user.updated_at.isoformat()
-                    if user.updated_at
-                    else None,
-                }
-            )
-        return users_data
-    except Exception as e:
-        return {"error": str(e)}
+# There is no admin role yet: listing every user's email and clerk_id is only
+# served in debug setups.
+if os.getenv("DEBUG") == "True":
+
+    @user_route.get("/")
+    async def get_users(
+        limit: int = Query(100, ge=1, le=1000, description="Users per page"),
+        after: Optional[UUID] = Query(
+            None,
+            description="Cursor from the X-Next-Cursor header of the previous page",
+        ),
+        fields: Optional[str] = Query(
+            None,
+            description="Comma separated fields to return (id is always included)",
+        ),
+        current_user: User = Depends(get_current_user),
+    ):
+        """
+        List users in id order with keyset pagination.
+
+        **Returns:**
+        - List of users; when more users exist the ``X-Next-Cursor`` header
+          holds the ``after`` value for the next page
+
+        Only registered when ``DEBUG=True``.
+
+        **Errors:**
+        - 422: Unknown field requested
+        - 401: Unauthorized (invalid or missing token)
+        """
+        users, next_cursor = await UserService.list_users(
+            limit, after, UserService.parse_fields(fields)
+        )
+        headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor else None
+        return ORJSONResponse(users, headers=headers)
+
+    @user_route.get("/export")
+    async def export_users(
+        fields: Optional[str] = Query(
+            None,
+            description="Comma separated fields to return (id is always included)",
+        ),
+        current_user: User = Depends(get_current_user),
+    ):
+        """
+        Stream all users as a single JSON array, for admin exports.
+
+        Only registered when ``DEBUG=True``.
+
+        **Errors:**
+        - 422: Unknown field requested
+        - 401: Unauthorized (invalid or missing token)
+        """
+        return StreamingResponse(
+            UserService.export_json(UserService.parse_fields(fields)),
+            media_type="application/json",
+        )
 
 
 @user_route.get("/{user_id}")
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+COLOR_PATTERN = "^#[0-9A-Fa-f]{6}$"
+
+
+class CategoryCreate(BaseModel):
+    """Schema for creating a category."""
+
+    name: str = Field(..., min_length=1, max_length=100, description="Category name")
+    color: str = Field("#666666", pattern=COLOR_PATTERN, description="Hex color")
+
+
+class CategoryUpdate(BaseModel):
+    """Schema for partial category updates (PATCH)."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    color: Optional[str] = Field(None, pattern=COLOR_PATTERN)
+
+
+class CategorySummary(BaseModel):
+    """Category name and color, attached to task responses."""
+
+    id: UUID
+    name: str
+    color: str
+
+    class Config:
+        from_attributes = True
+
+
+class CategoryResponse(CategorySummary):
+    """Schema for category responses."""
+
+    created_at: datetime
+    updated_at: datetime
+
+
+class CategoryDeleteResponse(BaseModel):
+    """Response schema for category deletion."""
+
+    message: str
+    deleted_category_id: UUID
+    uncategorized_tasks: int = Field(
+        0, description="Tasks that were left without a category"
+    )
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from pydantic import BaseModel, Field, model_validator
+from src.database.models.enums import DeviceType
+
+# Web and desktop clients receive Web Push at an endpoint URL; mobile apps
+# receive APNs / FCM pushes at a device token.
+ENDPOINT_DEVICE_TYPES = (DeviceType.WEB, DeviceType.DESKTOP)
+
+
+class DeviceRegister(BaseModel):
+    """Schema for registering a device for push notifications."""
+
+    device_type: DeviceType
+    push_token: Optional[str] = Field(
+        None, min_length=1, max_length=4096, description="APNs / FCM token"
+    )
+    endpoint_url: Optional[str] = Field(
+        None, min_length=1, max_length=4096, description="Web Push endpoint"
+    )
+
+    @model_validator(mode="after")
+    def check_address(self) -> "DeviceRegister":
+        if self.device_type in ENDPOINT_DEVICE_TYPES:
+            if not self.endpoint_url:
+                raise ValueError(f"endpoint_url is required for {self.device_type}")
+        elif not self.push_token:
+            raise ValueError(f"push_token is required for {self.device_type}")
+        return self
+
+
+class DeviceResponse(BaseModel):
+    """Schema for device responses."""
+
+    id: UUID
+    device_type: DeviceType
+    push_token: Optional[str] = None
+    endpoint_url: Optional[str] = None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,124 @@
+from datetime import date, datetime, time
+from typing import Optional, List, Any
+from uuid import UUID
+from pydantic import BaseModel, Field
+from src.database.models.enums import Frequency, MessageType, RollupPeriod
+
+
+class HabitCompletionCreate(BaseModel):
+    """Schema for recording a habit completion."""
+
+    completion_date: Optional[date] = Field(
+        None, description="Day the habit was completed (defaults to today)"
+    )
+    completed_count: int = Field(
+        1, ge=1, description="Number of completions to record for the day"
+    )
+    notes: Optional[str] = Field(None, description="Optional notes")
+
+
+class HabitCompletionResponse(BaseModel):
+    """Schema for habit completion responses."""
+
+    id: UUID
+    habit_id: UUID
+    completion_date: date
+    completed_count: int
+    notes: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class HabitPeriodStats(BaseModel):
+    """Completion statistics for one habit in one rollup period."""
+
+    period_start: date
+    completed_count: int
+    completion_days: int
+    expected: float
+    completion_rate: Optional[float] = None
+
+
+class HabitAnalyticsEntry(BaseModel):
+    """Completion statistics for one habit over the requested window."""
+
+    habit_id: UUID
+    name: str
+    frequency: Frequency
+    target_days: Optional[Any] = None
+    completed_count: int
+    completion_days: int
+    expected: float
+    completion_rate: Optional[float] = None
+    periods: List[HabitPeriodStats]
+
+
+class HabitAnalyticsGroup(BaseModel):
+    """Completion statistics aggregated over a group of habits."""
+
+    key: str
+    habit_count: int
+    completed_count: int
+    completion_days: int
+    expected: float
+    completion_rate: Optional[float] = None
+
+
+class HabitAnalyticsResponse(BaseModel):
+    """Response schema for habit analytics."""
+
+    period: RollupPeriod
+    date_from: date
+    date_to: date
+    habits: List[HabitAnalyticsEntry]
+    by_frequency: List[HabitAnalyticsGroup]
+    by_target_days: List[HabitAnalyticsGroup]
+
+
+class HabitTemplateMessageResponse(BaseModel):
+    """A notification message of a habit template."""
+
+    id: UUID
+    message_type: MessageType
+    message_text: str
+
+    class Config:
+        from_attributes = True
+
+
+class HabitTemplateResponse(BaseModel):
+    """Schema for habit templates in the catalog."""
+
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    category: str
+    default_frequency: Frequency
+    default_target_days: Optional[Any] = None
+    default_target_count: int
+    default_reminder_time: time
+    icon_name: Optional[str] = None
+    color: str
+    difficulty_level: int
+    estimated_time_minutes: Optional[int] = None
+    sort_order: int
+    messages: List[HabitTemplateMessageResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
+class HabitTemplateCategory(BaseModel):
+    """Active templates of one category, in display order."""
+
+    category: str
+    templates: List[HabitTemplateResponse]
+
+
+class HabitTemplateCatalogResponse(BaseModel):
+    """Response schema for the habit template catalog."""
+
+    categories: List[HabitTemplateCategory]
@@ -1,8 +1,20 @@
 from datetime import date, time, datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 from pydantic import BaseModel, Field, field_validator
 from src.database.models.enums import TaskStatus, Priority
+from src.server.schemas.category_schemas import CategorySummary
+
+
+TASK_SORT_FIELDS = (
+    "created_at",
+    "updated_at",
+    "title",
+    "due_date",
+    "priority",
+    "status",
+    "completion_percentage",
+)
 
 
 class TaskBase(BaseModel):
@@ -35,6 +47,14 @@ class TaskCreate(TaskBase):
     pass
 
 
+class TaskImportRow(TaskCreate):
+    """One task of an import file; ``id`` is kept so parent links stay valid."""
+
+    id: Optional[UUID] = Field(None, description="Task ID (generated when missing)")
+    due_time: Optional[time] = Field(None, description="Due time, as exported")
+    completed_at: Optional[datetime] = Field(None, description="Completion time")
+
+
 class TaskUpdate(BaseModel):
     """Schema for updating a task (PUT - all fields optional but at least one required)."""
 
@@ -77,6 +97,9 @@ class TaskResponse(TaskBase):
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
+    category: Optional[CategorySummary] = Field(
+        None, description="Name and color of the task's category"
+    )
 
     class Config:
         from_attributes = True
@@ -111,17 +134,8 @@ class TaskListQueryParams(BaseModel):
     @classmethod
     def validate_sort_field(cls, v):
         """Validate sort field."""
-        allowed_fields = [
-            "created_at",
-            "updated_at",
-            "title",
-            "due_date",
-            "priority",
-            "status",
-            "completion_percentage",
-        ]
-        if v not in allowed_fields:
-            raise ValueError(f"sort_by must be one of: {', '.join(allowed_fields)}")
+        if v not in TASK_SORT_FIELDS:
+            raise ValueError(f"sort_by must be one of: {', '.join(TASK_SORT_FIELDS)}")
         return v
 
 
@@ -140,3 +154,111 @@ class TaskDeleteResponse(BaseModel):
 
     message: str
     deleted_task_id: UUID
+    deleted_counts: Dict[str, int] = Field(
+        default_factory=dict, description="Rows soft-deleted per table"
+    )
+
+
+class TaskStatsResponse(BaseModel):
+    """Response schema for the task summary counters."""
+
+    total: int = Field(..., description="Live tasks, subtasks included")
+    by_status: Dict[TaskStatus, int]
+    overdue: int = Field(..., description="Open tasks due before today")
+    due_today: int = Field(..., description="Open tasks due today")
+
+
+class AgendaResponse(BaseModel):
+    """Open tasks around the user's local day."""
+
+    timezone: str = Field(..., description="Timezone the windows are computed in")
+    local_date: date = Field(..., description="Today in the user's timezone")
+    week_end: date = Field(..., description="Last day of the upcoming window")
+    overdue: List[TaskResponse] = Field(default_factory=list)
+    today: List[TaskResponse] = Field(default_factory=list)
+    upcoming: List[TaskResponse] = Field(default_factory=list)
+
+
+class TaskImportError(BaseModel):
+    """A row of an import file that was not imported."""
+
+    line: int = Field(..., description="Line (NDJSON) or record (CSV) number")
+    message: str
+
+
+class TaskImportResponse(BaseModel):
+    """Summary of a task import."""
+
+    created: int = Field(..., description="Tasks inserted")
+    skipped: int = Field(..., description="Rows whose task ID already exists")
+    error_count: int = Field(
+        ..., description="Rows that were rejected or linked incompletely"
+    )
+    errors: List[TaskImportError] = Field(
+        default_factory=list, description="First rejected rows"
+    )
+
+
+class TaskDependencyCreate(BaseModel):
+    """Schema for adding a prerequisite to a task."""
+
+    prerequisite_task_id: UUID = Field(
+        ..., description="Task that must be finished first"
+    )
+
+
+class TaskDependencyResponse(BaseModel):
+    """Schema for a single dependency edge."""
+
+    id: UUID
+    prerequisite_task_id: UUID
+    dependent_task_id: UUID
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TaskDependenciesResponse(BaseModel):
+    """Prerequisites and dependents of a task."""
+
+    task_id: UUID
+    prerequisite_task_ids: List[UUID]
+    dependent_task_ids: List[UUID]
+
+
+class BlockedTask(BaseModel):
+    """An open task together with the unfinished tasks blocking it."""
+
+    task_id: UUID
+    blocked_by: List[UUID]
+
+
+class BlockedTasksResponse(BaseModel):
+    """Response schema for blocked tasks."""
+
+    tasks: List[BlockedTask]
+    total: int
+
+
+class TaskScheduleResponse(BaseModel):
+    """Topological order and critical path of a user's dependent tasks."""
+
+    order: List[UUID]
+    critical_path: List[UUID]
+    critical_path_duration: int
+
+
+class TaskTreeNode(TaskResponse):
+    """A task with its subtasks and aggregates over its whole subtree."""
+
+    depth: int = Field(..., description="Distance from the requested task")
+    subtask_count: int = Field(..., description="Number of direct subtasks")
+    descendant_count: int = Field(..., description="Number of tasks below this one")
+    rollup_completion_percentage: int = Field(
+        ..., description="Mean completion of the leaf tasks in the subtree"
+    )
+    rollup_estimated_duration: int = Field(
+        ..., description="Sum of leaf task estimates in the subtree, in minutes"
+    )
+    subtasks: List["TaskTreeNode"] = Field(default_factory=list)
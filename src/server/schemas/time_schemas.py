@@ -0,0 +1,59 @@
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class TimerStart(BaseModel):
+    """Schema for starting a timer on a task."""
+
+    notes: Optional[str] = Field(None, description="Optional notes for the log")
+
+
+class TimeLogResponse(BaseModel):
+    """Schema for time log (timer) responses."""
+
+    id: UUID
+    task_id: UUID
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    duration_minutes: Optional[int] = None
+    notes: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class TimeReportEntry(BaseModel):
+    """Tracked time of one category on one day."""
+
+    day: date
+    category_id: Optional[UUID] = None
+    category_name: Optional[str] = None
+    minutes: int
+
+
+class TimeReportCategory(BaseModel):
+    """Tracked time of one category over the report window."""
+
+    category_id: Optional[UUID] = None
+    category_name: Optional[str] = None
+    minutes: int
+
+
+class TimeReportDay(BaseModel):
+    """Tracked time of one day, all categories together."""
+
+    day: date
+    minutes: int
+
+
+class TimeReportResponse(BaseModel):
+    """Response schema for time spent per category and day."""
+
+    date_from: date
+    date_to: date
+    total_minutes: int
+    entries: List[TimeReportEntry]
+    by_category: List[TimeReportCategory]
+    by_day: List[TimeReportDay]
@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from src.database.models import Task, User
+from src.server.schemas.task_schemas import AgendaResponse, TaskResponse
+from src.server.services.category_service import CategoryService
+from src.server.services.task_stats_service import OPEN_STATUSES
+
+
+# Days after today covered by the "upcoming" section.
+UPCOMING_DAYS = 6
+AGENDA_TASK_FIELDS = tuple(
+    name for name in TaskResponse.model_fields if name != "category"
+)
+
+
+@lru_cache(maxsize=512)
+def get_zone(name: str) -> ZoneInfo:
+    """``ZoneInfo`` for a user's timezone name; unknown names fall back to UTC."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def local_windows(zone: ZoneInfo, now: datetime) -> Tuple[date, date, float]:
+    """Today and the last upcoming day in ``zone``, and seconds to local midnight."""
+    local_now = now.astimezone(zone)
+    today = local_now.date()
+    midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), zone)
+    # Timestamps, not datetime subtraction: aware datetimes sharing a tzinfo
+    # subtract as wall time, which is off by an hour across DST changes.
+    return (
+        today,
+        today + timedelta(days=UPCOMING_DAYS),
+        midnight.timestamp() - local_now.timestamp(),
+    )
+
+
+@dataclass
+class _Entry:
+    agenda: AgendaResponse
+    expires_at: float
+
+
+class AgendaCache:
+    """Per-process cache of agendas keyed by user id.
+
+    Entries are dropped on any task write of the user and expire at the
+    user's local midnight, when the windows move. They also expire after
+    ``TTL_SECONDS`` so that writes handled by other worker processes are
+    picked up.
+    """
+
+    MAX_USERS = 1024
+    TTL_SECONDS = 60.0
+
+    _entries: "OrderedDict[UUID, _Entry]" = OrderedDict()
+
+    @classmethod
+    def get(cls, user_id: UUID):
+        entry = cls._entries.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            del cls._entries[user_id]
+            return None
+        cls._entries.move_to_end(user_id)
+        return entry.agenda
+
+    @classmethod
+    def put(cls, user_id: UUID, agenda: AgendaResponse, seconds: float) -> None:
+        expires_at = time.monotonic() + min(seconds, cls.TTL_SECONDS)
+        cls._entries[user_id] = _Entry(agenda, expires_at)
+        cls._entries.move_to_end(user_id)
+        while len(cls._entries) > cls.MAX_USERS:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        cls._entries.pop(user_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries.clear()
+
+
+class AgendaService:
+    """Service layer for the overdue / today / upcoming agenda."""
+
+    @staticmethod
+    async def get_agenda(user: User) -> AgendaResponse:
+        """The user's open tasks due up to the end of the upcoming window.
+
+        Days are computed in the user's timezone. All three sections come
+        from one query on the live ``(user_id, due_date)`` index.
+        """
+        cached = AgendaCache.get(user.id)
+        if cached is not None:
+            return cached
+
+        zone = get_zone(user.timezone)
+        today, week_end, until_midnight = local_windows(zone, datetime.now(zone))
+        tasks = await Task.filter(
+            user_id=user.id,
+            deleted_at__isnull=True,
+            status__in=OPEN_STATUSES,
+            due_date__lte=week_end,
+        ).order_by("due_date", "-priority", "created_at")
+
+        categories = await CategoryService.summaries(
+            user.id, [task.category_id for task in tasks]
+        )
+
+        agenda = AgendaResponse(timezone=zone.key, local_date=today, week_end=week_end)
+        for task in tasks:
+            if task.due_date < today:
+                section = agenda.overdue
+            elif task.due_date == today:
+                section = agenda.today
+            else:
+                section = agenda.upcoming
+            section.append(
+                TaskResponse.model_validate(
+                    {
+                        **{name: getattr(task, name) for name in AGENDA_TASK_FIELDS},
+                        "category": categories.get(task.category_id),
+                    }
+                )
+            )
+
+        AgendaCache.put(user.id, agenda, until_midnight)
+        return agenda
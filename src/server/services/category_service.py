@@ -0,0 +1,162 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from src.database.models import Category, Task, User
+from src.server.schemas.category_schemas import (
+    CategoryCreate,
+    CategorySummary,
+    CategoryUpdate,
+)
+from src.server.utils.responses import CategoryNotFoundError, ValidationError
+
+
+@dataclass
+class CategoryMap:
+    """A user's live categories by id."""
+
+    categories: Dict[UUID, CategorySummary] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class CategoryCache:
+    """Per-process cache of ``CategoryMap`` objects keyed by user id.
+
+    Maps are loaded with a single query and dropped on any category write.
+    Entries also expire after ``TTL_SECONDS`` so that writes handled by other
+    worker processes are picked up.
+    """
+
+    MAX_USERS = 1024
+    TTL_SECONDS = 60.0
+
+    _maps: "OrderedDict[UUID, CategoryMap]" = OrderedDict()
+
+    @classmethod
+    async def load(cls, user_id: UUID) -> CategoryMap:
+        rows = await Category.filter(user_id=user_id, deleted_at__isnull=True).values(
+            "id", "name", "color"
+        )
+        return CategoryMap({row["id"]: CategorySummary(**row) for row in rows})
+
+    @classmethod
+    async def get(cls, user_id: UUID, fresh: bool = False) -> CategoryMap:
+        """Return the cached map for a user, loading it if needed."""
+        category_map = cls._maps.get(user_id)
+        expired = (
+            category_map is not None
+            and time.monotonic() - category_map.loaded_at > cls.TTL_SECONDS
+        )
+        if category_map is None or fresh or expired:
+            category_map = await cls.load(user_id)
+            cls._maps[user_id] = category_map
+        cls._maps.move_to_end(user_id)
+        while len(cls._maps) > cls.MAX_USERS:
+            cls._maps.popitem(last=False)
+        return category_map
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        cls._maps.pop(user_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._maps.clear()
+
+
+class CategoryService:
+    """Service layer for category operations."""
+
+    @staticmethod
+    async def validate_category(user_id: UUID, category_id: Optional[UUID]) -> None:
+        """Check that a task's ``category_id`` is one of the user's categories.
+
+        Answered from the cached map; an unknown id reloads the map once, in
+        case the category was just created by another worker process.
+
+        Raises:
+            ValidationError: If the category does not exist for the user.
+        """
+        if category_id is None:
+            return
+        if category_id in (await CategoryCache.get(user_id)).categories:
+            return
+        if category_id in (await CategoryCache.get(user_id, fresh=True)).categories:
+            return
+        raise ValidationError(
+            "Category not found or does not belong to user",
+            {"category_id": str(category_id)},
+        )
+
+    @staticmethod
+    async def summaries(
+        user_id: UUID, category_ids: Iterable[Optional[UUID]]
+    ) -> Dict[UUID, CategorySummary]:
+        """Name and color of the given categories, for task responses.
+
+        The map is only loaded when at least one id is set.
+        """
+        if not any(category_ids):
+            return {}
+        return (await CategoryCache.get(user_id)).categories
+
+    @staticmethod
+    async def list_categories(user: User) -> List[Category]:
+        return await Category.filter(user=user, deleted_at__isnull=True).order_by(
+            "name"
+        )
+
+    @staticmethod
+    async def get_category(user: User, category_id: UUID) -> Category:
+        category = await Category.filter(
+            id=category_id, user=user, deleted_at__isnull=True
+        ).first()
+        if not category:
+            raise CategoryNotFoundError(str(category_id))
+        return category
+
+    @staticmethod
+    async def create_category(user: User, category_data: CategoryCreate) -> Category:
+        category = await Category.create(user=user, **category_data.model_dump())
+        CategoryCache.invalidate(user.id)
+        return category
+
+    @staticmethod
+    async def update_category(
+        user: User, category_id: UUID, category_data: CategoryUpdate
+    ) -> Category:
+        from src.server.services.agenda_service import AgendaCache
+
+        category = await CategoryService.get_category(user, category_id)
+        update_data = category_data.model_dump(exclude_unset=True, exclude_none=True)
+        if not update_data:
+            raise ValidationError("At least one field must be provided for update")
+        for name, value in update_data.items():
+            setattr(category, name, value)
+        await category.save()
+        CategoryCache.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
+        return category
+
+    @staticmethod
+    async def delete_category(user: User, category_id: UUID) -> int:
+        """Soft delete a category; its tasks are kept without a category.
+
+        Returns:
+            The number of tasks that were moved out of the category.
+        """
+        from src.server.services.agenda_service import AgendaCache
+
+        category = await CategoryService.get_category(user, category_id)
+        async with in_transaction():
+            await category.delete()
+            # updated_at is bumped so /sync clients see the tasks change.
+            moved = await Task.filter(
+                user=user, category_id=category_id, deleted_at__isnull=True
+            ).update(category_id=None, updated_at=timezone.now())
+        CategoryCache.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
+        return moved
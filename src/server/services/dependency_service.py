@@ -0,0 +1,285 @@
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+from tortoise.transactions import in_transaction
+from src.database.models import Task, TaskDependency, User
+from src.database.models.enums import TaskStatus
+from src.server.utils.responses import TaskNotFoundError, ValidationError
+
+
+DONE_STATUSES = (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+
+
+class DependencyGraph:
+    """In-memory adjacency index of one user's task dependencies.
+
+    Edges point from a prerequisite to the task that depends on it. Only
+    tasks that take part in at least one dependency are tracked.
+    """
+
+    def __init__(self):
+        self.successors: Dict[UUID, Set[UUID]] = {}
+        self.predecessors: Dict[UUID, Set[UUID]] = {}
+        self.status: Dict[UUID, TaskStatus] = {}
+        self.duration: Dict[UUID, int] = {}
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "DependencyGraph":
+        """Build a graph from ``DependencyIndex.load`` rows."""
+        graph = cls()
+        for row in rows:
+            for side in ("prerequisite_task", "dependent_task"):
+                task_id = row[f"{side}_id"]
+                graph.status[task_id] = TaskStatus(row[f"{side}__status"])
+                graph.duration[task_id] = row[f"{side}__estimated_duration"] or 0
+            graph.add_edge(row["prerequisite_task_id"], row["dependent_task_id"])
+        return graph
+
+    def add_edge(self, prerequisite_id: UUID, dependent_id: UUID) -> None:
+        self.successors.setdefault(prerequisite_id, set()).add(dependent_id)
+        self.predecessors.setdefault(dependent_id, set()).add(prerequisite_id)
+        self.successors.setdefault(dependent_id, set())
+        self.predecessors.setdefault(prerequisite_id, set())
+
+    def has_edge(self, prerequisite_id: UUID, dependent_id: UUID) -> bool:
+        return dependent_id in self.successors.get(prerequisite_id, ())
+
+    def find_path(self, source: UUID, target: UUID) -> Optional[List[UUID]]:
+        """Return a path from ``source`` to ``target`` if one exists (O(V+E))."""
+        if source == target:
+            return [source]
+        parents: Dict[UUID, UUID] = {source: source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            for successor in self.successors.get(node, ()):
+                if successor in parents:
+                    continue
+                parents[successor] = node
+                if successor == target:
+                    path = [target]
+                    while path[-1] != source:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+                stack.append(successor)
+        return None
+
+    def cycle_if_added(
+        self, prerequisite_id: UUID, dependent_id: UUID
+    ) -> Optional[List[UUID]]:
+        """Return the cycle that adding ``prerequisite -> dependent`` would close.
+
+        Adding the edge creates a cycle exactly when the prerequisite is
+        already reachable from the dependent task.
+        """
+        path = self.find_path(dependent_id, prerequisite_id)
+        if path is None:
+            return None
+        return [prerequisite_id] + path
+
+    def blocked_tasks(self) -> Dict[UUID, List[UUID]]:
+        """Open tasks mapped to the prerequisites that are not done yet."""
+        blocked = {}
+        for task_id, prerequisites in self.predecessors.items():
+            if self.status.get(task_id) in DONE_STATUSES:
+                continue
+            blockers = sorted(
+                (p for p in prerequisites if self.status.get(p) not in DONE_STATUSES),
+                key=str,
+            )
+            if blockers:
+                blocked[task_id] = blockers
+        return blocked
+
+    def topological_order(self) -> List[UUID]:
+        """Kahn's algorithm; ties are broken by id so the order is stable."""
+        in_degree = {node: len(preds) for node, preds in self.predecessors.items()}
+        ready = deque(sorted((n for n, d in in_degree.items() if d == 0), key=str))
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in sorted(self.successors.get(node, ()), key=str):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+        if len(order) != len(in_degree):
+            raise ValueError("Dependency graph contains a cycle")
+        return order
+
+    def critical_path(self) -> Tuple[List[UUID], int]:
+        """Longest chain of remaining work, weighted by ``estimated_duration``.
+
+        Completed and cancelled tasks weigh nothing, so the result is the
+        minimum time needed to finish everything that is still open.
+        """
+        order = self.topological_order()
+        if not order:
+            return [], 0
+
+        def weight(node: UUID) -> int:
+            if self.status.get(node) in DONE_STATUSES:
+                return 0
+            return self.duration.get(node, 0)
+
+        finish: Dict[UUID, int] = {}
+        previous: Dict[UUID, Optional[UUID]] = {}
+        for node in order:
+            best = max(
+                self.predecessors.get(node, ()),
+                key=lambda p: (finish[p], str(p)),
+                default=None,
+            )
+            previous[node] = best
+            finish[node] = (finish[best] if best is not None else 0) + weight(node)
+
+        end = max(order, key=lambda n: (finish[n], str(n)))
+        path = [end]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]])
+        return path[::-1], finish[end]
+
+
+class DependencyIndex:
+    """Per-process cache of ``DependencyGraph`` objects keyed by user id.
+
+    Graphs are loaded with a single query and dropped on any write that can
+    change them. Entries also expire after ``TTL_SECONDS`` so that writes
+    handled by other worker processes are picked up.
+    """
+
+    MAX_USERS = 1024
+    TTL_SECONDS = 60.0
+
+    _graphs: "OrderedDict[UUID, DependencyGraph]" = OrderedDict()
+
+    @classmethod
+    async def load(cls, user_id: UUID) -> DependencyGraph:
+        """Load the user's live dependency edges with task data in one query."""
+        rows = await TaskDependency.filter(
+            dependent_task__user_id=user_id,
+            deleted_at__isnull=True,
+            prerequisite_task__deleted_at__isnull=True,
+            dependent_task__deleted_at__isnull=True,
+        ).values(
+            "prerequisite_task_id",
+            "dependent_task_id",
+            "prerequisite_task__status",
+            "prerequisite_task__estimated_duration",
+            "dependent_task__status",
+            "dependent_task__estimated_duration",
+        )
+        return DependencyGraph.from_rows(rows)
+
+    @classmethod
+    async def get(cls, user_id: UUID, fresh: bool = False) -> DependencyGraph:
+        """Return the cached graph for a user, loading it if needed."""
+        graph = cls._graphs.get(user_id)
+        expired = (
+            graph is not None and time.monotonic() - graph.loaded_at > cls.TTL_SECONDS
+        )
+        if graph is None or fresh or expired:
+            graph = await cls.load(user_id)
+            cls._graphs[user_id] = graph
+        cls._graphs.move_to_end(user_id)
+        while len(cls._graphs) > cls.MAX_USERS:
+            cls._graphs.popitem(last=False)
+        return graph
+
+    @classmethod
+    def invalidate(cls, user_id: UUID) -> None:
+        cls._graphs.pop(user_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._graphs.clear()
+
+
+class TaskDependencyService:
+    """Service layer for task dependency operations."""
+
+    @staticmethod
+    async def _ensure_tasks_exist(user: User, task_ids: List[UUID]) -> None:
+        found = set(
+            await Task.filter(
+                id__in=task_ids, user=user, deleted_at__isnull=True
+            ).values_list("id", flat=True)
+        )
+        for task_id in task_ids:
+            if task_id not in found:
+                raise TaskNotFoundError(str(task_id))
+
+    @staticmethod
+    async def add_dependency(
+        user: User, task_id: UUID, prerequisite_task_id: UUID
+    ) -> TaskDependency:
+        """Make ``task_id`` depend on ``prerequisite_task_id``.
+
+        Raises:
+            ValidationError: If the dependency already exists or would
+                create a cycle.
+        """
+        if task_id == prerequisite_task_id:
+            raise ValidationError("Task cannot depend on itself")
+
+        await TaskDependencyService._ensure_tasks_exist(
+            user, [task_id, prerequisite_task_id]
+        )
+
+        async with in_transaction():
+            # Locking the user serializes the check and the insert against
+            # concurrent additions, which could otherwise close a cycle.
+            await User.filter(id=user.id).select_for_update().first()
+            # Always validate against the current edges, not a cached snapshot.
+            graph = await DependencyIndex.load(user.id)
+            if graph.has_edge(prerequisite_task_id, task_id):
+                raise ValidationError(
+                    "Dependency already exists",
+                    {"prerequisite_task_id": str(prerequisite_task_id)},
+                )
+
+            cycle = graph.cycle_if_added(prerequisite_task_id, task_id)
+            if cycle:
+                raise ValidationError(
+                    "Dependency would create a cycle",
+                    {"cycle": [str(node) for node in cycle]},
+                )
+
+            dependency = await TaskDependency.create(
+                prerequisite_task_id=prerequisite_task_id, dependent_task_id=task_id
+            )
+        DependencyIndex.invalidate(user.id)
+        return dependency
+
+    @staticmethod
+    async def remove_dependency(
+        user: User, task_id: UUID, prerequisite_task_id: UUID
+    ) -> None:
+        """Soft delete the dependency between two tasks."""
+        await TaskDependencyService._ensure_tasks_exist(user, [task_id])
+        removed = await TaskDependency.filter(
+            prerequisite_task_id=prerequisite_task_id,
+            dependent_task_id=task_id,
+            deleted_at__isnull=True,
+        ).update(deleted_at=datetime.now())
+        if not removed:
+            raise ValidationError(
+                "Dependency not found",
+                {"prerequisite_task_id": str(prerequisite_task_id)},
+            )
+        DependencyIndex.invalidate(user.id)
+
+    @staticmethod
+    async def get_dependencies(
+        user: User, task_id: UUID
+    ) -> Tuple[List[UUID], List[UUID]]:
+        """Return the prerequisites and dependents of a task."""
+        await TaskDependencyService._ensure_tasks_exist(user, [task_id])
+        graph = await DependencyIndex.get(user.id)
+        return (
+            sorted(graph.predecessors.get(task_id, ()), key=str),
+            sorted(graph.successors.get(task_id, ()), key=str),
+        )
@@ -0,0 +1,56 @@
+from typing import List
+from uuid import UUID
+from tortoise.transactions import in_transaction
+from src.database.models import User, UserDevice
+from src.server.schemas.device_schemas import ENDPOINT_DEVICE_TYPES, DeviceRegister
+from src.server.utils.responses import DeviceNotFoundError
+
+
+class DeviceService:
+    """Service layer for the push device registry."""
+
+    @staticmethod
+    async def register_device(user: User, device_data: DeviceRegister) -> UserDevice:
+        """Register a device, or reactivate it if its address is known.
+
+        A token or endpoint identifies one installation, so registering it
+        deactivates any other device row holding it (e.g. after a sign-in
+        with another account on the same phone).
+        """
+        if device_data.device_type in ENDPOINT_DEVICE_TYPES:
+            address = {"endpoint_url": device_data.endpoint_url}
+        else:
+            address = {"push_token": device_data.push_token}
+
+        async with in_transaction():
+            device = await UserDevice.filter(user=user, **address).first()
+            others = UserDevice.filter(is_active=True, **address)
+            if device is not None:
+                others = others.exclude(id=device.id)
+            await others.update(is_active=False)
+            if device is None:
+                return await UserDevice.create(
+                    user=user, device_type=device_data.device_type, **address
+                )
+            device.device_type = device_data.device_type
+            device.is_active = True
+            device.deleted_at = None
+            await device.save()
+            return device
+
+    @staticmethod
+    async def list_devices(user: User) -> List[UserDevice]:
+        return await UserDevice.filter(
+            user=user, is_active=True, deleted_at__isnull=True
+        ).order_by("created_at")
+
+    @staticmethod
+    async def remove_device(user: User, device_id: UUID) -> None:
+        """Unregister a device (soft delete)."""
+        device = await UserDevice.filter(
+            id=device_id, user=user, deleted_at__isnull=True
+        ).first()
+        if not device:
+            raise DeviceNotFoundError(str(device_id))
+        device.is_active = False
+        await device.delete()
@@ -0,0 +1,272 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+from tortoise import timezone
+from src.database.models import Habit, HabitCompletion, HabitCompletionRollup
+from src.database.models.enums import Frequency, NotificationType, RollupPeriod
+from src.database.queries import keyset_chunks
+from src.server.services.agenda_service import get_zone
+from src.server.services.habit_service import (
+    ALL_DAYS,
+    decode_target_days,
+    next_period_start,
+    period_start,
+)
+
+
+HABIT_FIELDS = (
+    "id",
+    "user_id",
+    "template_id",
+    "frequency",
+    "target_days",
+    "target_count",
+    "reminder_time",
+    "created_at",
+    "user__timezone",
+    "user__preferred_notification_type",
+)
+
+
+@dataclass(frozen=True)
+class HabitDue:
+    """A habit to notify about, with what the notification needs."""
+
+    habit_id: UUID
+    user_id: UUID
+    template_id: Optional[UUID]
+    local_date: date
+    reminder_time: Optional[time]
+    timezone: str
+    notification_type: NotificationType
+
+
+@lru_cache(maxsize=4096)
+def _cached_mask(target_days: Optional[tuple]) -> int:
+    return decode_target_days(target_days)
+
+
+def habit_mask(target_days) -> int:
+    """``decode_target_days``, cached: most habits share a few schedules."""
+    try:
+        return _cached_mask(tuple(target_days) if target_days else None)
+    except TypeError:  # Unhashable (malformed) entries
+        return decode_target_days(target_days)
+
+
+def is_day_scheduled(frequency: Frequency, mask: int) -> bool:
+    """Whether a habit is due on given weekdays rather than N times a period.
+
+    Same split as ``expected_occurrences``: daily habits, and weekly habits
+    with target days, are due on their weekdays; the others are due every
+    day until ``target_count`` completion days are reached in the period.
+    """
+    return frequency == Frequency.DAILY or (
+        frequency == Frequency.WEEKLY and mask != ALL_DAYS
+    )
+
+
+def period_window(frequency: Frequency, day: date) -> Tuple[date, date]:
+    """First and last day of the week, month or year containing ``day``."""
+    if frequency == Frequency.YEARLY:
+        return date(day.year, 1, 1), date(day.year, 12, 31)
+    period = RollupPeriod.WEEK if frequency == Frequency.WEEKLY else RollupPeriod.MONTH
+    start = period_start(period, day)
+    return start, next_period_start(period, start) - timedelta(days=1)
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Positions of the set bits of ``bits``, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class HabitDueEvaluator:
+    """Finds due and missed habits of all users, a chunk of habits at a time.
+
+    Each chunk is evaluated with set operations on Python integers used as
+    bitsets (bit ``i`` stands for the ``i``-th habit of the chunk): habits
+    are grouped by (weekday mask, local weekday), so the schedule test runs
+    once per group instead of once per habit, and completions and period
+    progress are combined with ``&``, ``|`` and ``~`` over the whole chunk.
+    A chunk costs three queries whatever its size.
+    """
+
+    CHUNK_SIZE = 5000
+
+    @staticmethod
+    async def evaluate(
+        now: Optional[datetime] = None, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[List[HabitDue], List[HabitDue]]]:
+        """Yield ``(due, missed)`` per chunk of active habits.
+
+        A habit is due when it is scheduled on the user's local today (or
+        its period target is not reached yet) and today's completions do not
+        cover it. It is missed when it was scheduled on the local yesterday
+        without being completed, or when its period ended yesterday short of
+        ``target_count`` completion days.
+        """
+        now = now or timezone.now()
+        habits = Habit.filter(is_active=True, deleted_at__isnull=True)
+        async for rows in keyset_chunks(
+            habits, HABIT_FIELDS, chunk_size or HabitDueEvaluator.CHUNK_SIZE
+        ):
+            yield await HabitDueEvaluator._evaluate_chunk(rows, now)
+
+    @staticmethod
+    async def _evaluate_chunk(
+        rows: List[dict], now: datetime
+    ) -> Tuple[List[HabitDue], List[HabitDue]]:
+        position = {row["id"]: i for i, row in enumerate(rows)}
+        todays: List[date] = []
+        created: List[date] = []
+        by_schedule: Dict[Tuple[int, int], int] = defaultdict(int)
+        counted = created_today = 0
+        for i, row in enumerate(rows):
+            zone = get_zone(row["user__timezone"])
+            today = now.astimezone(zone).date()
+            todays.append(today)
+            created.append(row["created_at"].astimezone(zone).date())
+            if created[i] >= today:
+                created_today |= 1 << i
+            frequency = Frequency(row["frequency"])
+            mask = habit_mask(row["target_days"])
+            if is_day_scheduled(frequency, mask):
+                by_schedule[(mask, today.weekday())] |= 1 << i
+            else:
+                counted |= 1 << i
+
+        scheduled_today = scheduled_yesterday = 0
+        for (mask, weekday), bits in by_schedule.items():
+            if mask >> weekday & 1:
+                scheduled_today |= bits
+            if mask >> (weekday - 1) % 7 & 1:
+                scheduled_yesterday |= bits
+
+        done_today, done_yesterday = await HabitDueEvaluator._completions(
+            rows, position, todays
+        )
+        reached_now, ended_short = await HabitDueEvaluator._period_progress(
+            rows, position, todays, created, counted
+        )
+
+        due = (scheduled_today | (counted & ~reached_now)) & ~done_today
+        missed = (
+            (scheduled_yesterday & ~done_yesterday) | ended_short
+        ) & ~created_today
+
+        def items(bits: int) -> List[HabitDue]:
+            return [
+                HabitDue(
+                    habit_id=rows[i]["id"],
+                    user_id=rows[i]["user_id"],
+                    template_id=rows[i]["template_id"],
+                    local_date=todays[i],
+                    reminder_time=rows[i]["reminder_time"],
+                    timezone=rows[i]["user__timezone"],
+                    notification_type=NotificationType(
+                        rows[i]["user__preferred_notification_type"]
+                    ),
+                )
+                for i in iter_bits(bits)
+            ]
+
+        return items(due), items(missed)
+
+    @staticmethod
+    async def _completions(
+        rows: List[dict], position: Dict[UUID, int], todays: List[date]
+    ) -> Tuple[int, int]:
+        """Bitsets of habits completed on their local today and yesterday.
+
+        Daily habits need ``target_count`` completions on the day, others one.
+        """
+        days = set(todays) | {today - timedelta(days=1) for today in todays}
+        completions = await HabitCompletion.filter(
+            habit_id__in=list(position),
+            completion_date__in=days,
+            deleted_at__isnull=True,
+        ).values("habit_id", "completion_date", "completed_count")
+
+        done_today = done_yesterday = 0
+        for completion in completions:
+            i = position[completion["habit_id"]]
+            row = rows[i]
+            required = row["target_count"] if row["frequency"] == Frequency.DAILY else 1
+            if completion["completed_count"] < required:
+                continue
+            if completion["completion_date"] == todays[i]:
+                done_today |= 1 << i
+            elif completion["completion_date"] == todays[i] - timedelta(days=1):
+                done_yesterday |= 1 << i
+        return done_today, done_yesterday
+
+    @staticmethod
+    async def _period_progress(
+        rows: List[dict],
+        position: Dict[UUID, int],
+        todays: List[date],
+        created: List[date],
+        counted: int,
+    ) -> Tuple[int, int]:
+        """Bitsets of period-counted habits that reached their target in the
+        current period, and of those whose period ended yesterday short of it
+        (only if the habit existed for the whole period).
+
+        Progress is read from the week and month completion rollups (months
+        summed for yearly habits), never from raw completions.
+        """
+        if not counted:
+            return 0, 0
+        windows: Dict[int, Tuple[Tuple[date, date], Tuple[date, date]]] = {}
+        for i in iter_bits(counted):
+            frequency = Frequency(rows[i]["frequency"])
+            yesterday = todays[i] - timedelta(days=1)
+            windows[i] = (
+                period_window(frequency, todays[i]),
+                period_window(frequency, yesterday),
+            )
+        earliest = min(previous[0] for _, previous in windows.values())
+        rollups = await HabitCompletionRollup.filter(
+            habit_id__in=[rows[i]["id"] for i in windows],
+            period__in=[RollupPeriod.WEEK, RollupPeriod.MONTH],
+            period_start__gte=earliest,
+            deleted_at__isnull=True,
+        ).values("habit_id", "period", "period_start", "completion_days")
+
+        by_habit: Dict[int, List[dict]] = defaultdict(list)
+        for rollup in rollups:
+            by_habit[position[rollup["habit_id"]]].append(rollup)
+
+        reached_now = ended_short = 0
+        for i, (current, previous) in windows.items():
+            frequency = Frequency(rows[i]["frequency"])
+            period = (
+                RollupPeriod.WEEK
+                if frequency == Frequency.WEEKLY
+                else RollupPeriod.MONTH
+            )
+
+            def progress(window: Tuple[date, date]) -> int:
+                return sum(
+                    rollup["completion_days"]
+                    for rollup in by_habit[i]
+                    if rollup["period"] == period
+                    and window[0] <= rollup["period_start"] <= window[1]
+                )
+
+            target = rows[i]["target_count"]
+            if progress(current) >= target:
+                reached_now |= 1 << i
+            if (
+                current != previous
+                and created[i] <= previous[0]
+                and progress(previous) < target
+            ):
+                ended_short |= 1 << i
+        return reached_now, ended_short
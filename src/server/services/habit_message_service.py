@@ -0,0 +1,164 @@
+import random
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from src.database.models import HabitTemplateMessage
+from src.database.models.enums import MessageType
+from src.server.schemas.habit_schemas import HabitTemplateMessageResponse
+from src.server.services.habit_template_service import (
+    CatalogSnapshot,
+    HabitTemplateCatalog,
+)
+
+
+MessageKey = Tuple[UUID, MessageType]
+
+
+class AliasTable:
+    """Walker's alias method: O(1) sampling from a fixed discrete distribution.
+
+    Built in O(n) with Vose's algorithm; each sample draws a column uniformly
+    and then either keeps it or takes its alias.
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding errors.
+
+    def sample(self, rng: random.Random) -> int:
+        column = int(rng.random() * len(self.prob))
+        return column if rng.random() < self.prob[column] else self.alias[column]
+
+
+def message_weights(usage_counts: Sequence[int]) -> List[float]:
+    """Selection weights that favor the less used messages of a group.
+
+    The least used message weighs 1; a message used ``k`` more times weighs
+    ``1 / (1 + k)``, so rotation depends on relative, not absolute, usage.
+    """
+    least = min(usage_counts)
+    return [1.0 / (1 + count - least) for count in usage_counts]
+
+
+class HabitMessageSelector:
+    """Picks notification messages per (template, message type).
+
+    Alias tables are built from the catalog snapshot and the messages'
+    ``usage_count``. Selections are counted in memory and written back by
+    ``flush`` with one batched UPDATE per distinct increment, instead of one
+    write per notification; the tables are rebuilt from the new counts then.
+    """
+
+    FLUSH_THRESHOLD = 1000
+
+    _version: Optional[int] = None
+    _messages: Dict[MessageKey, List[HabitTemplateMessageResponse]] = {}
+    _tables: Dict[MessageKey, AliasTable] = {}
+    _counts: Dict[UUID, int] = {}
+    _pending: Counter = Counter()
+    _rng = random.Random()
+
+    @classmethod
+    async def select(
+        cls,
+        template_id: UUID,
+        message_type: MessageType,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[HabitTemplateMessageResponse]:
+        """A message of the template for this type, or ``None`` if it has none."""
+        snapshot = await HabitTemplateCatalog.get()
+        if snapshot.version != cls._version:
+            await cls._load(snapshot)
+
+        key = (template_id, message_type)
+        table = cls._tables.get(key)
+        if table is None:
+            return None
+        message = cls._messages[key][table.sample(rng or cls._rng)]
+        cls._pending[message.id] += 1
+        if cls._pending.total() >= cls.FLUSH_THRESHOLD:
+            await cls.flush()
+        return message
+
+    @classmethod
+    async def _load(cls, snapshot: CatalogSnapshot) -> None:
+        messages: Dict[MessageKey, List[HabitTemplateMessageResponse]] = defaultdict(
+            list
+        )
+        for template in snapshot.templates.values():
+            for message in template.messages:
+                messages[(template.id, message.message_type)].append(message)
+        cls._messages = dict(messages)
+        cls._version = snapshot.version
+        await cls._reload_counts()
+
+    @classmethod
+    async def _reload_counts(cls) -> None:
+        """Read ``usage_count`` (including other processes' flushes) and rebuild."""
+        ids = [message.id for group in cls._messages.values() for message in group]
+        cls._counts = dict(
+            await HabitTemplateMessage.filter(id__in=ids).values_list(
+                "id", "usage_count"
+            )
+        )
+        cls._tables = {
+            key: AliasTable(
+                message_weights(
+                    [
+                        cls._counts.get(message.id, 0) + cls._pending[message.id]
+                        for message in group
+                    ]
+                )
+            )
+            for key, group in cls._messages.items()
+        }
+
+    @classmethod
+    async def flush(cls) -> int:
+        """Write buffered selections to ``usage_count``.
+
+        Returns:
+            Number of selections written.
+        """
+        if not cls._pending:
+            return 0
+        pending, cls._pending = cls._pending, Counter()
+        by_increment: Dict[int, List[UUID]] = defaultdict(list)
+        for message_id, n in pending.items():
+            by_increment[n].append(message_id)
+        try:
+            async with in_transaction():
+                for n, message_ids in by_increment.items():
+                    await HabitTemplateMessage.filter(id__in=message_ids).update(
+                        usage_count=F("usage_count") + n
+                    )
+        except Exception:
+            cls._pending.update(pending)  # Kept for the next flush
+            raise
+        await cls._reload_counts()
+        return pending.total()
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop tables and unflushed selections."""
+        cls._version = None
+        cls._messages = {}
+        cls._tables = {}
+        cls._counts = {}
+        cls._pending = Counter()
@@ -0,0 +1,384 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.functions import Sum
+from tortoise.transactions import in_transaction
+from src.database.models import Habit, HabitCompletion, HabitCompletionRollup, User
+from src.database.models.enums import Frequency, RollupPeriod
+from src.server.schemas.habit_schemas import (
+    HabitAnalyticsEntry,
+    HabitAnalyticsGroup,
+    HabitAnalyticsResponse,
+    HabitCompletionCreate,
+    HabitPeriodStats,
+)
+from src.server.utils.responses import HabitNotFoundError
+
+
+WEEKDAY_NAMES = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+ALL_DAYS = 0b1111111
+
+# Average period lengths used to pro-rate target_count for habits that are
+# not scheduled on specific weekdays.
+_PERIOD_DAYS = {
+    Frequency.WEEKLY: 7.0,
+    Frequency.MONTHLY: 30.4375,
+    Frequency.YEARLY: 365.25,
+}
+
+
+def decode_target_days(target_days) -> int:
+    """Decode a habit's ``target_days`` JSON into a weekday bitmask.
+
+    Bit 0 is Monday and bit 6 is Sunday, matching ``date.weekday()``. Both
+    weekday numbers and (abbreviated) English day names are accepted. An
+    empty or missing value means every day.
+    """
+    if not target_days:
+        return ALL_DAYS
+
+    mask = 0
+    for day in target_days:
+        if isinstance(day, int) and 0 <= day <= 6:
+            mask |= 1 << day
+        elif isinstance(day, str) and day[:3].lower() in WEEKDAY_NAMES:
+            mask |= 1 << WEEKDAY_NAMES.index(day[:3].lower())
+    return mask or ALL_DAYS
+
+
+def target_days_key(mask: int) -> str:
+    """Stable, human readable key for a weekday bitmask."""
+    if mask == ALL_DAYS:
+        return "all"
+    return ",".join(name for i, name in enumerate(WEEKDAY_NAMES) if mask & (1 << i))
+
+
+def count_weekdays(mask: int, start: date, end: date) -> int:
+    """Count the days in ``[start, end]`` whose weekday is set in ``mask``."""
+    if end < start:
+        return 0
+    days = (end - start).days + 1
+    full_weeks, remainder = divmod(days, 7)
+    count = full_weeks * bin(mask).count("1")
+    weekday = start.weekday()
+    for offset in range(remainder):
+        if mask & (1 << ((weekday + offset) % 7)):
+            count += 1
+    return count
+
+
+def expected_occurrences(
+    frequency: Frequency, mask: int, target_count: int, start: date, end: date
+) -> float:
+    """Number of completion days a habit is expected to have in ``[start, end]``."""
+    if end < start:
+        return 0.0
+    if frequency == Frequency.DAILY or (
+        frequency == Frequency.WEEKLY and mask != ALL_DAYS
+    ):
+        return float(count_weekdays(mask, start, end))
+    days = (end - start).days + 1
+    return target_count * days / _PERIOD_DAYS[frequency]
+
+
+def period_start(period: RollupPeriod, day: date) -> date:
+    """First day of the rollup period containing ``day``."""
+    if period == RollupPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == RollupPeriod.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_period_start(period: RollupPeriod, start: date) -> date:
+    """First day of the rollup period following the one starting at ``start``."""
+    if period == RollupPeriod.WEEK:
+        return start + timedelta(days=7)
+    if period == RollupPeriod.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _completion_rate(completion_days: int, expected: float) -> Optional[float]:
+    if expected <= 0:
+        return None
+    return round(min(1.0, completion_days / expected), 4)
+
+
+class HabitService:
+    """Service layer for habit operations."""
+
+    @staticmethod
+    async def get_habit_by_id(user: User, habit_id: UUID) -> Habit:
+        """Get a specific habit by ID for the user."""
+        habit = await Habit.filter(
+            id=habit_id, user=user, deleted_at__isnull=True
+        ).first()
+
+        if not habit:
+            raise HabitNotFoundError(str(habit_id))
+
+        return habit
+
+    @staticmethod
+    async def record_completion(
+        user: User, habit_id: UUID, completion_data: HabitCompletionCreate
+    ) -> Tuple[HabitCompletion, int]:
+        """Record a completion for a habit.
+
+        Completions are kept as one row per habit and day (enforced by a
+        unique index); repeated completions on the same day increase
+        ``completed_count``.
+
+        Returns:
+            The completion row and the number of newly completed days (0 or 1),
+            which is what the rollup aggregator needs to apply.
+        """
+        habit = await HabitService.get_habit_by_id(user, habit_id)
+        completion_date = completion_data.completion_date or date.today()
+
+        async with in_transaction():
+            today = HabitCompletion.filter(
+                habit=habit, completion_date=completion_date, deleted_at__isnull=True
+            )
+            completion = await today.select_for_update().first()
+            if completion is None:
+                try:
+                    # Savepoint, so a conflict leaves the transaction usable.
+                    async with in_transaction():
+                        completion = await HabitCompletion.create(
+                            habit=habit,
+                            completion_date=completion_date,
+                            completed_count=completion_data.completed_count,
+                            notes=completion_data.notes,
+                        )
+                    return completion, 1
+                except IntegrityError:
+                    # Another request created the day's row first; add to it.
+                    completion = await today.select_for_update().get()
+
+            completion.completed_count += completion_data.completed_count
+            if completion_data.notes:
+                completion.notes = completion_data.notes
+            await completion.save()
+            return completion, 0
+
+
+class HabitRollupService:
+    """Maintains and reads ``HabitCompletionRollup`` rows."""
+
+    PERIODS = (RollupPeriod.DAY, RollupPeriod.WEEK, RollupPeriod.MONTH)
+    REBUILD_CHUNK_SIZE = 500
+
+    @staticmethod
+    async def apply_completion(
+        user_id: UUID,
+        habit_id: UUID,
+        completion_date: date,
+        completed_count: int,
+        completion_days: int,
+    ) -> None:
+        """Add a completion delta to the day, week and month rollups."""
+        for period in HabitRollupService.PERIODS:
+            start = period_start(period, completion_date)
+            rollup = HabitCompletionRollup.filter(
+                habit_id=habit_id, period=period, period_start=start
+            )
+            increment = {
+                "completed_count": F("completed_count") + completed_count,
+                "completion_days": F("completion_days") + completion_days,
+            }
+            if await rollup.update(**increment):
+                continue
+            try:
+                await HabitCompletionRollup.create(
+                    user_id=user_id,
+                    habit_id=habit_id,
+                    period=period,
+                    period_start=start,
+                    completed_count=completed_count,
+                    completion_days=completion_days,
+                )
+            except IntegrityError:
+                # Another worker created the row first; apply our delta on top.
+                await rollup.update(**increment)
+
+    @staticmethod
+    async def rebuild(habit_ids: Optional[Iterable[UUID]] = None) -> int:
+        """Recompute rollups from raw completions.
+
+        Used to backfill rollups for existing data or to repair drift. Habits
+        are processed in chunks and completions are grouped per day in SQL, so
+        memory is bounded by the number of habit-days in one chunk.
+
+        Returns:
+            Number of rollup rows written.
+        """
+        habits = Habit.all()
+        if habit_ids is not None:
+            habits = habits.filter(id__in=list(habit_ids))
+        habit_rows = await habits.values("id", "user_id")
+
+        written = 0
+        chunk_size = HabitRollupService.REBUILD_CHUNK_SIZE
+        for offset in range(0, len(habit_rows), chunk_size):
+            chunk = habit_rows[offset : offset + chunk_size]
+            user_by_habit = {row["id"]: row["user_id"] for row in chunk}
+
+            daily = (
+                await HabitCompletion.filter(
+                    habit_id__in=list(user_by_habit), deleted_at__isnull=True
+                )
+                .annotate(total=Sum("completed_count"))
+                .group_by("habit_id", "completion_date")
+                .values("habit_id", "completion_date", "total")
+            )
+
+            buckets: Dict[Tuple, List[int]] = defaultdict(lambda: [0, 0])
+            for row in daily:
+                for period in HabitRollupService.PERIODS:
+                    key = (
+                        row["habit_id"],
+                        period,
+                        period_start(period, row["completion_date"]),
+                    )
+                    buckets[key][0] += row["total"] or 0
+                    buckets[key][1] += 1
+
+            rollups = [
+                HabitCompletionRollup(
+                    user_id=user_by_habit[habit_id],
+                    habit_id=habit_id,
+                    period=period,
+                    period_start=start,
+                    completed_count=counts[0],
+                    completion_days=counts[1],
+                )
+                for (habit_id, period, start), counts in buckets.items()
+            ]
+
+            async with in_transaction():
+                await HabitCompletionRollup.filter(
+                    habit_id__in=list(user_by_habit)
+                ).delete()
+                await HabitCompletionRollup.bulk_create(rollups, batch_size=1000)
+            written += len(rollups)
+
+        return written
+
+    @staticmethod
+    async def get_analytics(
+        user: User, period: RollupPeriod, date_from: date, date_to: date
+    ) -> HabitAnalyticsResponse:
+        """Completion rates per habit, frequency and target days.
+
+        Reads only pre-aggregated rollup rows; raw completions are never
+        scanned.
+        """
+        habits = await Habit.filter(user=user, deleted_at__isnull=True).values(
+            "id", "name", "frequency", "target_days", "target_count", "created_at"
+        )
+        rollups = await HabitCompletionRollup.filter(
+            user=user,
+            period=period,
+            period_start__gte=period_start(period, date_from),
+            period_start__lte=date_to,
+            deleted_at__isnull=True,
+        ).values("habit_id", "period_start", "completed_count", "completion_days")
+
+        rollup_map = {(row["habit_id"], row["period_start"]): row for row in rollups}
+        today = date.today()
+        entries: List[HabitAnalyticsEntry] = []
+        groups: Dict[str, Dict[str, Dict]] = {"frequency": {}, "target_days": {}}
+
+        for habit in habits:
+            frequency = Frequency(habit["frequency"])
+            mask = decode_target_days(habit["target_days"])
+            active_from = max(date_from, habit["created_at"].date())
+            active_to = min(date_to, today)
+
+            periods: List[HabitPeriodStats] = []
+            start = period_start(period, date_from)
+            while start <= date_to:
+                end = next_period_start(period, start) - timedelta(days=1)
+                row = rollup_map.get((habit["id"], start), {})
+                expected = expected_occurrences(
+                    frequency,
+                    mask,
+                    habit["target_count"],
+                    max(start, active_from),
+                    min(end, active_to),
+                )
+                completion_days = row.get("completion_days", 0)
+                periods.append(
+                    HabitPeriodStats(
+                        period_start=start,
+                        completed_count=row.get("completed_count", 0),
+                        completion_days=completion_days,
+                        expected=round(expected, 4),
+                        completion_rate=_completion_rate(completion_days, expected),
+                    )
+                )
+                start = next_period_start(period, start)
+
+            completed_count = sum(p.completed_count for p in periods)
+            completion_days = sum(p.completion_days for p in periods)
+            expected = sum(p.expected for p in periods)
+            entries.append(
+                HabitAnalyticsEntry(
+                    habit_id=habit["id"],
+                    name=habit["name"],
+                    frequency=frequency,
+                    target_days=habit["target_days"],
+                    completed_count=completed_count,
+                    completion_days=completion_days,
+                    expected=round(expected, 4),
+                    completion_rate=_completion_rate(completion_days, expected),
+                    periods=periods,
+                )
+            )
+
+            for group, key in (
+                ("frequency", frequency.value),
+                ("target_days", target_days_key(mask)),
+            ):
+                totals = groups[group].setdefault(
+                    key,
+                    {
+                        "habit_count": 0,
+                        "completed_count": 0,
+                        "completion_days": 0,
+                        "expected": 0.0,
+                    },
+                )
+                totals["habit_count"] += 1
+                totals["completed_count"] += completed_count
+                totals["completion_days"] += completion_days
+                totals["expected"] += expected
+
+        def _groups(name: str) -> List[HabitAnalyticsGroup]:
+            return [
+                HabitAnalyticsGroup(
+                    key=key,
+                    habit_count=totals["habit_count"],
+                    completed_count=totals["completed_count"],
+                    completion_days=totals["completion_days"],
+                    expected=round(totals["expected"], 4),
+                    completion_rate=_completion_rate(
+                        totals["completion_days"], totals["expected"]
+                    ),
+                )
+                for key, totals in sorted(groups[name].items())
+            ]
+
+        return HabitAnalyticsResponse(
+            period=period,
+            date_from=date_from,
+            date_to=date_to,
+            habits=entries,
+            by_frequency=_groups("frequency"),
+            by_target_days=_groups("target_days"),
+        )
@@ -0,0 +1,158 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from src.database.models import HabitTemplate, HabitTemplateMessage
+from src.database.queries import fetch_all
+from src.server.schemas.habit_schemas import (
+    HabitTemplateCategory,
+    HabitTemplateMessageResponse,
+    HabitTemplateResponse,
+)
+from src.server.utils.etag import make_etag
+
+
+# Changes anywhere in the two tables, including deactivations and soft
+# deletes (which bump updated_at) and hard deletes (which change the counts).
+CATALOG_MARKER_SQL = """
+SELECT
+    (SELECT MAX(updated_at) FROM habit_templates) AS templates_at,
+    (SELECT COUNT(*) FROM habit_templates) AS templates,
+    (SELECT MAX(updated_at) FROM habit_template_messages) AS messages_at,
+    (SELECT COUNT(*) FROM habit_template_messages) AS messages
+"""
+
+_EMPTY_CATEGORY = b'{"categories":[]}'
+# Template columns copied into responses (``messages`` is the reverse relation).
+TEMPLATE_FIELDS = tuple(
+    name for name in HabitTemplateResponse.model_fields if name != "messages"
+)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """All active habit templates with their active messages.
+
+    ``body`` and ``category_bodies`` are the serialized responses, built once
+    per snapshot; ``version`` increases each time the content changes.
+    """
+
+    version: int = 0
+    marker: Tuple = ()
+    templates: Dict[UUID, HabitTemplateResponse] = field(default_factory=dict)
+    body: bytes = _EMPTY_CATEGORY
+    category_bodies: Dict[str, bytes] = field(default_factory=dict)
+    etag: str = make_etag(_EMPTY_CATEGORY)
+
+    def response(self, category: Optional[str] = None) -> Tuple[bytes, str]:
+        """Serialized catalog (or one category of it) and its ETag."""
+        if category is None:
+            return self.body, self.etag
+        body = self.category_bodies.get(category, _EMPTY_CATEGORY)
+        return body, make_etag(self.etag, category)
+
+
+class HabitTemplateCatalog:
+    """Per-process, read-only snapshot of the habit template catalog.
+
+    Templates are reference data that only change through admin edits, so
+    the catalog is loaded at startup and requests are served from memory.
+    Admin tooling running in the same process calls ``refresh`` after an
+    edit; other processes notice the change with one cheap marker query at
+    most every ``CHECK_SECONDS``.
+    """
+
+    CHECK_SECONDS = 60.0
+
+    _snapshot: Optional[CatalogSnapshot] = None
+    _checked_at: float = 0.0
+
+    @staticmethod
+    async def marker() -> Tuple:
+        row = (await fetch_all(CATALOG_MARKER_SQL))[0]
+        return tuple(str(value) for value in row.values())
+
+    @staticmethod
+    async def load() -> List[HabitTemplateResponse]:
+        """Active templates in display order, with their active messages."""
+        templates = await HabitTemplate.filter(
+            is_active=True, deleted_at__isnull=True
+        ).order_by("category", "sort_order", "name")
+        messages = await HabitTemplateMessage.filter(
+            habit_template_id__in=[template.id for template in templates],
+            is_active=True,
+            deleted_at__isnull=True,
+        ).order_by("message_type", "created_at")
+
+        by_template: Dict[UUID, List[HabitTemplateMessageResponse]] = defaultdict(list)
+        for message in messages:
+            by_template[message.habit_template_id].append(
+                HabitTemplateMessageResponse.model_validate(message)
+            )
+        return [
+            HabitTemplateResponse(
+                **{name: getattr(template, name) for name in TEMPLATE_FIELDS},
+                messages=by_template[template.id],
+            )
+            for template in templates
+        ]
+
+    @classmethod
+    async def refresh(cls, marker: Optional[Tuple] = None) -> CatalogSnapshot:
+        """Reload the catalog from the database and swap the snapshot."""
+        # Taken before loading, so an edit made meanwhile triggers another reload.
+        marker = marker or await cls.marker()
+        templates = await cls.load()
+
+        grouped: Dict[str, List[HabitTemplateResponse]] = defaultdict(list)
+        for template in templates:
+            grouped[template.category].append(template)
+        categories = [
+            HabitTemplateCategory(category=name, templates=items)
+            for name, items in grouped.items()
+        ]
+        body = _catalog_json(categories)
+
+        previous = cls._snapshot
+        etag = make_etag(body)
+        version = previous.version if previous else 0
+        if previous is None or previous.etag != etag:
+            version += 1
+        cls._snapshot = CatalogSnapshot(
+            version=version,
+            marker=marker,
+            templates={template.id: template for template in templates},
+            body=body,
+            category_bodies={
+                category.category: _catalog_json([category]) for category in categories
+            },
+            etag=etag,
+        )
+        cls._checked_at = time.monotonic()
+        return cls._snapshot
+
+    @classmethod
+    async def get(cls) -> CatalogSnapshot:
+        """The current snapshot, reloaded if the tables changed since."""
+        snapshot = cls._snapshot
+        now = time.monotonic()
+        if snapshot is None:
+            return await cls.refresh()
+        if now - cls._checked_at > cls.CHECK_SECONDS:
+            # Set first, so concurrent requests do not all run the check.
+            cls._checked_at = now
+            marker = await cls.marker()
+            if marker != snapshot.marker:
+                return await cls.refresh(marker)
+        return snapshot
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._snapshot = None
+        cls._checked_at = 0.0
+
+
+def _catalog_json(categories: List[HabitTemplateCategory]) -> bytes:
+    items = ",".join(category.model_dump_json() for category in categories)
+    return f'{{"categories":[{items}]}}'.encode()
@@ -0,0 +1,219 @@
+"""Push notification fan-out to APNs, FCM and Web Push through a gateway.
+
+Notifications are expanded to the users' active devices, grouped by the
+provider serving each device, and posted to the push gateway in batches of
+the provider's size over one pooled HTTP client. Every batch answers with a
+result per message; devices whose token or endpoint the provider reports
+as invalid are deactivated with one bulk update.
+
+Gateway contract, per provider (``apns``, ``fcm``, ``webpush``)::
+
+    POST {PUSH_GATEWAY_URL}/{provider}/send
+    {"messages": [{"token": ..., "title": ..., "body": ..., "data": {...}}]}
+    -> {"results": [{"status": "ok" | "invalid_token" | "error", "error": ...}]}
+"""
+
+import asyncio
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+from uuid import UUID
+import httpx
+from src.database.models import UserDevice
+from src.database.models.enums import DeviceType, NotificationType
+
+
+@dataclass(frozen=True)
+class PushProvider:
+    """A push service, its batch size and the device field it delivers to."""
+
+    name: str
+    batch_size: int
+    address_field: str
+
+
+APNS = PushProvider("apns", 100, "push_token")
+FCM = PushProvider("fcm", 500, "push_token")
+WEB_PUSH = PushProvider("webpush", 100, "endpoint_url")
+
+PROVIDERS = {
+    DeviceType.IOS: APNS,
+    DeviceType.ANDROID: FCM,
+    DeviceType.WEB: WEB_PUSH,
+    DeviceType.DESKTOP: WEB_PUSH,
+}
+
+# Devices that receive each notification type.
+NOTIFICATION_DEVICE_TYPES = {
+    NotificationType.PUSH: (DeviceType.IOS, DeviceType.ANDROID),
+    NotificationType.WEB_PUSH: (DeviceType.WEB, DeviceType.DESKTOP),
+}
+
+
+@dataclass
+class PushNotification:
+    """One notification for all of a user's devices of the matching type.
+
+    ``key`` is the caller's identifier (e.g. a ``NotificationQueue`` id),
+    used in the report.
+    """
+
+    key: Hashable
+    user_id: UUID
+    notification_type: NotificationType
+    title: str
+    body: str
+    data: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class PushReport:
+    """Outcome of a fan-out: notifications reached on at least one device,
+    errors of those that were not, and devices deactivated."""
+
+    delivered: Set[Hashable] = field(default_factory=set)
+    failed: Dict[Hashable, str] = field(default_factory=dict)
+    deactivated: int = 0
+    batches: int = 0
+
+
+# A message queued for a provider: notification key, device id, payload.
+_Item = Tuple[Hashable, UUID, dict]
+
+
+class PushGateway:
+    """The process-wide, pooled HTTP client for the push gateway.
+
+    Connections are kept alive between batches and runs; at most
+    ``PUSH_MAX_CONNECTIONS`` are open at once.
+    """
+
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def configure(
+        cls,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> httpx.AsyncClient:
+        """Create the client; ``transport`` lets tests use an in-process server."""
+        max_connections = int(os.getenv("PUSH_MAX_CONNECTIONS", "20"))
+        cls._client = httpx.AsyncClient(
+            base_url=base_url or os.getenv("PUSH_GATEWAY_URL", "http://127.0.0.1:8090"),
+            transport=transport,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        return cls._client
+
+    @classmethod
+    def client(cls) -> httpx.AsyncClient:
+        return cls._client or cls.configure()
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+
+
+class PushService:
+    """Fans notifications out to devices, batched per provider."""
+
+    CONCURRENCY = 8
+
+    @staticmethod
+    async def send(notifications: List[PushNotification]) -> PushReport:
+        """Deliver notifications to their users' active devices.
+
+        Costs one query to load devices, one request per provider batch
+        (``CONCURRENCY`` in flight) and one update for dead devices.
+        """
+        report = PushReport()
+        if not notifications:
+            return report
+        devices: Dict[UUID, List[dict]] = defaultdict(list)
+        for device in await UserDevice.filter(
+            user_id__in={n.user_id for n in notifications},
+            is_active=True,
+            deleted_at__isnull=True,
+        ).values("id", "user_id", "device_type", "push_token", "endpoint_url"):
+            devices[device["user_id"]].append(device)
+
+        queues: Dict[PushProvider, List[_Item]] = defaultdict(list)
+        for notification in notifications:
+            accepted = NOTIFICATION_DEVICE_TYPES.get(notification.notification_type, ())
+            payload = {
+                "title": notification.title,
+                "body": notification.body,
+                "data": notification.data,
+            }
+            for device in devices[notification.user_id]:
+                device_type = DeviceType(device["device_type"])
+                provider = PROVIDERS[device_type]
+                address = device[provider.address_field]
+                if device_type in accepted and address:
+                    queues[provider].append(
+                        (notification.key, device["id"], {"token": address, **payload})
+                    )
+
+        batches = [
+            (provider, items[start : start + provider.batch_size])
+            for provider, items in queues.items()
+            for start in range(0, len(items), provider.batch_size)
+        ]
+        report.batches = len(batches)
+        semaphore = asyncio.Semaphore(PushService.CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                PushService._send_batch(provider, batch, semaphore)
+                for provider, batch in batches
+            )
+        )
+
+        dead: Set[UUID] = set()
+        errors: Dict[Hashable, str] = {}
+        for (_, batch), batch_results in zip(batches, results):
+            for (key, device_id, _), result in zip(batch, batch_results):
+                if result.get("status") == "ok":
+                    report.delivered.add(key)
+                elif result.get("status") == "invalid_token":
+                    dead.add(device_id)
+                    errors.setdefault(key, "Invalid device token")
+                else:
+                    errors[key] = result.get("error") or "Push delivery failed"
+
+        for notification in notifications:
+            if notification.key not in report.delivered:
+                report.failed[notification.key] = errors.get(
+                    notification.key, "No active device"
+                )
+        if dead:
+            report.deactivated = await UserDevice.filter(id__in=dead).update(
+                is_active=False
+            )
+        return report
+
+    @staticmethod
+    async def _send_batch(
+        provider: PushProvider, batch: List[_Item], semaphore: asyncio.Semaphore
+    ) -> List[dict]:
+        """Post one batch; a failed request fails every message in it."""
+        async with semaphore:
+            try:
+                response = await PushGateway.client().post(
+                    f"/{provider.name}/send",
+                    json={"messages": [message for _, _, message in batch]},
+                )
+                response.raise_for_status()
+                results = response.json()["results"]
+                if len(results) != len(batch):
+                    raise ValueError("Result count does not match the batch")
+                return results
+            except (httpx.HTTPError, KeyError, ValueError) as e:
+                error = f"{provider.name}: {e or type(e).__name__}"
+                return [{"status": "error", "error": error}] * len(batch)
@@ -0,0 +1,240 @@
+import codecs
+import csv
+import zlib
+from datetime import datetime
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Set, Tuple
+from uuid import UUID, uuid4
+import orjson
+from pydantic import ValidationError as PydanticValidationError
+from starlette.concurrency import run_in_threadpool
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+from src.database.models import Task, User
+from src.database.models.enums import TaskStatus
+from src.server.schemas.task_schemas import (
+    TaskImportError,
+    TaskImportResponse,
+    TaskImportRow,
+)
+from src.server.services.agenda_service import AgendaCache
+from src.server.services.category_service import CategoryCache
+from src.server.services.dependency_service import DependencyIndex
+from src.server.services.task_stats_service import TaskStatsService, task_key
+
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+READ_BLOCK_SIZE = 64 * 1024
+
+
+def _read_text(source: BinaryIO, compressed: bool) -> Iterator[str]:
+    """Decode (and gunzip) a binary file block by block into text lines."""
+    inflate = zlib.decompressobj(wbits=47) if compressed else None
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while True:
+        block = source.read(READ_BLOCK_SIZE)
+        if inflate:
+            block = inflate.decompress(block) if block else inflate.flush()
+        text = pending + decoder.decode(block, final=not block)
+        # Only "\n" ends a line: splitlines() would also split on U+2028 and
+        # other separators that JSON strings may hold unescaped. A "\r"
+        # before it is whitespace to JSON and a line ending to csv.
+        lines = text.split("\n")
+        # The last piece may be the start of a line continued in the next block.
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+        if not block:
+            if pending:
+                yield pending
+            return
+
+
+def _parents_first(tasks: List[Task]) -> List[Task]:
+    """Order tasks so parents from the same list come before their subtasks."""
+    by_id = {task.id: task for task in tasks}
+    depth: Dict[UUID, int] = {}
+    for task in tasks:
+        chain = []
+        node = task
+        while node.id not in depth and node.parent_task_id in by_id:
+            chain.append(node)
+            node = by_id[node.parent_task_id]
+            if len(chain) > len(tasks):  # Parent cycle within the file
+                break
+        level = depth.setdefault(node.id, 0)
+        for ancestor_or_self in reversed(chain):
+            level += 1
+            depth[ancestor_or_self.id] = level
+    return sorted(tasks, key=lambda task: depth[task.id])
+
+
+def _ndjson_records(lines: Iterator[str]) -> Iterator[Tuple[int, object]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            yield number, e
+
+
+def _csv_records(lines: Iterator[str]) -> Iterator[Tuple[int, object]]:
+    reader = csv.DictReader(lines)
+    for number, row in enumerate(reader, start=1):
+        # Empty CSV cells mean "not set", not empty strings.
+        yield number, {key: value for key, value in row.items() if value != ""}
+
+
+class TaskImportService:
+    """Bulk task import from NDJSON or CSV files, processed in batches."""
+
+    @staticmethod
+    def records(
+        source: BinaryIO, fmt: str, compressed: bool = False
+    ) -> Iterator[Tuple[int, object]]:
+        """Parse a file incrementally into ``(line, dict or error)`` pairs."""
+        lines = _read_text(source, compressed)
+        return _csv_records(lines) if fmt == "csv" else _ndjson_records(lines)
+
+    @staticmethod
+    async def import_tasks(
+        user: User, source: BinaryIO, fmt: str, compressed: bool = False
+    ) -> TaskImportResponse:
+        """Validate and insert tasks ``IMPORT_BATCH_SIZE`` rows at a time.
+
+        Task IDs from the file are kept, so re-importing an export skips the
+        rows that already exist. A parent that only appears later in the file
+        is linked once all rows are inserted.
+        """
+        result = TaskImportResponse(created=0, skipped=0, error_count=0)
+        forward_links: Dict[UUID, Tuple[UUID, int]] = {}
+        records = TaskImportService.records(source, fmt, compressed)
+        # Categories are checked against the cached map, loaded once per import.
+        await CategoryCache.get(user.id, fresh=True)
+
+        while True:
+            # Parsing reads the (spooled) upload file, keep it off the event loop.
+            batch = await run_in_threadpool(
+                lambda: list(islice(records, IMPORT_BATCH_SIZE))
+            )
+            if not batch:
+                break
+            await TaskImportService._import_batch(user, batch, result, forward_links)
+
+        await TaskImportService._link_forward_parents(user, forward_links, result)
+        result.errors.sort(key=lambda error: error.line)
+        if result.created:
+            DependencyIndex.invalidate(user.id)
+            AgendaCache.invalidate(user.id)
+        return result
+
+    @staticmethod
+    def _reject(result: TaskImportResponse, line: int, message: str) -> None:
+        result.error_count += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(TaskImportError(line=line, message=message))
+
+    @staticmethod
+    async def _import_batch(
+        user: User,
+        batch: List[Tuple[int, object]],
+        result: TaskImportResponse,
+        forward_links: Dict[UUID, Tuple[UUID, int]],
+    ) -> None:
+        rows: List[Tuple[int, TaskImportRow]] = []
+        for line, record in batch:
+            if isinstance(record, Exception) or not isinstance(record, dict):
+                TaskImportService._reject(result, line, "Invalid JSON object")
+                continue
+            try:
+                row = TaskImportRow.model_validate(record)
+            except PydanticValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                TaskImportService._reject(result, line, f"{field}: {error['msg']}")
+                continue
+            if row.id is None:
+                row.id = uuid4()
+            rows.append((line, row))
+
+        # Resolve task references of the batch with one query each.
+        existing_ids = set(
+            await Task.filter(id__in={row.id for _, row in rows}).values_list(
+                "id", flat=True
+            )
+        )
+        parent_ids = {row.parent_task_id for _, row in rows if row.parent_task_id}
+        known_parents: Set[UUID] = set(
+            await Task.filter(
+                id__in=parent_ids, user=user, deleted_at__isnull=True
+            ).values_list("id", flat=True)
+        )
+        known_categories = (await CategoryCache.get(user.id)).categories
+
+        accepted: List[Tuple[int, TaskImportRow]] = []
+        for line, row in rows:
+            if row.id in existing_ids:
+                result.skipped += 1
+            elif row.category_id and row.category_id not in known_categories:
+                TaskImportService._reject(result, line, "category_id: not found")
+            else:
+                existing_ids.add(row.id)  # Later duplicates in the file are skipped
+                accepted.append((line, row))
+
+        valid_parents = known_parents | {row.id for _, row in accepted}
+        tasks = []
+        for line, row in accepted:
+            data = row.model_dump(exclude_unset=True)
+            data["id"] = row.id
+            if row.parent_task_id and row.parent_task_id not in valid_parents:
+                # Not inserted yet; it may still appear later in the file.
+                forward_links[row.id] = (row.parent_task_id, line)
+                data["parent_task_id"] = None
+            if row.status == TaskStatus.COMPLETED and not row.completed_at:
+                data["completed_at"] = datetime.now()
+            tasks.append(Task(user_id=user.id, **data))
+
+        if tasks:
+            async with in_transaction():
+                await Task.bulk_create(_parents_first(tasks), batch_size=len(tasks))
+            result.created += len(tasks)
+            await TaskStatsService.apply(
+                user.id, added=[task_key(task.status, task.due_date) for task in tasks]
+            )
+
+    @staticmethod
+    async def _link_forward_parents(
+        user: User,
+        forward_links: Dict[UUID, Tuple[UUID, int]],
+        result: TaskImportResponse,
+    ) -> None:
+        """Set parents that appeared after their subtasks in the file."""
+        links = list(forward_links.items())
+        for start in range(0, len(links), IMPORT_BATCH_SIZE):
+            chunk = links[start : start + IMPORT_BATCH_SIZE]
+            parents = set(
+                await Task.filter(
+                    id__in={parent for _, (parent, _) in chunk},
+                    user=user,
+                    deleted_at__isnull=True,
+                ).values_list("id", flat=True)
+            )
+            children: Dict[UUID, List[UUID]] = {}
+            for child, (parent, line) in chunk:
+                if parent in parents:
+                    children.setdefault(parent, []).append(child)
+                else:
+                    # The task itself was imported, only without its parent.
+                    TaskImportService._reject(
+                        result,
+                        line,
+                        "parent_task_id: not found, imported without parent",
+                    )
+            async with in_transaction():
+                for parent, child_ids in children.items():
+                    await Task.filter(id__in=child_ids).update(
+                        parent_task_id=parent, updated_at=timezone.now()
+                    )
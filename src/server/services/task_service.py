@@ -1,17 +1,89 @@
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
+from tortoise import timezone
 from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
 from src.database.models import Task, User
+from src.database.models.enums import TaskStatus
+from src.database.queries import execute, fetch_all
 from src.server.schemas.task_schemas import (
     TaskCreate,
     TaskUpdate,
     TaskPatch,
     TaskListQueryParams,
+    TaskTreeNode,
+)
+from src.server.services.agenda_service import AgendaCache
+from src.server.services.category_service import CategoryService
+from src.server.services.dependency_service import DependencyIndex
+from src.server.services.task_stats_service import (
+    TaskKey,
+    TaskStatsService,
+    task_key,
 )
 from src.server.utils.responses import TaskNotFoundError, ValidationError
 
 
+# Hard cap on recursion so a corrupted parent chain (A -> B -> A) cannot make
+# the subtree query loop forever.
+MAX_TREE_DEPTH = 64
+
+TASK_SUBTREE_SQL = """
+WITH RECURSIVE subtree (id, depth) AS (
+    SELECT id, 0 FROM tasks
+    WHERE id = ? AND user_id = ? AND deleted_at IS NULL
+    UNION ALL
+    SELECT t.id, s.depth + 1 FROM tasks t
+    JOIN subtree s ON t.parent_task_id = s.id
+    WHERE t.user_id = ? AND t.deleted_at IS NULL AND s.depth < ?
+)
+SELECT
+    t.id, t.user_id, t.title, t.description, t.due_date, t.status, t.priority,
+    t.completion_percentage, t.estimated_duration, t.actual_duration,
+    t.parent_task_id, t.category_id, t.created_at, t.updated_at,
+    t.completed_at, s.depth
+FROM tasks t
+JOIN subtree s ON t.id = s.id
+ORDER BY s.depth, t.created_at
+"""
+
+# Ids of a task and its descendants whose deleted_at matches ``{match}``.
+# Used as a subquery so each cascade step is a single UPDATE per table.
+SUBTREE_IDS_SQL = """
+WITH RECURSIVE subtree (id, depth) AS (
+    SELECT id, 0 FROM tasks
+    WHERE id = ? AND user_id = ? AND {match}
+    UNION ALL
+    SELECT t.id, s.depth + 1 FROM tasks t
+    JOIN subtree s ON t.parent_task_id = s.id
+    WHERE t.user_id = ? AND t.{match} AND s.depth < ?
+)
+SELECT id FROM subtree
+"""
+
+# Changes whenever any of a user's tasks changes: every write sets updated_at
+# (soft deletes included), and the count also catches rows inserted with an
+# older timestamp. Category changes are included because task responses carry
+# the category name and color. Served by the (user_id, updated_at) indexes.
+TASKS_VERSION_SQL = """
+SELECT
+    MAX(updated_at) AS updated_at,
+    COUNT(*) AS total,
+    (SELECT MAX(updated_at) FROM categories WHERE user_id = ?) AS categories_at
+FROM tasks WHERE user_id = ?
+"""
+
+# Rows owned by a task that follow it through cascading delete and restore,
+# as (table, foreign key column, extra condition).
+CASCADE_TABLES = (
+    ("task_reminders", "task_id", ""),
+    ("task_time_logs", "task_id", ""),
+    ("notification_queue", "task_id", "status = 'pending'"),
+)
+
+
 class TaskService:
     """Service layer for task operations."""
 
@@ -28,22 +100,20 @@ class TaskService:
                     "Parent task not found or does not belong to user",
                     {"parent_task_id": str(task_data.parent_task_id)},
                 )
+        await CategoryService.validate_category(user.id, task_data.category_id)
 
         # Create task
         task = await Task.create(user=user, **task_data.model_dump(exclude_unset=True))
-
-        # Load related fields for response
-        await task.fetch_related("user", "parent_task", "category")
+        await TaskStatsService.apply(
+            user.id, added=[task_key(task.status, task.due_date)]
+        )
+        AgendaCache.invalidate(user.id)
         return task
 
     @staticmethod
     async def get_task_by_id(user: User, task_id: UUID) -> Task:
         """Get a specific task by ID for the user."""
-        task = (
-            await Task.filter(id=task_id, user=user, deleted_at__isnull=True)
-            .prefetch_related("user", "parent_task", "category")
-            .first()
-        )
+        task = await Task.filter(id=task_id, user=user, deleted_at__isnull=True).first()
 
         if not task:
             raise TaskNotFoundError(str(task_id))
@@ -54,6 +124,7 @@ class TaskService:
     async def update_task(user: User, task_id: UUID, task_data: TaskUpdate) -> Task:
         """Update a task completely."""
         task = await TaskService.get_task_by_id(user, task_id)
+        before = task_key(task.status, task.due_date)
 
         # Validate parent task if being updated
         if task_data.parent_task_id is not None:
@@ -69,6 +140,7 @@ class TaskService:
                         "Parent task not found or does not belong to user",
                         {"parent_task_id": str(task_data.parent_task_id)},
                     )
+        await CategoryService.validate_category(user.id, task_data.category_id)
 
         # Update task fields
         update_data = task_data.model_dump(exclude_unset=True)
@@ -86,13 +158,18 @@ class TaskService:
             task.completed_at = None
 
         await task.save()
-        await task.fetch_related("user", "parent_task", "category")
+        after = task_key(task.status, task.due_date)
+        if after != before:
+            await TaskStatsService.apply(user.id, removed=[before], added=[after])
+        DependencyIndex.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
         return task
 
     @staticmethod
     async def patch_task(user: User, task_id: UUID, task_data: TaskPatch) -> Task:
         """Partially update a task."""
         task = await TaskService.get_task_by_id(user, task_id)
+        before = task_key(task.status, task.due_date)
 
         # Validate parent task if being updated
         if task_data.parent_task_id is not None:
@@ -108,6 +185,7 @@ class TaskService:
                         "Parent task not found or does not belong to user",
                         {"parent_task_id": str(task_data.parent_task_id)},
                     )
+        await CategoryService.validate_category(user.id, task_data.category_id)
 
         # Update only provided fields
         update_data = task_data.model_dump(exclude_unset=True, exclude_none=False)
@@ -125,21 +203,125 @@ class TaskService:
             task.completed_at = None
 
         await task.save()
-        await task.fetch_related("user", "parent_task", "category")
+        after = task_key(task.status, task.due_date)
+        if after != before:
+            await TaskStatsService.apply(user.id, removed=[before], added=[after])
+        DependencyIndex.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
         return task
 
     @staticmethod
-    async def delete_task(user: User, task_id: UUID) -> Task:
-        """Soft delete a task."""
+    async def delete_task(user: User, task_id: UUID) -> Tuple[Task, Dict[str, int]]:
+        """Soft delete a task together with its whole subtree.
+
+        Subtasks, their reminders, time logs and pending notifications are
+        marked with the same ``deleted_at`` timestamp, one UPDATE per table,
+        so ``restore_task`` can undo exactly this deletion.
+
+        Returns:
+            The deleted task and the number of rows marked per table.
+        """
         task = await TaskService.get_task_by_id(user, task_id)
-        await task.delete()  # This uses the soft delete from BaseModel
-        return task
+        deleted_at = datetime.now()
+        counts, keys = await TaskService._cascade(
+            user,
+            task_id,
+            match="deleted_at IS NULL",
+            match_values=[],
+            deleted_at=deleted_at,
+        )
+        await TaskStatsService.apply(user.id, removed=keys)
+        task.deleted_at = deleted_at
+        DependencyIndex.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
+        return task, counts
 
     @staticmethod
-    async def list_tasks(
-        user: User, query_params: TaskListQueryParams
-    ) -> Tuple[List[Task], int]:
-        """List tasks for the user with filtering, pagination, and sorting."""
+    async def restore_task(user: User, task_id: UUID) -> Tuple[Task, Dict[str, int]]:
+        """Restore a soft-deleted task and everything deleted along with it.
+
+        Only rows carrying the task's own ``deleted_at`` timestamp are
+        restored; subtasks deleted separately beforehand stay deleted.
+        """
+        rows = await fetch_all(
+            "SELECT deleted_at FROM tasks"
+            " WHERE id = ? AND user_id = ? AND deleted_at IS NOT NULL",
+            [task_id, user.id],
+        )
+        if not rows:
+            raise TaskNotFoundError(str(task_id))
+
+        counts, keys = await TaskService._cascade(
+            user,
+            task_id,
+            match="deleted_at = ?",
+            match_values=[rows[0]["deleted_at"]],
+            deleted_at=None,
+        )
+        await TaskStatsService.apply(user.id, added=keys)
+        DependencyIndex.invalidate(user.id)
+        AgendaCache.invalidate(user.id)
+        return await TaskService.get_task_by_id(user, task_id), counts
+
+    @staticmethod
+    async def _cascade(
+        user: User,
+        task_id: UUID,
+        match: str,
+        match_values: list,
+        deleted_at: Optional[datetime],
+    ) -> Tuple[Dict[str, int], List[TaskKey]]:
+        """Set ``deleted_at`` on a subtree and its dependent rows.
+
+        ``updated_at`` is bumped as well, so ``/sync`` reports the change.
+
+        Returns:
+            The number of rows marked per table and the stats keys of the
+            tasks that were marked.
+        """
+        subtree = SUBTREE_IDS_SQL.format(match=match)
+        subtree_values = [
+            task_id,
+            user.id,
+            *match_values,
+            user.id,
+            *match_values,
+            MAX_TREE_DEPTH,
+        ]
+        updated_at = timezone.now()
+        counts = {}
+        async with in_transaction() as connection:
+            # Dependent rows first: the subtree query still needs the tasks'
+            # old deleted_at values to find them.
+            for table, column, condition in CASCADE_TABLES:
+                where = f"{column} IN ({subtree})"
+                if condition:
+                    where = f"{condition} AND {where}"
+                counts[table] = await execute(
+                    f"UPDATE {table} SET deleted_at = ?, updated_at = ?"
+                    f" WHERE {match} AND {where}",
+                    [deleted_at, updated_at, *match_values, *subtree_values],
+                    connection,
+                )
+            keys = [
+                task_key(row["status"], row["due_date"])
+                for row in await fetch_all(
+                    f"SELECT status, due_date FROM tasks WHERE id IN ({subtree})",
+                    subtree_values,
+                    connection,
+                )
+            ]
+            counts["tasks"] = await execute(
+                "UPDATE tasks SET deleted_at = ?, updated_at = ?"
+                f" WHERE id IN ({subtree})",
+                [deleted_at, updated_at, *subtree_values],
+                connection,
+            )
+        return counts, keys
+
+    @staticmethod
+    def build_list_query(user: User, query_params: TaskListQueryParams) -> QuerySet:
+        """Build the filtered (unsorted, unpaginated) task list query."""
         # Build base query
         query = Task.filter(user=user, deleted_at__isnull=True)
 
@@ -168,9 +350,13 @@ class TaskService:
                 Q(title__icontains=search_term) | Q(description__icontains=search_term)
             )
 
-        # Get total count before pagination
-        total_count = await query.count()
+        return query
 
+    @staticmethod
+    def build_page_query(
+        query: QuerySet, query_params: TaskListQueryParams
+    ) -> QuerySet:
+        """Apply sorting and pagination to a task list query."""
         # Apply sorting
         sort_field = query_params.sort_by
         if query_params.sort_order == "desc":
@@ -180,9 +366,106 @@ class TaskService:
 
         # Apply pagination
         offset = (query_params.page - 1) * query_params.page_size
-        query = query.offset(offset).limit(query_params.page_size)
+        return query.offset(offset).limit(query_params.page_size)
+
+    @staticmethod
+    async def tasks_version(user: User) -> Tuple[object, int, object]:
+        """Cheap probe of the user's tasks: latest ``updated_at``, row count and
+        latest category ``updated_at``.
+
+        List responses only change when this does, so it can decide whether
+        a client's cached list is still fresh without running the list query.
+        """
+        rows = await fetch_all(TASKS_VERSION_SQL, [user.id, user.id])
+        return rows[0]["updated_at"], rows[0]["total"], rows[0]["categories_at"]
+
+    @staticmethod
+    async def list_tasks(
+        user: User, query_params: TaskListQueryParams
+    ) -> Tuple[List[Task], int]:
+        """List tasks for the user with filtering, pagination, and sorting."""
+        query = TaskService.build_list_query(user, query_params)
+
+        # Get total count before pagination
+        total_count = await query.count()
+
+        query = TaskService.build_page_query(query, query_params)
 
-        # Execute query with related fields
-        tasks = await query.prefetch_related("user", "parent_task", "category")
+        tasks = await query
 
         return tasks, total_count
+
+    @staticmethod
+    async def get_task_tree(user: User, task_id: UUID, max_depth: int) -> TaskTreeNode:
+        """Fetch a task and its whole subtree with one recursive query.
+
+        Nodes deeper than ``max_depth`` are not returned, but the rolled-up
+        aggregates always cover the full subtree.
+        """
+        rows = await fetch_all(
+            TASK_SUBTREE_SQL, [task_id, user.id, user.id, MAX_TREE_DEPTH]
+        )
+        if not rows:
+            raise TaskNotFoundError(str(task_id))
+        categories = await CategoryService.summaries(
+            user.id, [row["category_id"] for row in rows]
+        )
+
+        # Rows arrive ordered by depth, so parents are always seen first.
+        nodes: Dict[str, dict] = {}
+        children: Dict[str, List[str]] = {}
+        for row in rows:
+            key = str(row["id"])
+            if key in nodes:
+                continue  # Reached twice through a corrupted parent chain
+            nodes[key] = row
+            children[key] = []
+            if row["depth"]:
+                children[str(row["parent_task_id"])].append(key)
+
+        # Aggregate bottom-up: leaves carry the work, parents group it.
+        totals: Dict[str, Tuple[int, int, int, int]] = {}
+        for key in reversed(list(nodes)):
+            row = nodes[key]
+            if children[key]:
+                parts = [totals[child] for child in children[key]]
+                totals[key] = (
+                    sum(p[0] for p in parts) + len(parts),
+                    sum(p[1] for p in parts),
+                    sum(p[2] for p in parts),
+                    sum(p[3] for p in parts),
+                )
+                continue
+            status = TaskStatus(row["status"])
+            counted = status != TaskStatus.CANCELLED
+            completion = (
+                100 if status == TaskStatus.COMPLETED else row["completion_percentage"]
+            )
+            totals[key] = (
+                0,
+                completion if counted else 0,
+                1 if counted else 0,
+                row["estimated_duration"] or 0,
+            )
+
+        def build(key: str) -> TaskTreeNode:
+            row = nodes[key]
+            descendants, completion_sum, leaves, duration = totals[key]
+            return TaskTreeNode(
+                **{k: v for k, v in row.items() if k != "depth"},
+                depth=row["depth"],
+                category=categories.get(UUID(str(row["category_id"])))
+                if row["category_id"]
+                else None,
+                subtask_count=len(children[key]),
+                descendant_count=descendants,
+                rollup_completion_percentage=round(completion_sum / leaves)
+                if leaves
+                else 0,
+                rollup_estimated_duration=duration,
+                subtasks=[build(child) for child in children[key]]
+                if row["depth"] < max_depth
+                else [],
+            )
+
+        return build(str(rows[0]["id"]))
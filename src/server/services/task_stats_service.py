@@ -0,0 +1,218 @@
+from collections import Counter, defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.functions import Count
+from tortoise.transactions import in_transaction
+from src.database.models import Task, TaskDueCount, TaskStats, User
+from src.database.models.enums import TaskStatus
+from src.database.queries import fetch_all
+from src.server.schemas.task_schemas import TaskStatsResponse
+
+
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+# What a live task contributes to the counters: its status and due date.
+TaskKey = Tuple[TaskStatus, Optional[date]]
+
+DUE_COUNTS_SQL = """
+SELECT
+    COALESCE(SUM(CASE WHEN due_date < ? THEN open_count ELSE 0 END), 0) AS overdue,
+    COALESCE(SUM(CASE WHEN due_date = ? THEN open_count ELSE 0 END), 0) AS due_today
+FROM task_due_counts
+WHERE user_id = ? AND due_date <= ?
+"""
+
+
+def task_key(status, due_date) -> TaskKey:
+    """Counter key of a task, from a model or a raw row (text on SQLite)."""
+    if isinstance(due_date, str):
+        due_date = date.fromisoformat(due_date)
+    return TaskStatus(status), due_date
+
+
+class TaskStatsService:
+    """Maintains and reads the ``TaskStats`` and ``TaskDueCount`` counters.
+
+    Counters are created lazily: the first stats request of a user builds
+    them from the tasks table, and until then writes leave them alone.
+    """
+
+    REBUILD_CHUNK_SIZE = 500
+
+    @staticmethod
+    async def apply(
+        user_id: UUID,
+        removed: Iterable[TaskKey] = (),
+        added: Iterable[TaskKey] = (),
+    ) -> None:
+        """Move tasks between counters after a write.
+
+        ``removed`` are the keys of tasks as they were before the write (or
+        of deleted tasks), ``added`` the keys after it (or of new tasks).
+        """
+        status_delta: Counter = Counter()
+        due_delta: Counter = Counter()
+        for sign, keys in ((-1, removed), (1, added)):
+            for status, due_date in keys:
+                status_delta[status.value] += sign
+                if due_date and status in OPEN_STATUSES:
+                    due_delta[due_date] += sign
+
+        status_delta = {field: n for field, n in status_delta.items() if n}
+        if status_delta:
+            updated = await TaskStats.filter(user_id=user_id).update(
+                **{field: F(field) + n for field, n in status_delta.items()}
+            )
+            if not updated:
+                return  # Not built yet; the first read counts everything.
+        elif not due_delta or not await TaskStats.exists(user_id=user_id):
+            return
+
+        for due_date, n in due_delta.items():
+            if not n:
+                continue
+            row = TaskDueCount.filter(user_id=user_id, due_date=due_date)
+            if await row.update(open_count=F("open_count") + n):
+                continue
+            try:
+                await TaskDueCount.create(
+                    user_id=user_id, due_date=due_date, open_count=n
+                )
+            except IntegrityError:
+                # Another worker created the row first; apply our delta on top.
+                await row.update(open_count=F("open_count") + n)
+
+    @staticmethod
+    async def get_stats(user: User, today: Optional[date] = None) -> TaskStatsResponse:
+        """Counts by status plus overdue and due-today counts.
+
+        Reads one ``TaskStats`` row and the user's ``TaskDueCount`` rows up
+        to today, never the tasks themselves (except on first use).
+        """
+        today = today or date.today()
+        stats = await TaskStats.get_or_none(user_id=user.id)
+        if stats is None:
+            await TaskStatsService.rebuild([user.id])
+            stats = await TaskStats.get(user_id=user.id)
+
+        due = (await fetch_all(DUE_COUNTS_SQL, [today, today, user.id, today]))[0]
+        by_status = {status: getattr(stats, status.value) for status in TaskStatus}
+        return TaskStatsResponse(
+            total=sum(by_status.values()),
+            by_status=by_status,
+            overdue=due["overdue"],
+            due_today=due["due_today"],
+        )
+
+    @staticmethod
+    async def _count(user_ids: List[UUID]) -> Tuple[Dict, Dict]:
+        """Actual counters of some users, computed with two GROUP BY queries."""
+        live = Task.filter(user_id__in=user_ids, deleted_at__isnull=True)
+        status_rows = (
+            await live.annotate(count=Count("id"))
+            .group_by("user_id", "status")
+            .values("user_id", "status", "count")
+        )
+        due_rows = (
+            await live.filter(status__in=OPEN_STATUSES, due_date__isnull=False)
+            .annotate(count=Count("id"))
+            .group_by("user_id", "due_date")
+            .values("user_id", "due_date", "count")
+        )
+
+        statuses: Dict[UUID, Dict[str, int]] = {
+            user_id: {status.value: 0 for status in TaskStatus} for user_id in user_ids
+        }
+        for row in status_rows:
+            statuses[row["user_id"]][TaskStatus(row["status"]).value] = row["count"]
+        dues: Dict[UUID, Dict[date, int]] = defaultdict(dict)
+        for row in due_rows:
+            dues[row["user_id"]][row["due_date"]] = row["count"]
+        return statuses, dues
+
+    @staticmethod
+    async def _write(user_ids: List[UUID], statuses: Dict, dues: Dict) -> None:
+        async with in_transaction():
+            await TaskStats.filter(user_id__in=user_ids).delete()
+            await TaskDueCount.filter(user_id__in=user_ids).delete()
+            await TaskStats.bulk_create(
+                [
+                    TaskStats(user_id=user_id, **statuses[user_id])
+                    for user_id in user_ids
+                ],
+                batch_size=1000,
+            )
+            await TaskDueCount.bulk_create(
+                [
+                    TaskDueCount(user_id=user_id, due_date=due_date, open_count=count)
+                    for user_id in user_ids
+                    for due_date, count in dues[user_id].items()
+                ],
+                batch_size=1000,
+            )
+
+    @staticmethod
+    async def rebuild(user_ids: Optional[Iterable[UUID]] = None) -> int:
+        """Recompute the counters of some users (default: all) from their tasks.
+
+        Returns:
+            Number of users whose counters were written.
+        """
+        if user_ids is None:
+            user_ids = await User.all().order_by("id").values_list("id", flat=True)
+        user_ids = list(user_ids)
+
+        chunk_size = TaskStatsService.REBUILD_CHUNK_SIZE
+        for offset in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[offset : offset + chunk_size]
+            await TaskStatsService._write(chunk, *await TaskStatsService._count(chunk))
+        return len(user_ids)
+
+    @staticmethod
+    async def reconcile() -> int:
+        """Compare every built counter with the tasks table and repair drift.
+
+        Counters can drift when a write fails halfway, races a rebuild, or
+        bypasses ``TaskService`` (seeds, manual SQL). Users are checked in
+        chunks and only mismatching users are rewritten.
+
+        Returns:
+            Number of users whose counters were repaired.
+        """
+        repaired = 0
+        last_id = None
+        chunk_size = TaskStatsService.REBUILD_CHUNK_SIZE
+        while True:
+            query = TaskStats.all()
+            if last_id is not None:
+                query = query.filter(user_id__gt=last_id)
+            stored = (
+                await query.order_by("user_id")
+                .limit(chunk_size)
+                .values("user_id", *(status.value for status in TaskStatus))
+            )
+            if not stored:
+                return repaired
+            user_ids = [row.pop("user_id") for row in stored]
+            last_id = user_ids[-1]
+
+            statuses, dues = await TaskStatsService._count(user_ids)
+            stored_dues: Dict[UUID, Dict[date, int]] = defaultdict(dict)
+            for row in await TaskDueCount.filter(
+                user_id__in=user_ids, open_count__not=0
+            ).values("user_id", "due_date", "open_count"):
+                stored_dues[row["user_id"]][row["due_date"]] = row["open_count"]
+
+            drifted = [
+                user_id
+                for user_id, counts in zip(user_ids, stored)
+                if counts != statuses[user_id] or stored_dues[user_id] != dues[user_id]
+            ]
+            if drifted:
+                await TaskStatsService._write(drifted, statuses, dues)
+                repaired += len(drifted)
+            if len(stored) < chunk_size:
+                return repaired
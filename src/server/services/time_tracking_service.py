@@ -0,0 +1,206 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from src.database.models import TaskTimeLog, TaskTimeRollup, User
+from src.database.queries import execute
+from src.server.schemas.time_schemas import (
+    TimeReportCategory,
+    TimeReportDay,
+    TimeReportEntry,
+    TimeReportResponse,
+)
+from src.server.services.agenda_service import AgendaCache, get_zone
+from src.server.services.category_service import CategoryCache
+from src.server.services.task_service import TaskService
+from src.server.utils.responses import ValidationError
+
+
+ADD_DURATION_SQL = """
+UPDATE tasks
+SET actual_duration = COALESCE(actual_duration, 0) + ?, updated_at = ?
+WHERE id = ?
+"""
+
+
+def split_by_day(
+    start: datetime, end: datetime, zone: ZoneInfo
+) -> List[Tuple[date, int]]:
+    """Seconds of ``[start, end)`` falling on each local day in ``zone``."""
+    parts = []
+    local = start.astimezone(zone)
+    end = end.astimezone(zone)
+    while local < end:
+        midnight = datetime.combine(
+            local.date() + timedelta(days=1), datetime.min.time(), zone
+        )
+        # Timestamps, so days around a DST change get their real length.
+        until = min(midnight.timestamp(), end.timestamp())
+        seconds = round(until - local.timestamp())
+        if seconds:
+            parts.append((local.date(), seconds))
+        local = midnight
+    return parts
+
+
+def _minutes(seconds: int) -> int:
+    return round(seconds / 60)
+
+
+class TimeTrackingService:
+    """Task timers, with durations rolled up per day and category on stop."""
+
+    @staticmethod
+    async def start_timer(
+        user: User, task_id: UUID, notes: Optional[str] = None
+    ) -> TaskTimeLog:
+        """Start a timer on a task.
+
+        Raises:
+            TaskNotFoundError: If the task does not exist for the user.
+            ValidationError: If a timer is already running on the task.
+        """
+        task = await TaskService.get_task_by_id(user, task_id)
+        try:
+            return await TaskTimeLog.create(
+                task=task, user=user, start_time=timezone.now(), notes=notes
+            )
+        except IntegrityError:
+            # The unique running-timer index rejected a second timer.
+            raise ValidationError(
+                "A timer is already running for this task", {"task_id": str(task_id)}
+            )
+
+    @staticmethod
+    async def stop_timer(user: User, task_id: UUID) -> TaskTimeLog:
+        """Stop the running timer of a task and account for its duration.
+
+        The duration is added to the task's ``actual_duration`` and to the
+        rollups of the (local) days it spans, under the task's category.
+
+        Raises:
+            TaskNotFoundError: If the task does not exist for the user.
+            ValidationError: If no timer is running on the task.
+        """
+        task = await TaskService.get_task_by_id(user, task_id)
+        log = await TaskTimeLog.filter(
+            task_id=task.id, end_time__isnull=True, deleted_at__isnull=True
+        ).first()
+        if log is None:
+            raise ValidationError(
+                "No timer is running for this task", {"task_id": str(task_id)}
+            )
+
+        end = timezone.now()
+        seconds = max(0, round(end.timestamp() - log.start_time.timestamp()))
+        minutes = _minutes(seconds)
+        async with in_transaction():
+            # Conditional, so a concurrent stop cannot count the timer twice.
+            stopped = await TaskTimeLog.filter(id=log.id, end_time__isnull=True).update(
+                end_time=end, duration_minutes=minutes
+            )
+            if not stopped:
+                raise ValidationError(
+                    "No timer is running for this task", {"task_id": str(task_id)}
+                )
+            await execute(ADD_DURATION_SQL, [minutes, end, task.id])
+            for day, day_seconds in split_by_day(
+                log.start_time, end, get_zone(user.timezone)
+            ):
+                await TimeTrackingService._add(
+                    user.id, day, task.category_id, day_seconds
+                )
+        AgendaCache.invalidate(user.id)
+
+        log.end_time = end
+        log.duration_minutes = minutes
+        return log
+
+    @staticmethod
+    async def _add(
+        user_id: UUID, day: date, category_id: Optional[UUID], seconds: int
+    ) -> None:
+        rollup = TaskTimeRollup.filter(user_id=user_id, day=day)
+        rollup = (
+            rollup.filter(category_id=category_id)
+            if category_id
+            else rollup.filter(category_id__isnull=True)
+        )
+        if await rollup.update(seconds=F("seconds") + seconds):
+            return
+        try:
+            # Savepoint, so a conflict leaves the caller's transaction usable.
+            async with in_transaction():
+                await TaskTimeRollup.create(
+                    user_id=user_id, day=day, category_id=category_id, seconds=seconds
+                )
+        except IntegrityError:
+            # Another stop created the row first; add to it.
+            await rollup.update(seconds=F("seconds") + seconds)
+
+    @staticmethod
+    async def running_timers(user: User) -> List[TaskTimeLog]:
+        """The user's running timers, oldest first (from the partial index)."""
+        return await TaskTimeLog.filter(
+            user=user, end_time__isnull=True, deleted_at__isnull=True
+        ).order_by("start_time")
+
+    @staticmethod
+    async def report(user: User, date_from: date, date_to: date) -> TimeReportResponse:
+        """Time spent per category and day, read from the rollups only."""
+        rows = await TaskTimeRollup.filter(
+            user=user, day__gte=date_from, day__lte=date_to, deleted_at__isnull=True
+        ).values("day", "category_id", "seconds")
+
+        cells: Dict[Tuple[date, Optional[UUID]], int] = defaultdict(int)
+        for row in rows:
+            cells[(row["day"], row["category_id"])] += row["seconds"]
+        categories = {}
+        if any(category_id for _, category_id in cells):
+            categories = (await CategoryCache.get(user.id)).categories
+
+        def name(category_id: Optional[UUID]) -> Optional[str]:
+            category = categories.get(category_id)
+            return category.name if category else None
+
+        by_category: Dict[Optional[UUID], int] = defaultdict(int)
+        by_day: Dict[date, int] = defaultdict(int)
+        for (day, category_id), seconds in cells.items():
+            by_category[category_id] += seconds
+            by_day[day] += seconds
+
+        return TimeReportResponse(
+            date_from=date_from,
+            date_to=date_to,
+            total_minutes=_minutes(sum(cells.values())),
+            entries=[
+                TimeReportEntry(
+                    day=day,
+                    category_id=category_id,
+                    category_name=name(category_id),
+                    minutes=_minutes(seconds),
+                )
+                for (day, category_id), seconds in sorted(
+                    cells.items(), key=lambda item: (item[0][0], str(item[0][1]))
+                )
+            ],
+            by_category=[
+                TimeReportCategory(
+                    category_id=category_id,
+                    category_name=name(category_id),
+                    minutes=_minutes(seconds),
+                )
+                for category_id, seconds in sorted(
+                    by_category.items(), key=lambda item: -item[1]
+                )
+            ],
+            by_day=[
+                TimeReportDay(day=day, minutes=_minutes(seconds))
+                for day, seconds in sorted(by_day.items())
+            ],
+        )
@@ -0,0 +1,68 @@
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+import orjson
+from src.database.models import User
+from src.database.queries import keyset_chunks
+from src.server.utils.responses import ValidationError
+
+
+USER_FIELDS = (
+    "id",
+    "clerk_id",
+    "email",
+    "username",
+    "timezone",
+    "default_reminder_minutes",
+    "preferred_notification_type",
+    "created_at",
+    "updated_at",
+)
+EXPORT_CHUNK_SIZE = 1000
+
+
+class UserService:
+    """Service layer for user listing operations."""
+
+    @staticmethod
+    def parse_fields(fields: Optional[str]) -> List[str]:
+        """Validate a comma separated field list; ``id`` is always included.
+
+        Raises:
+            ValidationError: If an unknown field is requested.
+        """
+        if not fields:
+            return list(USER_FIELDS)
+        requested = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in requested if field not in USER_FIELDS]
+        if unknown:
+            raise ValidationError(
+                "Unknown user fields", {"fields": unknown, "allowed": USER_FIELDS}
+            )
+        return ["id"] + [field for field in requested if field != "id"]
+
+    @staticmethod
+    async def list_users(
+        limit: int, after: Optional[UUID], fields: Sequence[str]
+    ) -> Tuple[List[dict], Optional[UUID]]:
+        """Return one page of users in id order and the cursor of the next page."""
+        query = User.filter(deleted_at__isnull=True)
+        if after:
+            query = query.filter(id__gt=after)
+        # One extra row tells whether another page exists.
+        rows = await query.order_by("id").limit(limit + 1).values(*fields)
+        if len(rows) > limit:
+            return rows[:limit], rows[limit - 1]["id"]
+        return rows, None
+
+    @staticmethod
+    async def export_json(fields: Sequence[str]) -> AsyncIterator[bytes]:
+        """Stream every user as one JSON array, a chunk of rows at a time."""
+        yield b"["
+        first = True
+        async for rows in keyset_chunks(
+            User.filter(deleted_at__isnull=True), fields, EXPORT_CHUNK_SIZE
+        ):
+            body = b",".join(orjson.dumps(row) for row in rows)
+            yield body if first else b"," + body
+            first = False
+        yield b"]"
@@ -0,0 +1,38 @@
+"""ETag helpers for conditional GET requests.
+
+Routes compute a cheap version marker, build a weak ETag from it with
+``make_etag`` and answer ``304 Not Modified`` through ``not_modified`` before
+building the full response.
+"""
+
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak ETag from the values that determine a response's content."""
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` header lists ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # Weak comparison: a W/ prefix on either side is ignored.
+    opaque = etag.removeprefix("W/")
+    candidates = {value.strip().removeprefix("W/") for value in header.split(",")}
+    return "*" in candidates or opaque in candidates
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A ``304`` response if the client's copy is current, otherwise ``None``."""
+    if etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return None
@@ -87,3 +87,60 @@ class ForbiddenError(HTTPException):
             status_code=status.HTTP_403_FORBIDDEN,
             detail={"success": False, "message": message, "error_code": "FORBIDDEN"},
         )
+
+
+class HabitNotFoundError(HTTPException):
+    """Custom exception for habit not found."""
+
+    def __init__(self, habit_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "message": f"Habit with ID {habit_id} not found",
+                "error_code": "HABIT_NOT_FOUND",
+            },
+        )
+
+
+class CategoryNotFoundError(HTTPException):
+    """Custom exception for category not found."""
+
+    def __init__(self, category_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "message": f"Category with ID {category_id} not found",
+                "error_code": "CATEGORY_NOT_FOUND",
+            },
+        )
+
+
+class DeviceNotFoundError(HTTPException):
+    """Custom exception for device not found."""
+
+    def __init__(self, device_id: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "success": False,
+                "message": f"Device with ID {device_id} not found",
+                "error_code": "DEVICE_NOT_FOUND",
+            },
+        )
+
+
+class RateLimitExceededError(HTTPException):
+    """Custom exception for clients over their request rate."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={
+                "success": False,
+                "message": f"Too many requests, retry in {retry_after} seconds",
+                "error_code": "RATE_LIMITED",
+            },
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1 @@
+"""Background jobs, run inside the API process or from the command line."""
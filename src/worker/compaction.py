@@ -0,0 +1,231 @@
+"""Purge rows that have been soft-deleted for longer than a retention window.
+
+Rows are hard-deleted in small batches, each in its own statement, so no
+lock is held for long. A row is only purged once nothing references it any
+more: referencing rows are purged first (tables are processed children
+first, and a table is swept again while it makes progress), so database
+level ``ON DELETE CASCADE`` never removes rows that are not expired yet.
+
+Usage:
+  python -m src.worker.compaction --retention-days 30
+  python -m src.worker.compaction --retention-days 30 --archive-dir ./archive
+"""
+
+import argparse
+import asyncio
+import gzip
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Type
+from uuid import UUID
+
+import orjson
+from tortoise import Tortoise
+
+from src.database.models import BaseModel
+from src.database.queries import execute, fetch_all
+from src.worker.scheduler import PeriodicJob
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class CompactionStats:
+    """Throughput of one compaction run for one table."""
+
+    table: str
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def purge_order() -> List[Type[BaseModel]]:
+    """All soft-deletable models, each listed before the models it references."""
+    models = [
+        model
+        for model in Tortoise.apps["models"].values()
+        if issubclass(model, BaseModel)
+    ]
+    references = {
+        model: {
+            model._meta.fields_map[name].related_model for name in model._meta.fk_fields
+        }
+        - {model}
+        for model in models
+    }
+
+    order = []
+    remaining = sorted(models, key=lambda m: m.__name__)
+    while remaining:
+        # A model is ready once every model pointing at it has been listed.
+        ready = [
+            model
+            for model in remaining
+            if not any(model in references[other] for other in remaining)
+        ]
+        if not ready:  # Reference cycle between models; fall back to name order
+            ready = remaining[:1]
+        order.extend(ready)
+        remaining = [model for model in remaining if model not in ready]
+    return order
+
+
+def _expired_rows_sql(model: Type[BaseModel], columns: str) -> str:
+    table = model._meta.db_table
+    conditions = ["t.deleted_at IS NOT NULL", "t.deleted_at < ?", "t.id > ?"]
+    for name in model._meta.backward_fk_fields:
+        relation = model._meta.fields_map[name]
+        conditions.append(
+            f"NOT EXISTS (SELECT 1 FROM {relation.related_model._meta.db_table} r"
+            f" WHERE r.{relation.relation_field} = t.id)"
+        )
+    return (
+        f"SELECT {columns} FROM {table} t WHERE "
+        + " AND ".join(conditions)
+        + " ORDER BY t.id LIMIT ?"
+    )
+
+
+def _archive(archive_dir: Path, table: str, rows: List[dict]) -> None:
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    # Appending creates a multi-member gzip file, which readers handle fine.
+    with gzip.open(archive_dir / f"{table}.ndjson.gz", "ab") as archive:
+        for row in rows:
+            archive.write(orjson.dumps(dict(row)) + b"\n")
+
+
+async def compact_model(
+    model: Type[BaseModel],
+    cutoff: datetime,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    archive_dir: Optional[Path] = None,
+    pause_seconds: float = 0.0,
+) -> CompactionStats:
+    """Hard-delete a model's rows soft-deleted before ``cutoff``."""
+    table = model._meta.db_table
+    stats = CompactionStats(table=table)
+    select_sql = _expired_rows_sql(model, "t.*" if archive_dir else "t.id")
+    started = time.perf_counter()
+
+    while True:
+        # Walk the primary key so each pass reads every row at most once.
+        purged_in_pass = 0
+        last_id = UUID(int=0)
+        while True:
+            rows = await fetch_all(select_sql, [cutoff, last_id, batch_size])
+            if not rows:
+                break
+            ids = [row["id"] for row in rows]
+            if archive_dir:
+                _archive(archive_dir, table, rows)
+            placeholders = ", ".join("?" for _ in ids)
+            purged_in_pass += await execute(
+                f"DELETE FROM {table} WHERE id IN ({placeholders})", ids
+            )
+            stats.batches += 1
+            last_id = ids[-1]
+            if len(rows) < batch_size:
+                break
+            if pause_seconds:
+                await asyncio.sleep(pause_seconds)
+        stats.rows += purged_in_pass
+        # Self-referencing tables (subtasks) free their parents as they go.
+        if not purged_in_pass or not any(
+            model._meta.fields_map[name].related_model is model
+            for name in model._meta.backward_fk_fields
+        ):
+            break
+
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+async def run_compaction(
+    retention: timedelta,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    archive_dir: Optional[Path] = None,
+    pause_seconds: float = 0.0,
+) -> List[CompactionStats]:
+    """Purge every table and log per-table throughput."""
+    cutoff = datetime.now() - retention
+    results = []
+    for model in purge_order():
+        stats = await compact_model(
+            model, cutoff, batch_size, archive_dir, pause_seconds
+        )
+        results.append(stats)
+        if stats.rows:
+            logging.info(
+                f"Compaction purged {stats.rows} rows from {stats.table} in "
+                f"{stats.batches} batches ({stats.rows_per_second:.0f} rows/s)"
+            )
+    return results
+
+
+def compaction_job() -> Optional[PeriodicJob]:
+    """Periodic compaction, enabled by ``COMPACTION_INTERVAL_MINUTES``."""
+    interval = os.getenv("COMPACTION_INTERVAL_MINUTES")
+    if not interval:
+        return None
+    retention = timedelta(days=int(os.getenv("COMPACTION_RETENTION_DAYS", "30")))
+    archive_dir = os.getenv("COMPACTION_ARCHIVE_DIR")
+
+    async def run():
+        await run_compaction(
+            retention,
+            archive_dir=Path(archive_dir) if archive_dir else None,
+            pause_seconds=0.05,
+        )
+
+    return PeriodicJob("compaction", run, float(interval) * 60)
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Purge soft-deleted rows older than the retention window"
+    )
+    parser.add_argument("--retention-days", type=float, default=30)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--archive-dir", type=Path, help="Write purged rows to <table>.ndjson.gz"
+    )
+    parser.add_argument(
+        "--pause", type=float, default=0.0, help="Seconds to sleep between batches"
+    )
+    args = parser.parse_args()
+
+    from src.database import init
+
+    await init()
+    try:
+        results = await run_compaction(
+            timedelta(days=args.retention_days),
+            args.batch_size,
+            args.archive_dir,
+            args.pause,
+        )
+    finally:
+        await Tortoise.close_connections()
+
+    print(f"{'table':<28}{'rows':>10}{'batches':>10}{'seconds':>10}{'rows/s':>12}")
+    for stats in results:
+        print(
+            f"{stats.table:<28}{stats.rows:>10}{stats.batches:>10}"
+            f"{stats.seconds:>10.2f}{stats.rows_per_second:>12.0f}"
+        )
+    total_rows = sum(s.rows for s in results)
+    total_seconds = sum(s.seconds for s in results)
+    print(f"Purged {total_rows} rows in {total_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
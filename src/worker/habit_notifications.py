@@ -0,0 +1,133 @@
+"""Queue habit reminder and "missed" notifications for all users.
+
+Runs the due-today evaluator over every active habit and writes one
+``NotificationQueue`` row per due habit (a reminder at the habit's local
+reminder time) and per habit missed yesterday (at today's reminder time). Runs
+are idempotent, so the job can run hourly to follow users across timezones.
+
+Usage:
+  python -m src.worker.habit_notifications
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, time as dt_time, timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from tortoise import Tortoise
+
+from src.database.models import NotificationQueue
+from src.database.models.enums import MessageType
+from src.server.services.agenda_service import get_zone
+from src.server.services.habit_due_service import HabitDue, HabitDueEvaluator
+from src.server.services.habit_message_service import HabitMessageSelector
+from src.worker.scheduler import PeriodicJob
+
+# Used for habits without a reminder time.
+DEFAULT_REMINDER_TIME = dt_time(9, 0)
+
+
+def scheduled_time(item: HabitDue) -> datetime:
+    """The habit's reminder time on its local date, in UTC."""
+    local = datetime.combine(
+        item.local_date,
+        item.reminder_time or DEFAULT_REMINDER_TIME,
+        get_zone(item.timezone),
+    )
+    return local.astimezone(dt_timezone.utc)
+
+
+async def queue_chunk(
+    candidates: List[Tuple[HabitDue, MessageType]],
+) -> int:
+    """Create the notifications of one evaluator chunk that are not queued yet."""
+    if not candidates:
+        return 0
+    times = [scheduled_time(item) for item, _ in candidates]
+    existing = {
+        (habit_id, MessageType(message_type), scheduled)
+        for habit_id, message_type, scheduled in await NotificationQueue.filter(
+            habit_id__in={item.habit_id for item, _ in candidates},
+            scheduled_time__gte=min(times),
+            scheduled_time__lte=max(times),
+        ).values_list("habit_id", "message_type", "scheduled_time")
+    }
+
+    notifications = []
+    for (item, message_type), scheduled in zip(candidates, times):
+        if (item.habit_id, message_type, scheduled) in existing:
+            continue
+        message = None
+        if item.template_id:
+            message = await HabitMessageSelector.select(item.template_id, message_type)
+        notifications.append(
+            NotificationQueue(
+                user_id=item.user_id,
+                habit_id=item.habit_id,
+                scheduled_time=scheduled,
+                notification_type=item.notification_type,
+                message_type=message_type,
+                custom_message=message.message_text if message else None,
+            )
+        )
+    await NotificationQueue.bulk_create(notifications, batch_size=1000)
+    return len(notifications)
+
+
+async def queue_habit_notifications(now: Optional[datetime] = None) -> Tuple[int, int]:
+    """Evaluate all habits and queue their notifications.
+
+    Returns:
+        Number of due and missed habits found (queued or already queued).
+    """
+    started = time.perf_counter()
+    due_count = missed_count = queued = 0
+    async for due, missed in HabitDueEvaluator.evaluate(now):
+        due_count += len(due)
+        missed_count += len(missed)
+        queued += await queue_chunk(
+            [(item, MessageType.REMINDER) for item in due]
+            + [(item, MessageType.MISSED) for item in missed]
+        )
+    logging.info(
+        f"Habit notifications: {due_count} due, {missed_count} missed, "
+        f"{queued} queued in {time.perf_counter() - started:.2f}s"
+    )
+    return due_count, missed_count
+
+
+def habit_notifications_job() -> Optional[PeriodicJob]:
+    """Periodic run, enabled by ``HABIT_NOTIFICATIONS_MINUTES``."""
+    interval = os.getenv("HABIT_NOTIFICATIONS_MINUTES")
+    if not interval:
+        return None
+    return PeriodicJob(
+        "habit_notifications", queue_habit_notifications, float(interval) * 60
+    )
+
+
+async def main():
+    argparse.ArgumentParser(
+        description="Queue habit reminder and missed notifications"
+    ).parse_args()
+
+    from src.database import init
+
+    await init()
+    try:
+        started = time.perf_counter()
+        due, missed = await queue_habit_notifications()
+        await HabitMessageSelector.flush()
+        print(
+            f"{due} due and {missed} missed habits "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+"""Write buffered habit message selections to ``usage_count``."""
+
+import logging
+import os
+from typing import Optional
+
+from src.server.services.habit_message_service import HabitMessageSelector
+from src.worker.scheduler import PeriodicJob
+
+DEFAULT_FLUSH_SECONDS = 30
+
+
+async def flush_message_usage() -> int:
+    flushed = await HabitMessageSelector.flush()
+    if flushed:
+        logging.info(f"Flushed {flushed} habit message selections")
+    return flushed
+
+
+def message_usage_job() -> Optional[PeriodicJob]:
+    """Periodic flush every ``MESSAGE_USAGE_FLUSH_SECONDS`` (0 disables it).
+
+    Unlike the maintenance jobs this one is on by default: without it,
+    selections would only be written once ``FLUSH_THRESHOLD`` accumulate or
+    at shutdown.
+    """
+    interval = float(os.getenv("MESSAGE_USAGE_FLUSH_SECONDS", DEFAULT_FLUSH_SECONDS))
+    if interval <= 0:
+        return None
+    return PeriodicJob("message_usage_flush", flush_message_usage, interval)
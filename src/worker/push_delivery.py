@@ -0,0 +1,156 @@
+"""Deliver due push notifications from the notification queue.
+
+Pending ``push`` and ``web_push`` rows whose ``scheduled_time`` has passed
+are read in id-ordered chunks and handed to ``PushService``, which fans them
+out to the users' devices in provider-sized batches. Rows are then marked
+sent, or kept pending for a retry until ``MAX_RETRIES`` failures.
+
+Usage:
+  python -m src.worker.push_delivery
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from tortoise import Tortoise, timezone
+from tortoise.expressions import F
+
+from src.database.models import NotificationQueue
+from src.database.models.enums import MessageType, NotificationStatus, NotificationType
+from src.database.queries import keyset_chunks
+from src.server.services.push_service import (
+    NOTIFICATION_DEVICE_TYPES,
+    PushNotification,
+    PushReport,
+    PushService,
+)
+from src.worker.scheduler import PeriodicJob
+
+CHUNK_SIZE = 1000
+MAX_RETRIES = 3
+
+DEFAULT_BODIES = {
+    MessageType.REMINDER: "Time for {name}",
+    MessageType.ENCOURAGEMENT: "Keep going with {name}",
+    MessageType.STREAK: "Your {name} streak is growing",
+    MessageType.MISSED: "You missed {name} yesterday",
+}
+
+QUEUE_FIELDS = (
+    "id",
+    "user_id",
+    "task_id",
+    "habit_id",
+    "notification_type",
+    "message_type",
+    "custom_message",
+    "task__title",
+    "habit__name",
+)
+
+
+def build_notification(row: dict) -> PushNotification:
+    name = row["task__title"] or row["habit__name"] or "your plans"
+    message_type = MessageType(row["message_type"] or MessageType.REMINDER)
+    data = {"notification_id": str(row["id"])}
+    for field in ("task_id", "habit_id"):
+        if row[field]:
+            data[field] = str(row[field])
+    return PushNotification(
+        key=row["id"],
+        user_id=row["user_id"],
+        notification_type=NotificationType(row["notification_type"]),
+        title=name,
+        body=row["custom_message"] or DEFAULT_BODIES[message_type].format(name=name),
+        data=data,
+    )
+
+
+async def record_results(report: PushReport, now: datetime) -> None:
+    """Mark delivered rows sent and count a retry on the others, in bulk."""
+    if report.delivered:
+        await NotificationQueue.filter(id__in=report.delivered).update(
+            status=NotificationStatus.SENT, sent_at=now, error_message=None
+        )
+    by_error: Dict[str, List[UUID]] = defaultdict(list)
+    for notification_id, error in report.failed.items():
+        by_error[error].append(notification_id)
+    for error, ids in by_error.items():
+        await NotificationQueue.filter(id__in=ids).update(
+            retry_count=F("retry_count") + 1, error_message=error
+        )
+    if report.failed:
+        await NotificationQueue.filter(
+            id__in=list(report.failed), retry_count__gte=MAX_RETRIES
+        ).update(status=NotificationStatus.FAILED)
+
+
+async def deliver_due_notifications(now: Optional[datetime] = None) -> PushReport:
+    """Deliver every due push notification once.
+
+    Returns:
+        The combined report of all chunks.
+    """
+    now = now or timezone.now()
+    started = time.perf_counter()
+    total = PushReport()
+    due = NotificationQueue.filter(
+        status=NotificationStatus.PENDING,
+        scheduled_time__lte=now,
+        notification_type__in=list(NOTIFICATION_DEVICE_TYPES),
+        deleted_at__isnull=True,
+    )
+    async for rows in keyset_chunks(due, QUEUE_FIELDS, CHUNK_SIZE):
+        report = await PushService.send([build_notification(row) for row in rows])
+        await record_results(report, now)
+        total.delivered |= report.delivered
+        total.failed.update(report.failed)
+        total.deactivated += report.deactivated
+        total.batches += report.batches
+
+    if total.delivered or total.failed:
+        logging.info(
+            f"Push delivery: {len(total.delivered)} sent, {len(total.failed)} "
+            f"failed, {total.deactivated} devices deactivated, {total.batches} "
+            f"batches in {time.perf_counter() - started:.2f}s"
+        )
+    return total
+
+
+def push_delivery_job() -> Optional[PeriodicJob]:
+    """Periodic delivery, enabled by ``PUSH_DELIVERY_SECONDS``."""
+    interval = os.getenv("PUSH_DELIVERY_SECONDS")
+    if not interval:
+        return None
+    return PeriodicJob("push_delivery", deliver_due_notifications, float(interval))
+
+
+async def main():
+    argparse.ArgumentParser(
+        description="Deliver due push notifications from the queue"
+    ).parse_args()
+
+    from src.database import init
+    from src.server.services.push_service import PushGateway
+
+    await init()
+    try:
+        report = await deliver_due_notifications()
+        print(
+            f"{len(report.delivered)} sent, {len(report.failed)} failed, "
+            f"{report.deactivated} devices deactivated"
+        )
+    finally:
+        await PushGateway.close()
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, List, Optional
+
+
+class PeriodicJob:
+    """Run a coroutine function every ``interval_seconds`` in the background.
+
+    Failures are logged and the job keeps its schedule, so one bad run does
+    not stop later ones.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[object]],
+        interval_seconds: float,
+    ):
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.func()
+            except Exception:
+                logging.exception(f"Background job {self.name} failed")
+
+
+def configured_jobs() -> List[PeriodicJob]:
+    """Jobs enabled through environment variables.
+
+    ``BACKGROUND_JOBS=false`` disables all of them, e.g. in every server
+    worker process but one.
+    """
+    if os.getenv("BACKGROUND_JOBS", "true").lower() == "false":
+        return []
+    from src.worker.compaction import compaction_job
+    from src.worker.habit_notifications import habit_notifications_job
+    from src.worker.message_usage import message_usage_job
+    from src.worker.push_delivery import push_delivery_job
+    from src.worker.task_stats import reconciliation_job
+
+    jobs = [
+        compaction_job(),
+        reconciliation_job(),
+        message_usage_job(),
+        habit_notifications_job(),
+        push_delivery_job(),
+    ]
+    return [job for job in jobs if job is not None]
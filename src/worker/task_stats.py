@@ -0,0 +1,71 @@
+"""Repair drift between the task stats counters and the tasks table.
+
+Usage:
+  python -m src.worker.task_stats              # reconcile built counters
+  python -m src.worker.task_stats --rebuild    # rebuild counters of all users
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from tortoise import Tortoise
+
+from src.server.services.task_stats_service import TaskStatsService
+from src.worker.scheduler import PeriodicJob
+
+
+async def run_reconciliation() -> int:
+    """Reconcile every built counter and log how many users had drifted."""
+    started = time.perf_counter()
+    repaired = await TaskStatsService.reconcile()
+    if repaired:
+        logging.warning(
+            f"Task stats reconciliation repaired {repaired} users in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+    return repaired
+
+
+def reconciliation_job() -> Optional[PeriodicJob]:
+    """Periodic reconciliation, enabled by ``TASK_STATS_RECONCILE_MINUTES``."""
+    interval = os.getenv("TASK_STATS_RECONCILE_MINUTES")
+    if not interval:
+        return None
+    return PeriodicJob(
+        "task_stats_reconciliation", run_reconciliation, float(interval) * 60
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Reconcile task stats counters with the tasks table"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Recompute the counters of every user instead of checking them",
+    )
+    args = parser.parse_args()
+
+    from src.database import init
+
+    await init()
+    try:
+        started = time.perf_counter()
+        if args.rebuild:
+            users = await TaskStatsService.rebuild()
+            print(f"Rebuilt task stats of {users} users", end="")
+        else:
+            users = await TaskStatsService.reconcile()
+            print(f"Repaired task stats of {users} users", end="")
+        print(f" in {time.perf_counter() - started:.2f}s")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
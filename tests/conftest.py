@@ -1,8 +1,21 @@
 import os
-import pytest
-from fastapi.testclient import TestClient
-from src.server.app import app
-from tortoise import Tortoise
+
+os.environ.setdefault("DATABASE_URL", "sqlite://:memory:")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("QUERY_STATS", "true")
+# Registers the debug-only routes (login, user export).
+os.environ.setdefault("DEBUG", "True")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from src.server.app import app  # noqa: E402
+from src.database.models import User  # noqa: E402
+from src.server.utils.jwt import create_access_token  # noqa: E402
+from tortoise import Tortoise  # noqa: E402
+
+
+def pytest_configure(config):
+    config.pluginmanager.import_plugin("tests.query_budget")
 
 
 @pytest.fixture
@@ -12,6 +25,28 @@ def client():
         yield test_client
 
 
+@pytest.fixture
+def run(client):
+    """Run a coroutine function on the app's event loop (for DB setup)."""
+
+    def _run(func, *args, **kwargs):
+        return client.portal.call(lambda: func(*args, **kwargs))
+
+    return _run
+
+
+@pytest.fixture
+def user(run):
+    """Create a user in the test database."""
+    return run(User.create, clerk_id="user_test", email="test@example.com")
+
+
+@pytest.fixture
+def auth_headers(user):
+    """Authorization headers for the test user."""
+    return {"Authorization": f"Bearer {create_access_token(user_id=str(user.id))}"}
+
+
 @pytest.fixture(autouse=True)
 async def cleanup():
     yield
@@ -0,0 +1,45 @@
+"""In-process stand-in for the push gateway used by ``PushService``.
+
+Accepts batches on ``POST /{provider}/send`` and records them. Tokens starting
+with ``invalid-`` are reported as invalid and tokens starting with ``down-``
+fail, so tests can exercise deactivation and retries. Can also be served for
+local development: ``uvicorn tests.fake_push_server:app --port 8090``.
+"""
+
+from collections import defaultdict
+
+from fastapi import Body, FastAPI, HTTPException
+
+from src.server.services.push_service import PROVIDERS
+
+BATCH_LIMITS = {provider.name: provider.batch_size for provider in PROVIDERS.values()}
+
+
+def create_app() -> FastAPI:
+    fake = FastAPI()
+    # Provider name -> list of received batches (lists of messages).
+    fake.state.batches = defaultdict(list)
+
+    @fake.post("/{provider}/send")
+    async def send(provider: str, payload: dict = Body(...)):
+        if provider not in BATCH_LIMITS:
+            raise HTTPException(status_code=404, detail="Unknown provider")
+        messages = payload["messages"]
+        if len(messages) > BATCH_LIMITS[provider]:
+            raise HTTPException(status_code=413, detail="Batch too large")
+        fake.state.batches[provider].append(messages)
+
+        results = []
+        for message in messages:
+            if message["token"].startswith("invalid-"):
+                results.append({"status": "invalid_token"})
+            elif message["token"].startswith("down-"):
+                results.append({"status": "error", "error": "Unavailable"})
+            else:
+                results.append({"status": "ok"})
+        return {"results": results}
+
+    return fake
+
+
+app = create_app()
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.database.models import User
+
+
+def local_today(zone):
+    return datetime.now(ZoneInfo(zone)).date()
+
+
+def create_task(client, auth_headers, title, due_date, **fields):
+    response = client.post(
+        "/tasks/",
+        json={"title": title, "due_date": due_date.isoformat(), **fields},
+        headers=auth_headers,
+    )
+    return response.json()["id"]
+
+
+def test_agenda_unauthorized(client):
+    """Test the agenda without authentication should return 403."""
+    assert client.get("/agenda/").status_code == 403
+
+
+def test_agenda_sections(client, auth_headers):
+    """Test open tasks are split into overdue, today and upcoming."""
+    today = local_today("UTC")
+    create_task(client, auth_headers, "Late", today - timedelta(days=3))
+    create_task(client, auth_headers, "Today low", today, priority=1)
+    create_task(client, auth_headers, "Today urgent", today, priority=4)
+    create_task(client, auth_headers, "Soon", today + timedelta(days=6))
+    create_task(client, auth_headers, "Later", today + timedelta(days=7))
+    create_task(client, auth_headers, "Done", today, status="completed")
+
+    response = client.get("/agenda/", headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["timezone"] == "UTC"
+    assert body["local_date"] == today.isoformat()
+    assert [t["title"] for t in body["overdue"]] == ["Late"]
+    assert [t["title"] for t in body["today"]] == ["Today urgent", "Today low"]
+    assert [t["title"] for t in body["upcoming"]] == ["Soon"]
+
+
+@pytest.mark.parametrize("zone", ["Pacific/Kiritimati", "Pacific/Pago_Pago"])
+def test_agenda_uses_user_timezone(client, run, user, auth_headers, zone):
+    """Test "today" is the user's local day, not the server's."""
+    user.timezone = zone
+    run(user.save)
+    today = local_today(zone)
+    create_task(client, auth_headers, "Local today", today)
+
+    body = client.get("/agenda/", headers=auth_headers).json()
+    assert body["timezone"] == zone
+    assert body["local_date"] == today.isoformat()
+    assert [t["title"] for t in body["today"]] == ["Local today"]
+
+
+def test_agenda_unknown_timezone_falls_back_to_utc(client, run, user, auth_headers):
+    """Test an invalid stored timezone does not break the agenda."""
+    run(User.filter(id=user.id).update, timezone="Mars/Olympus_Mons")
+    body = client.get("/agenda/", headers=auth_headers).json()
+    assert body["timezone"] == "UTC"
+
+
+def test_agenda_cached_until_task_write(client, auth_headers):
+    """Test the agenda is served from cache and refreshed after a write."""
+    today = local_today("UTC")
+    task_id = create_task(client, auth_headers, "First", today)
+
+    first = client.get("/agenda/", headers=auth_headers)
+    assert first.headers["X-DB-Queries"] == "2"
+    cached = client.get("/agenda/", headers=auth_headers)
+    # Only the current user lookup
+    assert cached.headers["X-DB-Queries"] == "1"
+    assert cached.json() == first.json()
+
+    client.patch(f"/tasks/{task_id}", json={"title": "Renamed"}, headers=auth_headers)
+    body = client.get("/agenda/", headers=auth_headers).json()
+    assert body["today"][0]["title"] == "Renamed"
+
+    client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    assert client.get("/agenda/", headers=auth_headers).json()["today"] == []
+
+
+def test_agenda_refreshed_after_category_rename(client, auth_headers):
+    """Test a renamed category shows in the cached agenda right away."""
+    category = client.post(
+        "/categories/", json={"name": "Work"}, headers=auth_headers
+    ).json()
+    create_task(
+        client, auth_headers, "Report", local_today("UTC"), category_id=category["id"]
+    )
+    body = client.get("/agenda/", headers=auth_headers).json()
+    assert body["today"][0]["category"]["name"] == "Work"
+
+    client.patch(
+        f"/categories/{category['id']}",
+        json={"name": "Office", "color": "#00AA00"},
+        headers=auth_headers,
+    )
+    body = client.get("/agenda/", headers=auth_headers).json()
+    assert body["today"][0]["category"]["name"] == "Office"
+    assert body["today"][0]["category"]["color"] == "#00AA00"
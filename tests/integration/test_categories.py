@@ -0,0 +1,164 @@
+import uuid
+
+import pytest
+
+from src.database.models import Category
+from src.server.services.category_service import CategoryCache
+
+
+def create_category(client, auth_headers, name, color="#FF6B6B"):
+    response = client.post(
+        "/categories/", json={"name": name, "color": color}, headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_categories_unauthorized(client):
+    """Test category endpoints without authentication should return 403."""
+    assert client.get("/categories/").status_code == 403
+    assert client.post("/categories/", json={"name": "Work"}).status_code == 403
+
+
+def test_category_crud(client, auth_headers):
+    """Test creating, listing, renaming and deleting categories."""
+    work = create_category(client, auth_headers, "Work")
+    create_category(client, auth_headers, "Home", "#00AA00")
+    assert work["name"] == "Work"
+    assert work["color"] == "#FF6B6B"
+
+    names = [c["name"] for c in client.get("/categories/", headers=auth_headers).json()]
+    assert names == ["Home", "Work"]
+
+    response = client.patch(
+        f"/categories/{work['id']}", json={"name": "Office"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["name"] == "Office"
+    assert response.json()["color"] == "#FF6B6B"
+
+    response = client.delete(f"/categories/{work['id']}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["deleted_category_id"] == work["id"]
+    assert (
+        client.get(f"/categories/{work['id']}", headers=auth_headers).status_code == 404
+    )
+
+
+def test_category_validation(client, auth_headers):
+    """Test invalid colors and empty updates are rejected."""
+    response = client.post(
+        "/categories/", json={"name": "Bad", "color": "red"}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    category = create_category(client, auth_headers, "Work")
+    response = client.patch(
+        f"/categories/{category['id']}", json={}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+    response = client.get(f"/categories/{uuid.uuid4()}", headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"]["error_code"] == "CATEGORY_NOT_FOUND"
+
+
+def test_task_with_unknown_category(client, auth_headers):
+    """Test tasks cannot reference a missing or deleted category."""
+    response = client.post(
+        "/tasks/",
+        json={"title": "Orphan", "category_id": str(uuid.uuid4())},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+    category = create_category(client, auth_headers, "Gone")
+    client.delete(f"/categories/{category['id']}", headers=auth_headers)
+    response = client.post(
+        "/tasks/",
+        json={"title": "Orphan", "category_id": category["id"]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+
+def test_task_responses_include_category(client, auth_headers):
+    """Test task responses carry the category name and color."""
+    category = create_category(client, auth_headers, "Work")
+    task = client.post(
+        "/tasks/",
+        json={"title": "Report", "category_id": category["id"]},
+        headers=auth_headers,
+    ).json()
+    assert task["category"] == {
+        "id": category["id"],
+        "name": "Work",
+        "color": "#FF6B6B",
+    }
+
+    listed = client.get("/tasks/", headers=auth_headers).json()["tasks"][0]
+    assert listed["category"]["name"] == "Work"
+
+    uncategorized = client.post(
+        "/tasks/", json={"title": "Loose"}, headers=auth_headers
+    ).json()
+    assert uncategorized["category"] is None
+
+
+def test_rename_changes_task_etags(client, auth_headers):
+    """Test renaming a category invalidates cached task representations."""
+    category = create_category(client, auth_headers, "Work")
+    task_id = client.post(
+        "/tasks/",
+        json={"title": "Report", "category_id": category["id"]},
+        headers=auth_headers,
+    ).json()["id"]
+    list_etag = client.get("/tasks/", headers=auth_headers).headers["ETag"]
+    task_etag = client.get(f"/tasks/{task_id}", headers=auth_headers).headers["ETag"]
+
+    client.patch(
+        f"/categories/{category['id']}", json={"name": "Office"}, headers=auth_headers
+    )
+
+    response = client.get(
+        "/tasks/", headers={**auth_headers, "If-None-Match": list_etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["tasks"][0]["category"]["name"] == "Office"
+    response = client.get(
+        f"/tasks/{task_id}", headers={**auth_headers, "If-None-Match": task_etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["category"]["name"] == "Office"
+
+
+def test_delete_category_detaches_tasks(client, auth_headers):
+    """Test deleting a category keeps its tasks without a category."""
+    category = create_category(client, auth_headers, "Work")
+    task_id = client.post(
+        "/tasks/",
+        json={"title": "Report", "category_id": category["id"]},
+        headers=auth_headers,
+    ).json()["id"]
+
+    response = client.delete(f"/categories/{category['id']}", headers=auth_headers)
+    assert response.json()["uncategorized_tasks"] == 1
+
+    task = client.get(f"/tasks/{task_id}", headers=auth_headers).json()
+    assert task["category_id"] is None
+    assert task["category"] is None
+
+
+@pytest.mark.query_budget(3)
+def test_category_check_uses_cached_map(client, run, user, auth_headers):
+    """Test creating tasks in a category does not query the categories table."""
+    category = run(Category.create, user=user, name="Work")
+    run(CategoryCache.get, user.id)
+    for n in range(3):
+        response = client.post(
+            "/tasks/",
+            json={"title": f"Task {n}", "category_id": str(category.id)},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        assert response.headers["X-DB-Queries"] == "3"
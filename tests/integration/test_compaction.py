@@ -0,0 +1,66 @@
+import gzip
+from datetime import datetime, timedelta
+
+import orjson
+
+from src.database.models import Task, TaskReminder
+from src.database.models.enums import NotificationType
+from src.worker.compaction import purge_order, run_compaction
+
+
+def test_purge_order_lists_children_first(client):
+    """Test referencing models are purged before the models they point to."""
+    order = [model.__name__ for model in purge_order()]
+    assert order.index("TaskReminder") < order.index("Task") < order.index("User")
+    assert order.index("HabitCompletion") < order.index("Habit")
+
+
+def test_compaction_purges_expired_rows(client, run, user, tmp_path):
+    """Test expired soft-deleted rows are purged, children before parents."""
+    long_ago = datetime.now() - timedelta(days=90)
+
+    root = run(Task.create, user=user, title="Root", deleted_at=long_ago)
+    child = run(
+        Task.create, user=user, title="Child", parent_task=root, deleted_at=long_ago
+    )
+    run(
+        TaskReminder.create,
+        task=child,
+        reminder_minutes=5,
+        notification_type=NotificationType.PUSH,
+        deleted_at=long_ago,
+    )
+    recent = run(Task.create, user=user, title="Recent", deleted_at=datetime.now())
+    live = run(Task.create, user=user, title="Live")
+
+    results = run(run_compaction, timedelta(days=30), 1, tmp_path)
+    purged = {stats.table: stats.rows for stats in results}
+
+    assert purged["tasks"] == 2
+    assert purged["task_reminders"] == 1
+    assert run(lambda: Task.filter(id__in=[recent.id, live.id]).count()) == 2
+
+    with gzip.open(tmp_path / "tasks.ndjson.gz") as archive:
+        titles = {orjson.loads(line)["title"] for line in archive}
+    assert titles == {"Root", "Child"}
+
+
+def test_compaction_keeps_parents_of_unexpired_rows(client, run, user):
+    """Test a row is not purged while a non-expired row still references it."""
+    root = run(
+        Task.create,
+        user=user,
+        title="Root",
+        deleted_at=datetime.now() - timedelta(days=90),
+    )
+    run(
+        Task.create,
+        user=user,
+        title="Child",
+        parent_task=root,
+        deleted_at=datetime.now(),
+    )
+
+    results = run(run_compaction, timedelta(days=30))
+    assert sum(stats.rows for stats in results) == 0
+    assert run(lambda: Task.all().count()) == 2
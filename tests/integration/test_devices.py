@@ -0,0 +1,78 @@
+import uuid
+
+from src.database.models import User, UserDevice
+
+
+def register(client, auth_headers, **payload):
+    return client.post("/devices/", json=payload, headers=auth_headers)
+
+
+def test_devices_unauthorized(client):
+    """Test device endpoints without authentication should return 403."""
+    assert client.get("/devices/").status_code == 403
+    assert client.post("/devices/", json={"device_type": "ios"}).status_code == 403
+
+
+def test_device_register_list_delete(client, auth_headers):
+    """Test registering, listing and unregistering devices."""
+    phone = register(client, auth_headers, device_type="ios", push_token="tok-1")
+    assert phone.status_code == 201
+    assert phone.json()["push_token"] == "tok-1"
+    assert phone.json()["is_active"] is True
+    browser = register(
+        client,
+        auth_headers,
+        device_type="web",
+        endpoint_url="https://push.example.com/abc",
+    )
+    assert browser.status_code == 201
+
+    devices = client.get("/devices/", headers=auth_headers).json()
+    assert [d["device_type"] for d in devices] == ["ios", "web"]
+
+    device_id = phone.json()["id"]
+    response = client.delete(f"/devices/{device_id}", headers=auth_headers)
+    assert response.status_code == 204
+    assert [d["id"] for d in client.get("/devices/", headers=auth_headers).json()] == [
+        browser.json()["id"]
+    ]
+    response = client.delete(f"/devices/{device_id}", headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"]["error_code"] == "DEVICE_NOT_FOUND"
+    assert (
+        client.delete(f"/devices/{uuid.uuid4()}", headers=auth_headers).status_code
+        == 404
+    )
+
+
+def test_device_requires_address(client, auth_headers):
+    """Test mobile devices need a token and web devices an endpoint."""
+    assert register(client, auth_headers, device_type="android").status_code == 422
+    assert (
+        register(client, auth_headers, device_type="web", push_token="tok").status_code
+        == 422
+    )
+
+
+def test_register_again_reactivates(client, run, user, auth_headers):
+    """Test a known token reuses its device and leaves other accounts."""
+    other = run(User.create, clerk_id="user_other", email="other@example.com")
+    run(UserDevice.create, user=other, device_type="android", push_token="shared-tok")
+    first = register(
+        client, auth_headers, device_type="android", push_token="shared-tok"
+    ).json()
+    run(UserDevice.filter(id=first["id"]).update, is_active=False)
+
+    again = register(
+        client, auth_headers, device_type="android", push_token="shared-tok"
+    )
+    assert again.status_code == 201
+    assert again.json()["id"] == first["id"]
+    assert again.json()["is_active"] is True
+
+    active = run(
+        UserDevice.filter(push_token="shared-tok", is_active=True).values_list,
+        "user_id",
+        flat=True,
+    )
+    assert active == [user.id]
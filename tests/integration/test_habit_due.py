@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.database.models import (
+    Habit,
+    HabitCompletion,
+    HabitCompletionRollup,
+    NotificationQueue,
+    User,
+)
+from src.database.models.enums import Frequency, MessageType, RollupPeriod
+from src.server.services.habit_due_service import HabitDueEvaluator
+from src.worker.habit_notifications import queue_habit_notifications
+
+# A Monday: last week ended yesterday.
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+TODAY = NOW.date()
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+@pytest.fixture
+def make_habit(run, user):
+    def _make(name, frequency=Frequency.DAILY, owner=None, **fields):
+        habit = run(
+            Habit.create,
+            user=owner or user,
+            name=name,
+            frequency=frequency,
+            **fields,
+        )
+        # Existed for the whole previous period.
+        run(
+            Habit.filter(id=habit.id).update,
+            created_at=NOW - timedelta(days=60),
+        )
+        return habit
+
+    return _make
+
+
+def complete(run, habit, day, count=1):
+    run(
+        HabitCompletion.create,
+        habit=habit,
+        completion_date=day,
+        completed_count=count,
+    )
+
+
+def week_rollup(run, user, habit, start, days):
+    run(
+        HabitCompletionRollup.create,
+        user=user,
+        habit=habit,
+        period=RollupPeriod.WEEK,
+        period_start=start,
+        completed_count=days,
+        completion_days=days,
+    )
+
+
+def evaluate(run, chunk_size=None):
+    async def collect():
+        due, missed = set(), set()
+        async for chunk_due, chunk_missed in HabitDueEvaluator.evaluate(
+            NOW, chunk_size
+        ):
+            due |= {item.habit_id for item in chunk_due}
+            missed |= {item.habit_id for item in chunk_missed}
+        return due, missed
+
+    return run(collect)
+
+
+def test_day_scheduled_habits(run, make_habit):
+    """Test daily and weekday habits against today's and yesterday's completions."""
+    idle = make_habit("Idle")
+    done = make_habit("Done")
+    complete(run, done, TODAY)
+    complete(run, done, YESTERDAY)
+    partial = make_habit("Twice a day", target_count=2)
+    complete(run, partial, TODAY)
+    complete(run, partial, YESTERDAY, count=2)
+    mondays = make_habit("Mondays", Frequency.WEEKLY, target_days=["monday"])
+    sundays = make_habit("Sundays", Frequency.WEEKLY, target_days=[6])
+    fridays = make_habit("Fridays", Frequency.DAILY, target_days=["fri"])
+    make_habit("Paused", is_active=False)
+
+    due, missed = evaluate(run, chunk_size=3)
+    assert due == {idle.id, partial.id, mondays.id}
+    assert missed == {idle.id, sundays.id}
+    assert fridays.id not in due | missed
+
+
+def test_period_counted_habits(run, user, make_habit):
+    """Test weekly targets are read from rollups, including the week that ended."""
+    this_week, last_week = TODAY, TODAY - timedelta(days=7)
+    reached = make_habit("Reached", Frequency.WEEKLY, target_count=2)
+    week_rollup(run, user, reached, this_week, 2)
+    week_rollup(run, user, reached, last_week, 2)
+    behind = make_habit("Behind", Frequency.WEEKLY, target_count=2)
+    week_rollup(run, user, behind, this_week, 1)
+    week_rollup(run, user, behind, last_week, 1)
+    monthly = make_habit("Monthly", Frequency.MONTHLY, target_count=1)
+
+    due, missed = evaluate(run)
+    assert due == {behind.id, monthly.id}
+    assert missed == {behind.id}
+
+
+def test_new_habits_are_not_missed(run, user):
+    """Test a habit created today is due but was not missed yesterday."""
+    habit = run(Habit.create, user=user, name="New", frequency=Frequency.DAILY)
+    due, missed = evaluate(run)
+    assert habit.id in due
+    assert habit.id not in missed
+
+
+def test_local_dates_follow_user_timezone(run, make_habit):
+    """Test "today" is the user's local date."""
+    # 12:00 UTC is already Tuesday 02:00 in Kiritimati (UTC+14).
+    ahead = run(User.create, clerk_id="ahead", email="a@example.com")
+    ahead.timezone = "Pacific/Kiritimati"
+    run(ahead.save)
+    habit = make_habit("Local", owner=ahead)
+    complete(run, habit, TODAY)
+
+    due, missed = evaluate(run)
+    assert habit.id in due
+    assert habit.id not in missed
+
+
+def test_queue_habit_notifications_is_idempotent(run, make_habit):
+    """Test due and missed habits are queued once at the reminder time."""
+    habit = make_habit("Idle")
+
+    assert run(queue_habit_notifications, NOW) == (1, 1)
+    assert run(queue_habit_notifications, NOW) == (1, 1)
+
+    notifications = run(NotificationQueue.filter(habit_id=habit.id).all)
+    assert sorted(n.message_type for n in notifications) == [
+        MessageType.MISSED,
+        MessageType.REMINDER,
+    ]
+    assert {n.scheduled_time for n in notifications} == {
+        datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+    }
+
+
+def test_evaluator_without_habits(run, user):
+    """Test an empty habits table yields nothing."""
+    assert evaluate(run) == (set(), set())
@@ -0,0 +1,79 @@
+import random
+from collections import Counter
+
+import pytest
+
+from src.database.models import HabitTemplate, HabitTemplateMessage
+from src.database.models.enums import Frequency, MessageType
+from src.server.services.habit_message_service import HabitMessageSelector
+from src.server.services.habit_template_service import HabitTemplateCatalog
+
+
+@pytest.fixture
+def template(run):
+    """A template with two reminders (one heavily used) and a streak message."""
+    template = run(
+        HabitTemplate.create,
+        name="Drink water",
+        category="health",
+        default_frequency=Frequency.DAILY,
+    )
+    for text, usage_count in (("Fresh", 0), ("Worn out", 3)):
+        run(
+            HabitTemplateMessage.create,
+            habit_template=template,
+            message_type=MessageType.REMINDER,
+            message_text=text,
+            usage_count=usage_count,
+        )
+    run(
+        HabitTemplateMessage.create,
+        habit_template=template,
+        message_type=MessageType.STREAK,
+        message_text="Keep going",
+    )
+    run(HabitTemplateCatalog.refresh)
+    HabitMessageSelector.clear()
+    yield template
+    HabitMessageSelector.clear()
+
+
+def select(run, template, message_type, rng=None):
+    return run(HabitMessageSelector.select, template.id, message_type, rng)
+
+
+def test_select_favors_less_used_messages(run, template):
+    """Test the least used reminder is picked about four times as often."""
+    rng = random.Random(1)
+    texts = Counter(
+        select(run, template, MessageType.REMINDER, rng).message_text
+        for _ in range(400)
+    )
+    assert texts["Fresh"] > 2.5 * texts["Worn out"]
+
+    assert select(run, template, MessageType.STREAK).message_text == "Keep going"
+    assert select(run, template, MessageType.MISSED) is None
+
+
+def test_usage_is_buffered_and_flushed(run, template):
+    """Test selections are only written on flush, in one batch."""
+    for _ in range(5):
+        select(run, template, MessageType.STREAK)
+
+    message = run(HabitTemplateMessage.get, message_text="Keep going")
+    assert message.usage_count == 0
+
+    assert run(HabitMessageSelector.flush) == 5
+    run(message.refresh_from_db)
+    assert message.usage_count == 5
+    assert run(HabitMessageSelector.flush) == 0
+
+
+def test_flush_threshold(run, template, monkeypatch):
+    """Test a full buffer is flushed from the selection itself."""
+    monkeypatch.setattr(HabitMessageSelector, "FLUSH_THRESHOLD", 3)
+    for _ in range(3):
+        select(run, template, MessageType.STREAK)
+
+    message = run(HabitTemplateMessage.get, message_text="Keep going")
+    assert message.usage_count == 3
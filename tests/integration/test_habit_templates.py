@@ -0,0 +1,93 @@
+import pytest
+
+from src.database.models import HabitTemplate, HabitTemplateMessage
+from src.database.models.enums import Frequency, MessageType
+from src.server.services.habit_template_service import HabitTemplateCatalog
+
+
+def create_template(run, name, category, sort_order=0, **fields):
+    return run(
+        HabitTemplate.create,
+        name=name,
+        category=category,
+        default_frequency=Frequency.DAILY,
+        sort_order=sort_order,
+        **fields,
+    )
+
+
+@pytest.fixture
+def catalog(run):
+    """Two categories of templates, loaded into the catalog snapshot."""
+    water = create_template(run, "Drink water", "health", sort_order=2)
+    create_template(run, "Stretch", "health", sort_order=1)
+    create_template(run, "Read", "learning")
+    create_template(run, "Retired", "health", is_active=False)
+    run(
+        HabitTemplateMessage.create,
+        habit_template=water,
+        message_type=MessageType.REMINDER,
+        message_text="Time for a glass of water",
+    )
+    run(
+        HabitTemplateMessage.create,
+        habit_template=water,
+        message_type=MessageType.STREAK,
+        message_text="Old message",
+        is_active=False,
+    )
+    return run(HabitTemplateCatalog.refresh)
+
+
+def test_habit_templates_unauthorized(client):
+    """Test the catalog without authentication should return 403."""
+    assert client.get("/habit-templates/").status_code == 403
+
+
+def test_catalog_grouped_by_category(client, auth_headers, catalog):
+    """Test active templates are grouped by category in display order."""
+    response = client.get("/habit-templates/", headers=auth_headers)
+    assert response.status_code == 200
+    categories = response.json()["categories"]
+    assert [c["category"] for c in categories] == ["health", "learning"]
+    health = categories[0]["templates"]
+    assert [t["name"] for t in health] == ["Stretch", "Drink water"]
+    assert [m["message_text"] for m in health[1]["messages"]] == [
+        "Time for a glass of water"
+    ]
+
+    response = client.get(
+        "/habit-templates/", params={"category": "learning"}, headers=auth_headers
+    )
+    assert [c["category"] for c in response.json()["categories"]] == ["learning"]
+
+
+@pytest.mark.query_budget(1)
+def test_catalog_served_from_memory(client, auth_headers, catalog):
+    """Test the catalog is served without queries beyond authentication."""
+    response = client.get("/habit-templates/", headers=auth_headers)
+    etag = response.headers["ETag"]
+    response = client.get(
+        "/habit-templates/", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+
+def test_catalog_refresh_on_edit(client, run, auth_headers, catalog, monkeypatch):
+    """Test edits from another process are picked up by the marker check."""
+    etag = client.get("/habit-templates/", headers=auth_headers).headers["ETag"]
+    create_template(run, "Meditate", "mindfulness")
+
+    # Not checked again before CHECK_SECONDS.
+    response = client.get(
+        "/habit-templates/", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    monkeypatch.setattr(HabitTemplateCatalog, "CHECK_SECONDS", 0)
+    response = client.get(
+        "/habit-templates/", headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert "mindfulness" in [c["category"] for c in response.json()["categories"]]
+    assert run(HabitTemplateCatalog.get).version == catalog.version + 1
@@ -0,0 +1,145 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from tortoise.exceptions import IntegrityError
+from tortoise.queryset import QuerySet
+
+from src.database.models import Habit, HabitCompletion, HabitCompletionRollup
+from src.database.models.enums import Frequency, RollupPeriod
+from src.server.services.habit_service import HabitRollupService
+
+
+def test_habit_endpoints_unauthorized(client):
+    """Test habit endpoints without authentication should return 403."""
+    assert client.get("/habits/analytics").status_code == 403
+    response = client.post(f"/habits/{uuid4()}/completions", json={})
+    assert response.status_code == 403
+
+
+def test_create_completion_habit_not_found(client, auth_headers):
+    """Test recording a completion for an unknown habit should return 404."""
+    response = client.post(
+        f"/habits/{uuid4()}/completions", json={}, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+def test_completions_update_rollups(client, run, user, auth_headers):
+    """Test completions are aggregated into day, week and month rollups."""
+    habit = run(Habit.create, user=user, name="Read", frequency=Frequency.DAILY)
+    today = date.today()
+
+    for completion_date in (today, today, today - timedelta(days=1)):
+        response = client.post(
+            f"/habits/{habit.id}/completions",
+            json={"completion_date": completion_date.isoformat()},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+    day_rollup = run(
+        HabitCompletionRollup.get,
+        habit_id=habit.id,
+        period=RollupPeriod.DAY,
+        period_start=today,
+    )
+    assert day_rollup.completed_count == 2
+    assert day_rollup.completion_days == 1
+
+    month_rollups = run(
+        lambda: HabitCompletionRollup.filter(
+            habit_id=habit.id, period=RollupPeriod.MONTH
+        ).values("completed_count", "completion_days")
+    )
+    assert sum(r["completed_count"] for r in month_rollups) == 3
+    assert sum(r["completion_days"] for r in month_rollups) == 2
+
+
+def test_one_live_completion_per_day(client, run, user, auth_headers, monkeypatch):
+    """Test a completion racing another request's insert counts one day."""
+    habit = run(Habit.create, user=user, name="Read", frequency=Frequency.DAILY)
+    today = date.today()
+    run(HabitCompletion.create, habit=habit, completion_date=today)
+    with pytest.raises(IntegrityError):
+        run(HabitCompletion.create, habit=habit, completion_date=today)
+
+    # The lookup misses the row, as if the other insert had not committed yet.
+    first = QuerySet.first
+    misses = iter([True])
+
+    def racing_first(self):
+        if self.model is HabitCompletion and next(misses, False):
+            return _none()
+        return first(self)
+
+    monkeypatch.setattr(QuerySet, "first", racing_first)
+    response = client.post(
+        f"/habits/{habit.id}/completions", json={}, headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    [completion] = run(HabitCompletion.filter(habit=habit, deleted_at__isnull=True).all)
+    assert completion.completed_count == 2
+    rollup = run(
+        HabitCompletionRollup.get,
+        habit_id=habit.id,
+        period=RollupPeriod.DAY,
+        period_start=today,
+    )
+    assert rollup.completion_days == 0
+
+
+async def _none():
+    return None
+
+
+def test_rebuild_matches_incremental_rollups(client, run, user, auth_headers):
+    """Test rebuilding rollups from raw completions gives the same counters."""
+    habit = run(Habit.create, user=user, name="Walk", frequency=Frequency.DAILY)
+    for offset in range(10):
+        client.post(
+            f"/habits/{habit.id}/completions",
+            json={
+                "completion_date": (date.today() - timedelta(days=offset)).isoformat()
+            },
+            headers=auth_headers,
+        )
+
+    def snapshot():
+        return run(
+            lambda: (
+                HabitCompletionRollup.filter(habit_id=habit.id)
+                .order_by("period", "period_start")
+                .values_list(
+                    "period", "period_start", "completed_count", "completion_days"
+                )
+            )
+        )
+
+    incremental = snapshot()
+    run(HabitRollupService.rebuild, [habit.id])
+    assert snapshot() == incremental
+
+
+def test_habit_analytics(client, run, user, auth_headers):
+    """Test analytics are grouped by frequency and target days."""
+    habit = run(
+        Habit.create,
+        user=user,
+        name="Gym",
+        frequency=Frequency.WEEKLY,
+        target_days=["mon", "wed", "fri"],
+    )
+    client.post(f"/habits/{habit.id}/completions", json={}, headers=auth_headers)
+
+    response = client.get(
+        "/habits/analytics", params={"period": "month"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["period"] == "month"
+    assert data["habits"][0]["completed_count"] == 1
+    assert data["by_frequency"][0]["key"] == "weekly"
+    assert data["by_target_days"][0]["key"] == "mon,wed,fri"
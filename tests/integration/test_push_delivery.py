@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from src.database.models import NotificationQueue, User, UserDevice
+from src.database.models.enums import (
+    DeviceType,
+    MessageType,
+    NotificationStatus,
+    NotificationType,
+)
+from src.server.services.push_service import PushGateway
+from src.worker.push_delivery import MAX_RETRIES, deliver_due_notifications
+from tests.fake_push_server import create_app
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def gateway(run):
+    """The push gateway client pointed at the in-process fake gateway."""
+    fake = create_app()
+    PushGateway.configure(
+        base_url="http://fake-push", transport=httpx.ASGITransport(app=fake)
+    )
+    yield fake
+    run(PushGateway.close)
+
+
+def queue(run, user, count=1, **kwargs):
+    kwargs.setdefault("notification_type", NotificationType.PUSH)
+    kwargs.setdefault("scheduled_time", NOW - timedelta(minutes=1))
+    notifications = [NotificationQueue(user=user, **kwargs) for _ in range(count)]
+    run(NotificationQueue.bulk_create, notifications)
+    return notifications
+
+
+def status_counts(run):
+    rows = run(NotificationQueue.all().values_list, "status", flat=True)
+    return {status: rows.count(status) for status in set(rows)}
+
+
+def test_deliver_batches_per_provider(run, user, gateway):
+    """Test messages are sent in batches no larger than the provider's."""
+    run(UserDevice.create, user=user, device_type=DeviceType.ANDROID, push_token="a")
+    run(UserDevice.create, user=user, device_type=DeviceType.IOS, push_token="i")
+    run(
+        UserDevice.create,
+        user=user,
+        device_type=DeviceType.WEB,
+        endpoint_url="https://push.example.com/w",
+    )
+    queue(run, user, 600, custom_message="Stretch")
+    queue(run, user, scheduled_time=NOW + timedelta(hours=1))
+
+    report = run(deliver_due_notifications, NOW)
+
+    assert len(report.delivered) == 600
+    assert [len(b) for b in gateway.state.batches["fcm"]] == [500, 100]
+    assert [len(b) for b in gateway.state.batches["apns"]] == [100] * 6
+    assert "webpush" not in gateway.state.batches
+    assert gateway.state.batches["fcm"][0][0]["body"] == "Stretch"
+    assert status_counts(run) == {
+        NotificationStatus.SENT: 600,
+        NotificationStatus.PENDING: 1,
+    }
+
+
+def test_web_push_uses_endpoint(run, user, gateway):
+    """Test web push rows go to endpoints, with a default body."""
+    run(
+        UserDevice.create,
+        user=user,
+        device_type=DeviceType.DESKTOP,
+        endpoint_url="https://push.example.com/d",
+    )
+    run(UserDevice.create, user=user, device_type=DeviceType.IOS, push_token="i")
+    queue(
+        run,
+        user,
+        notification_type=NotificationType.WEB_PUSH,
+        message_type=MessageType.MISSED,
+    )
+
+    run(deliver_due_notifications, NOW)
+
+    [[message]] = gateway.state.batches["webpush"]
+    assert message["token"] == "https://push.example.com/d"
+    assert message["body"] == "You missed your plans yesterday"
+    assert "apns" not in gateway.state.batches
+
+
+def test_invalid_tokens_are_deactivated(run, user, gateway):
+    """Test devices reported invalid are deactivated in one update."""
+    other = run(User.create, clerk_id="user_other", email="other@example.com")
+    run(UserDevice.create, user=user, device_type=DeviceType.IOS, push_token="ok")
+    run(
+        UserDevice.create, user=user, device_type=DeviceType.IOS, push_token="invalid-1"
+    )
+    run(
+        UserDevice.create,
+        user=other,
+        device_type=DeviceType.ANDROID,
+        push_token="invalid-2",
+    )
+    queue(run, user)
+    queue(run, other)
+
+    report = run(deliver_due_notifications, NOW)
+
+    assert report.deactivated == 2
+    assert len(report.delivered) == 1
+    assert list(report.failed.values()) == ["Invalid device token"]
+    tokens = run(UserDevice.filter(is_active=True).values_list, "push_token", flat=True)
+    assert tokens == ["ok"]
+
+
+def test_failures_are_retried_then_failed(run, user, gateway):
+    """Test failed rows stay pending until MAX_RETRIES attempts."""
+    run(UserDevice.create, user=user, device_type=DeviceType.IOS, push_token="down-1")
+    [notification] = queue(run, user)
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        run(deliver_due_notifications, NOW)
+        row = run(NotificationQueue.get, id=notification.id)
+        assert row.retry_count == attempt
+        assert row.error_message == "Unavailable"
+    assert row.status == NotificationStatus.FAILED
+
+    run(deliver_due_notifications, NOW)
+    assert run(NotificationQueue.get, id=notification.id).retry_count == MAX_RETRIES
+
+
+def test_gateway_outage_fails_batches(run, user):
+    """Test an unreachable gateway counts a retry instead of raising."""
+
+    def refuse(request):
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    PushGateway.configure(
+        base_url="http://fake-push", transport=httpx.MockTransport(refuse)
+    )
+    run(UserDevice.create, user=user, device_type=DeviceType.ANDROID, push_token="a")
+    [notification] = queue(run, user)
+    try:
+        report = run(deliver_due_notifications, NOW)
+    finally:
+        run(PushGateway.close)
+
+    assert report.failed[notification.id].startswith("fcm: ")
+    row = run(NotificationQueue.get, id=notification.id)
+    assert (row.status, row.retry_count) == (NotificationStatus.PENDING, 1)
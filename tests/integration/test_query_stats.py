@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+import pytest
+
+from src.database.models import User
+from src.database.query_counter import track_queries
+
+
+def test_query_stats_headers(client, auth_headers):
+    """Test responses report the number of DB queries and their duration."""
+    response = client.get("/tasks/", headers=auth_headers)
+    assert response.status_code == 200
+    # Current user, ETag probe, count and page
+    assert response.headers["X-DB-Queries"] == "4"
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+
+def test_repeated_statements_are_detected(client, run):
+    """Test the same statement run with different params is flagged."""
+
+    async def lookup_users():
+        with track_queries() as log:
+            for _ in range(3):
+                await User.filter(id=uuid4()).first()
+        return log
+
+    log = run(lookup_users)
+    assert log.count == 3
+    assert list(log.repeated(3).values()) == [3]
+    assert log.repeated(4) == {}
+
+
+@pytest.mark.query_budget(3)
+def test_task_endpoints_query_budget(client, auth_headers):
+    """Test task create, get and patch stay within the query budget."""
+    response = client.post("/tasks/", json={"title": "Budget"}, headers=auth_headers)
+    task_id = response.json()["id"]
+
+    client.get(f"/tasks/{task_id}", headers=auth_headers)
+    client.patch(f"/tasks/{task_id}", json={"priority": 3}, headers=auth_headers)
+
+
+@pytest.mark.query_budget(4)
+def test_task_list_query_budget(client, auth_headers):
+    """Test the task list stays within its budget, and a 304 needs no list query."""
+    response = client.get("/tasks/", headers=auth_headers)
+    response = client.get(
+        "/tasks/", headers={**auth_headers, "If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+    # Current user and ETag probe only
+    assert response.headers["X-DB-Queries"] == "2"
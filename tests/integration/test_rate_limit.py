@@ -0,0 +1,51 @@
+import pytest
+
+from src.database.models import User
+from src.server.middleware.rate_limit import MemoryBackend, RateLimitStore, rate_limit
+from src.server.utils.jwt import create_access_token
+
+
+@pytest.fixture
+def limited(monkeypatch):
+    """Allow bursts of 2 requests, refilled every 100 seconds."""
+    monkeypatch.setattr(rate_limit, "rate", 0.01)
+    monkeypatch.setattr(rate_limit, "burst", 2)
+    RateLimitStore.configure(MemoryBackend())
+    yield
+    RateLimitStore.configure(MemoryBackend())
+
+
+def test_requests_over_the_burst_are_rejected(client, auth_headers, limited):
+    """Test the third request is rejected with 429 before any DB query."""
+    for _ in range(2):
+        assert client.get("/tasks/", headers=auth_headers).status_code == 200
+
+    response = client.get("/tasks/", headers=auth_headers)
+    assert response.status_code == 429
+    assert response.json()["detail"]["error_code"] == "RATE_LIMITED"
+    assert response.headers["Retry-After"] == "100"
+    assert response.headers["X-DB-Queries"] == "0"
+
+
+def test_buckets_are_per_user_and_route(client, run, auth_headers, limited):
+    """Test exhausting one route leaves other routes and users alone."""
+    for _ in range(2):
+        client.get("/tasks/", headers=auth_headers)
+    assert client.get("/tasks/", headers=auth_headers).status_code == 429
+    assert client.get("/categories/", headers=auth_headers).status_code == 200
+    # Other methods on the same path have their own bucket.
+    assert client.post("/tasks/", json={}, headers=auth_headers).status_code == 422
+
+    other = run(User.create, clerk_id="user_other", email="other@example.com")
+    other_headers = {
+        "Authorization": f"Bearer {create_access_token(user_id=str(other.id))}"
+    }
+    assert client.get("/tasks/", headers=other_headers).status_code == 200
+
+
+def test_invalid_tokens_are_left_to_auth(client, limited):
+    """Test requests without a valid token are not counted, only rejected."""
+    headers = {"Authorization": "Bearer not-a-token"}
+    for _ in range(3):
+        assert client.get("/tasks/", headers=headers).status_code == 401
+    assert client.get("/tasks/").status_code == 403
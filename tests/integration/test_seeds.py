@@ -0,0 +1,52 @@
+from datetime import date
+
+from src.database.models import Habit, HabitCompletionRollup, Task, User
+from src.database.models.enums import Frequency, RollupPeriod
+from src.database.seeds.synthetic_seeds import (
+    SyntheticProfile,
+    generate_user_rows,
+    seed_synthetic,
+)
+
+PROFILE = SyntheticProfile(tasks_per_user=10, habit_history_days=14)
+
+
+def row_ids(rows):
+    return {kind: [row.id for row in batch] for kind, batch in rows.items()}
+
+
+def test_synthetic_rows_are_deterministic(client):
+    """Test the same seed and user index always generate the same rows."""
+    today = date(2026, 1, 1)
+    first = row_ids(generate_user_rows(3, 42, PROFILE, today))
+
+    assert row_ids(generate_user_rows(3, 42, PROFILE, today)) == first
+    assert row_ids(generate_user_rows(3, 43, PROFILE, today)) != first
+
+
+def test_seed_synthetic(client, run, user):
+    """Test synthetic seeding inserts every kind of row and builds rollups."""
+    habit = run(Habit.create, user=user, name="Read", frequency=Frequency.DAILY)
+    # Not backed by completions: a rebuild of this habit would drop it.
+    run(
+        HabitCompletionRollup.create,
+        user=user,
+        habit=habit,
+        period=RollupPeriod.DAY,
+        period_start=date(2026, 1, 1),
+        completed_count=1,
+        completion_days=1,
+    )
+    results = run(seed_synthetic, 5, seed=1, chunk_size=50, profile=PROFILE)
+
+    assert results["users"] == 5
+    assert run(User.filter(clerk_id__startswith="user_synthetic_1_").count) == 5
+    assert run(Task.all().count) == results["tasks"] + results["subtasks"]
+    # Only the seeded habits' rollups are rebuilt.
+    assert run(HabitCompletionRollup.filter(habit=habit).count) == 1
+    assert results["habit_rollups"] == run(
+        HabitCompletionRollup.exclude(habit=habit).count
+    )
+    assert results["total"] == sum(
+        count for kind, count in results.items() if kind != "total"
+    )
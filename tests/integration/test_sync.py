@@ -0,0 +1,102 @@
+import pytest
+
+from src.database.models import Category, Habit
+from src.database.models.enums import Frequency
+from src.database.queries import explain
+from src.server.services.sync_service import SYNC_ENTITIES
+
+
+def sync(client, auth_headers, **params):
+    response = client.get("/sync/", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def create_task(client, auth_headers, title, **fields):
+    response = client.post(
+        "/tasks/", json={"title": title, **fields}, headers=auth_headers
+    )
+    return response.json()["id"]
+
+
+def test_sync_unauthorized(client):
+    """Test syncing without authentication should return 403."""
+    assert client.get("/sync/").status_code == 403
+
+
+def test_sync_invalid_cursor(client, auth_headers):
+    """Test a malformed cursor should return 422."""
+    response = client.get("/sync/", params={"cursor": "nope"}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_sync_full_then_delta(client, run, user, auth_headers):
+    """Test a first sync returns everything and later ones only the changes."""
+    category = run(Category.create, user=user, name="Work")
+    run(Habit.create, user=user, name="Read", frequency=Frequency.DAILY)
+    first = create_task(client, auth_headers, "First", category_id=str(category.id))
+    second = create_task(client, auth_headers, "Second")
+    deleted = create_task(client, auth_headers, "Deleted before first sync")
+    client.delete(f"/tasks/{deleted}", headers=auth_headers)
+
+    body = sync(client, auth_headers)
+    assert [task["id"] for task in body["changes"]["tasks"]] == [first, second]
+    assert body["changes"]["categories"][0]["name"] == "Work"
+    assert body["changes"]["habits"][0]["name"] == "Read"
+    assert body["deleted"] == {"tasks": [], "categories": [], "habits": []}
+    assert body["has_more"] is False
+    # Null fields are left out.
+    assert "description" not in body["changes"]["tasks"][0]
+
+    # Nothing changed since.
+    body = sync(client, auth_headers, cursor=body["cursor"])
+    assert body["changes"] == {"tasks": [], "categories": [], "habits": []}
+    cursor = body["cursor"]
+
+    client.patch(f"/tasks/{second}", json={"priority": 4}, headers=auth_headers)
+    client.delete(f"/tasks/{first}", headers=auth_headers)
+    third = create_task(client, auth_headers, "Third")
+
+    body = sync(client, auth_headers, cursor=cursor)
+    changed = {task["id"]: task for task in body["changes"]["tasks"]}
+    assert set(changed) == {second, third}
+    assert changed[second]["priority"] == 4
+    assert body["deleted"]["tasks"] == [first]
+    assert body["changes"]["categories"] == []
+
+
+@pytest.mark.query_budget(4)
+def test_sync_query_budget(client, auth_headers):
+    """Test a sync page runs one query per type besides authentication."""
+    create_task(client, auth_headers, "Task")
+    body = sync(client, auth_headers)
+    sync(client, auth_headers, cursor=body["cursor"])
+
+
+def test_sync_pages_through_large_deltas(client, auth_headers):
+    """Test changes beyond the limit are returned on the following pages."""
+    task_ids = [create_task(client, auth_headers, f"Task {n}") for n in range(7)]
+
+    received, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        body = sync(client, auth_headers, **params)
+        received += [task["id"] for task in body["changes"]["tasks"]]
+        cursor, pages = body["cursor"], pages + 1
+        if not body["has_more"]:
+            break
+    assert received == task_ids
+    assert pages == 3
+
+
+def test_sync_uses_updated_at_index(client, run, user):
+    """Test the delta query of each type is served by its updated_at index."""
+    for entity, (model, fields) in SYNC_ENTITIES.items():
+        query = (
+            model.filter(user_id=user.id, updated_at__gte="2026-01-01")
+            .order_by("updated_at", "id")
+            .limit(10)
+            .values(*fields)
+        )
+        plan = " ".join(run(explain, query.sql(params_inline=True)))
+        assert f"idx_{entity}_user_updated" in plan
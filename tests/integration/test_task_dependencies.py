@@ -0,0 +1,98 @@
+from uuid import uuid4
+
+from src.database.models import TaskDependency
+
+
+def create_task(client, auth_headers, **data):
+    response = client.post("/tasks/", json=data, headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_dependency_endpoints_unauthorized(client):
+    """Test dependency endpoints without authentication should return 403."""
+    task_id = str(uuid4())
+    assert client.get("/tasks/blocked").status_code == 403
+    assert client.get("/tasks/schedule").status_code == 403
+    assert client.get(f"/tasks/{task_id}/dependencies").status_code == 403
+
+
+def test_add_dependency_and_schedule(client, auth_headers):
+    """Test dependencies drive blocked tasks and the schedule."""
+    design = create_task(client, auth_headers, title="Design", estimated_duration=60)
+    build = create_task(client, auth_headers, title="Build", estimated_duration=120)
+
+    response = client.post(
+        f"/tasks/{build}/dependencies",
+        json={"prerequisite_task_id": design},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    blocked = client.get("/tasks/blocked", headers=auth_headers).json()
+    assert blocked["tasks"] == [{"task_id": build, "blocked_by": [design]}]
+
+    schedule = client.get("/tasks/schedule", headers=auth_headers).json()
+    assert schedule["order"] == [design, build]
+    assert schedule["critical_path_duration"] == 180
+
+    # Completing the prerequisite unblocks the dependent task
+    client.patch(f"/tasks/{design}", json={"status": "completed"}, headers=auth_headers)
+    blocked = client.get("/tasks/blocked", headers=auth_headers).json()
+    assert blocked["total"] == 0
+
+
+def test_add_dependency_rejects_cycle(client, auth_headers):
+    """Test a dependency that would create a cycle returns 422."""
+    first = create_task(client, auth_headers, title="First")
+    second = create_task(client, auth_headers, title="Second")
+    client.post(
+        f"/tasks/{second}/dependencies",
+        json={"prerequisite_task_id": first},
+        headers=auth_headers,
+    )
+
+    response = client.post(
+        f"/tasks/{first}/dependencies",
+        json={"prerequisite_task_id": second},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]["details"]["cycle"] == [second, first, second]
+
+
+def test_schedule_with_cycle(client, run, auth_headers):
+    """Test a cycle left by concurrent additions is reported, not a 500."""
+    first = create_task(client, auth_headers, title="First")
+    second = create_task(client, auth_headers, title="Second")
+    for prerequisite, dependent in ((first, second), (second, first)):
+        run(
+            TaskDependency.create,
+            prerequisite_task_id=prerequisite,
+            dependent_task_id=dependent,
+        )
+
+    response = client.get("/tasks/schedule", headers=auth_headers)
+    assert response.status_code == 422
+    assert response.json()["detail"]["error_code"] == "VALIDATION_ERROR"
+
+
+def test_remove_dependency(client, auth_headers):
+    """Test removing a dependency clears it from the task."""
+    first = create_task(client, auth_headers, title="First")
+    second = create_task(client, auth_headers, title="Second")
+    client.post(
+        f"/tasks/{second}/dependencies",
+        json={"prerequisite_task_id": first},
+        headers=auth_headers,
+    )
+
+    response = client.delete(
+        f"/tasks/{second}/dependencies/{first}", headers=auth_headers
+    )
+    assert response.status_code == 204
+
+    dependencies = client.get(
+        f"/tasks/{second}/dependencies", headers=auth_headers
+    ).json()
+    assert dependencies["prerequisite_task_ids"] == []
@@ -0,0 +1,57 @@
+def conditional(auth_headers, etag):
+    return {**auth_headers, "If-None-Match": etag}
+
+
+def test_get_task_etag(client, auth_headers):
+    """Test a task is not resent until it changes."""
+    task_id = client.post(
+        "/tasks/", json={"title": "Cached"}, headers=auth_headers
+    ).json()["id"]
+
+    response = client.get(f"/tasks/{task_id}", headers=auth_headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = client.get(f"/tasks/{task_id}", headers=conditional(auth_headers, etag))
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    client.patch(f"/tasks/{task_id}", json={"priority": 4}, headers=auth_headers)
+    response = client.get(f"/tasks/{task_id}", headers=conditional(auth_headers, etag))
+    assert response.status_code == 200
+    assert response.json()["priority"] == 4
+    assert response.headers["ETag"] != etag
+
+
+def test_list_tasks_etag(client, auth_headers):
+    """Test the list is revalidated against creates, deletes and query changes."""
+    task_id = client.post(
+        "/tasks/", json={"title": "First"}, headers=auth_headers
+    ).json()["id"]
+    etag = client.get("/tasks/", headers=auth_headers).headers["ETag"]
+
+    response = client.get("/tasks/", headers=conditional(auth_headers, etag))
+    assert response.status_code == 304
+    # Several ETags and strong comparison against the weak one also match
+    response = client.get(
+        "/tasks/", headers=conditional(auth_headers, f'"other", {etag[2:]}')
+    )
+    assert response.status_code == 304
+
+    # Other query parameters are another representation
+    response = client.get(
+        "/tasks/", params={"page_size": 5}, headers=conditional(auth_headers, etag)
+    )
+    assert response.status_code == 200
+
+    client.post("/tasks/", json={"title": "Second"}, headers=auth_headers)
+    response = client.get("/tasks/", headers=conditional(auth_headers, etag))
+    assert response.status_code == 200
+    assert response.json()["total"] == 2
+
+    etag = response.headers["ETag"]
+    client.delete(f"/tasks/{task_id}", headers=auth_headers)
+    response = client.get("/tasks/", headers=conditional(auth_headers, etag))
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
@@ -0,0 +1,63 @@
+import csv
+import gzip
+import io
+import json
+
+from src.server.services import task_export_service
+
+
+def create_tasks(client, auth_headers, count):
+    return [
+        client.post(
+            "/tasks/",
+            json={"title": f"Task {n}", "priority": n % 5, "due_date": "2026-01-15"},
+            headers=auth_headers,
+        ).json()["id"]
+        for n in range(count)
+    ]
+
+
+def test_export_tasks_unauthorized(client):
+    """Test exporting tasks without authentication should return 403."""
+    assert client.get("/tasks/export").status_code == 403
+
+
+def test_export_tasks_ndjson(client, auth_headers, monkeypatch):
+    """Test every live task is streamed as one JSON object per line."""
+    monkeypatch.setattr(task_export_service, "EXPORT_CHUNK_SIZE", 2)
+    task_ids = create_tasks(client, auth_headers, 5)
+    client.delete(f"/tasks/{task_ids[0]}", headers=auth_headers)
+
+    response = client.get("/tasks/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["id"] for row in rows) == sorted(task_ids[1:])
+    assert rows[0]["due_date"] == "2026-01-15"
+    assert rows[0]["status"] == "pending"
+
+
+def test_export_tasks_csv_gzip(client, auth_headers):
+    """Test CSV export with a header row, compressed with gzip."""
+    task_ids = create_tasks(client, auth_headers, 3)
+
+    response = client.get(
+        "/tasks/export", params={"format": "csv", "gzip": True}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert "tasks.csv.gz" in response.headers["content-disposition"]
+
+    text = gzip.decompress(response.content).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert sorted(row["id"] for row in rows) == sorted(task_ids)
+    assert rows[0]["parent_task_id"] == ""
+
+
+def test_export_tasks_csv_empty(client, auth_headers):
+    """Test an empty CSV export still has the header row."""
+    response = client.get(
+        "/tasks/export", params={"format": "csv"}, headers=auth_headers
+    )
+    assert response.text.splitlines() == [",".join(task_export_service.EXPORT_FIELDS)]
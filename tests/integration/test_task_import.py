@@ -0,0 +1,126 @@
+import gzip
+import json
+import uuid
+from datetime import time
+
+from src.database.models import Task
+from src.server.services import task_import_service
+
+
+def ndjson(*rows):
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+def upload(client, auth_headers, content, filename="tasks.ndjson", **params):
+    return client.post(
+        "/tasks/import",
+        files={"file": (filename, content)},
+        params=params,
+        headers=auth_headers,
+    )
+
+
+def test_import_tasks_unauthorized(client):
+    """Test importing tasks without authentication should return 403."""
+    response = client.post("/tasks/import", files={"file": ("tasks.ndjson", b"")})
+    assert response.status_code == 403
+
+
+def test_import_tasks_ndjson(client, auth_headers, monkeypatch):
+    """Test NDJSON rows are inserted in batches, linking parents found later."""
+    monkeypatch.setattr(task_import_service, "IMPORT_BATCH_SIZE", 2)
+    parent_id, child_id = str(uuid.uuid4()), str(uuid.uuid4())
+    content = ndjson(
+        {"id": child_id, "title": "Child", "parent_task_id": parent_id},
+        {"title": "Plain", "priority": 4, "due_date": "2026-01-15"},
+        {"title": "Done", "status": "completed"},
+        {"id": parent_id, "title": "Parent"},
+    )
+
+    response = upload(client, auth_headers, content)
+    assert response.status_code == 200
+    assert response.json() == {
+        "created": 4,
+        "skipped": 0,
+        "error_count": 0,
+        "errors": [],
+    }
+
+    child = client.get(f"/tasks/{child_id}", headers=auth_headers).json()
+    assert child["parent_task_id"] == parent_id
+    tasks = client.get("/tasks/", headers=auth_headers).json()["tasks"]
+    done = next(task for task in tasks if task["title"] == "Done")
+    assert done["completed_at"] is not None
+
+
+def test_import_tasks_reports_errors(client, auth_headers):
+    """Test invalid rows are reported by line while valid rows are imported."""
+    content = ndjson(
+        {"title": "Valid"},
+        {"priority": 2},
+        {"title": "Bad priority", "priority": 9},
+        {"title": "Unknown category", "category_id": str(uuid.uuid4())},
+        {"title": "Orphan", "parent_task_id": str(uuid.uuid4())},
+    )
+    content += b"\nnot json"
+
+    body = upload(client, auth_headers, content).json()
+    assert body["created"] == 2
+    assert body["error_count"] == 5
+    assert [error["line"] for error in body["errors"]] == [2, 3, 4, 5, 6]
+    assert body["errors"][0]["message"].startswith("title:")
+    assert body["errors"][2]["message"] == "category_id: not found"
+    assert "imported without parent" in body["errors"][3]["message"]
+
+
+def test_import_export_round_trip_csv_gzip(client, auth_headers):
+    """Test a gzipped CSV export imports again, skipping tasks that exist."""
+    for n in range(3):
+        client.post("/tasks/", json={"title": f"Task {n}"}, headers=auth_headers)
+    export = client.get(
+        "/tasks/export", params={"format": "csv", "gzip": True}, headers=auth_headers
+    )
+
+    response = upload(client, auth_headers, export.content, filename="tasks.csv.gz")
+    assert response.json()["created"] == 0
+    assert response.json()["skipped"] == 3
+
+    # A fresh copy, with new ids, is imported in full.
+    text = gzip.decompress(export.content).decode().splitlines()
+    header = text[0].split(",")
+    rows = [line.split(",")[1:] for line in text[1:]]
+    content = "\n".join([",".join(header[1:])] + [",".join(row) for row in rows])
+    response = upload(client, auth_headers, content.encode(), filename="copy.csv")
+    assert response.json()["created"] == 3
+    assert len(client.get("/tasks/", headers=auth_headers).json()["tasks"]) == 6
+
+
+def test_import_export_round_trip_keeps_due_time(client, run, user, auth_headers):
+    """Test an exported due_time is imported again."""
+    run(Task.create, user=user, title="Standup", due_time=time(9, 30))
+    export = client.get("/tasks/export", headers=auth_headers)
+    run(Task.all().delete)
+
+    response = upload(client, auth_headers, export.content)
+    assert response.json()["created"] == 1
+    due_time = run(Task.get, title="Standup").due_time
+    assert due_time.replace(tzinfo=None) == time(9, 30)
+
+
+def test_import_export_round_trip_keeps_line_separators(
+    client, run, user, auth_headers
+):
+    """Test titles holding Unicode line separators survive a round trip."""
+    titles = {"a\u2028b", "c\u2029d", "e\x85f", "g\x0bh\x1ci"}
+    for title in titles:
+        run(Task.create, user=user, title=title)
+
+    for fmt in ("ndjson", "csv"):
+        export = client.get(
+            "/tasks/export", params={"format": fmt}, headers=auth_headers
+        )
+        run(Task.all().delete)
+        response = upload(client, auth_headers, export.content, filename=f"t.{fmt}")
+        assert response.json()["error_count"] == 0
+        assert response.json()["created"] == len(titles)
+        assert set(run(Task.all().values_list, "title", flat=True)) == titles
@@ -0,0 +1,59 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.database.models import Task, User
+from src.database.models.enums import TaskStatus
+from src.database.queries import explain, get_connection
+from src.server.schemas.task_schemas import TaskListQueryParams
+from src.server.services.task_service import TaskService
+
+
+async def seed_tasks(users: int = 10, tasks_per_user: int = 100):
+    """Seed enough rows (a third of them soft-deleted) for ANALYZE stats."""
+    rnd = random.Random(1)
+    owners = [
+        await User.create(clerk_id=f"plan_{i}", email=f"plan_{i}@example.com")
+        for i in range(users)
+    ]
+    await Task.bulk_create(
+        [
+            Task(
+                user_id=owner.id,
+                title=f"Task {n}",
+                status=rnd.choice(list(TaskStatus)),
+                priority=rnd.randint(0, 4),
+                due_date=date(2024, 1, 1) + timedelta(days=rnd.randint(0, 700)),
+                deleted_at=datetime.now() if n % 3 == 0 else None,
+            )
+            for owner in owners
+            for n in range(tasks_per_user)
+        ]
+    )
+    await get_connection().execute_script("ANALYZE")
+    return owners[0]
+
+
+@pytest.mark.parametrize(
+    "params, part, index",
+    [
+        ({}, "count", "idx_tasks_live_user_created"),
+        ({}, "page", "idx_tasks_live_user_created"),
+        ({"status": "pending"}, "count", "idx_tasks_live_user_status"),
+        ({"due_date_from": "2024-06-01"}, "count", "idx_tasks_live_user_due"),
+        ({"sort_by": "due_date"}, "page", "idx_tasks_live_user_due"),
+    ],
+)
+def test_list_queries_use_live_indexes(client, run, params, part, index):
+    """Test task list queries are served by the partial live-row indexes."""
+    user = run(seed_tasks)
+    query_params = TaskListQueryParams(**params)
+    query = TaskService.build_list_query(user, query_params)
+    if part == "count":
+        query = query.count()
+    else:
+        query = TaskService.build_page_query(query, query_params)
+
+    plan = run(explain, query.sql(params_inline=True))
+    assert any(index in step for step in plan)
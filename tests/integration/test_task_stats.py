@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.database.models import Task, TaskStats
+from src.server.services.task_stats_service import TaskStatsService
+
+TODAY = date.today()
+
+
+def stats(client, auth_headers):
+    response = client.get("/tasks/stats", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def create_task(client, auth_headers, **fields):
+    response = client.post(
+        "/tasks/", json={"title": "Task", **fields}, headers=auth_headers
+    )
+    return response.json()["id"]
+
+
+def test_task_stats_unauthorized(client):
+    """Test task stats without authentication should return 403."""
+    assert client.get("/tasks/stats").status_code == 403
+
+
+def test_task_stats_built_on_first_read(client, run, user, auth_headers):
+    """Test counters are built from existing tasks on the first request."""
+    run(Task.create, user=user, title="Old", due_date=TODAY - timedelta(days=2))
+    run(Task.create, user=user, title="Today", due_date=TODAY)
+    run(Task.create, user=user, title="Done", status="completed", due_date=TODAY)
+
+    body = stats(client, auth_headers)
+    assert body["total"] == 3
+    assert body["by_status"] == {
+        "pending": 2,
+        "in_progress": 0,
+        "completed": 1,
+        "cancelled": 0,
+    }
+    assert body["overdue"] == 1
+    assert body["due_today"] == 1
+
+
+def test_task_stats_follow_writes(client, auth_headers):
+    """Test create, update, patch, delete and restore move the counters."""
+    stats(client, auth_headers)  # Build the (empty) counters
+    yesterday = (TODAY - timedelta(days=1)).isoformat()
+    parent = create_task(client, auth_headers, due_date=yesterday)
+    create_task(client, auth_headers, parent_task_id=parent, due_date=yesterday)
+    other = create_task(client, auth_headers, due_date=TODAY.isoformat())
+
+    body = stats(client, auth_headers)
+    assert (body["total"], body["overdue"], body["due_today"]) == (3, 2, 1)
+
+    client.patch(f"/tasks/{other}", json={"status": "completed"}, headers=auth_headers)
+    body = stats(client, auth_headers)
+    assert body["by_status"]["completed"] == 1
+    assert body["due_today"] == 0
+
+    client.put(
+        f"/tasks/{other}",
+        json={"title": "Reopened", "status": "in_progress"},
+        headers=auth_headers,
+    )
+    assert stats(client, auth_headers)["due_today"] == 1
+
+    client.delete(f"/tasks/{parent}", headers=auth_headers)
+    body = stats(client, auth_headers)
+    assert (body["total"], body["overdue"]) == (1, 0)
+
+    client.post(f"/tasks/{parent}/restore", headers=auth_headers)
+    body = stats(client, auth_headers)
+    assert (body["total"], body["overdue"]) == (3, 2)
+
+
+def test_task_stats_follow_imports(client, auth_headers):
+    """Test bulk imported tasks are counted."""
+    stats(client, auth_headers)
+    content = b'{"title": "A", "status": "completed"}\n{"title": "B"}\n'
+    client.post(
+        "/tasks/import",
+        files={"file": ("tasks.ndjson", content)},
+        headers=auth_headers,
+    )
+    body = stats(client, auth_headers)
+    assert body["by_status"]["completed"] == 1
+    assert body["by_status"]["pending"] == 1
+
+
+@pytest.mark.query_budget(3)
+def test_task_stats_query_budget(client, run, user, auth_headers):
+    """Test reading built counters does not depend on the number of tasks."""
+    for _ in range(5):
+        run(Task.create, user=user, title="Task", due_date=TODAY)
+    run(TaskStatsService.rebuild, [user.id])
+    assert stats(client, auth_headers)["due_today"] == 5
+
+
+def test_reconcile_repairs_drift(client, run, user, auth_headers):
+    """Test the reconciliation job fixes counters that no longer match."""
+    create_task(client, auth_headers, due_date=TODAY.isoformat())
+    stats(client, auth_headers)
+    assert run(TaskStatsService.reconcile) == 0
+
+    # Writes that bypass the task service
+    run(Task.create, user=user, title="Raw", due_date=TODAY)
+    run(lambda: TaskStats.filter(user_id=user.id).update(cancelled=7))
+
+    assert run(TaskStatsService.reconcile) == 1
+    body = stats(client, auth_headers)
+    assert body["by_status"]["cancelled"] == 0
+    assert body["by_status"]["pending"] == 2
+    assert body["due_today"] == 2
+    assert run(TaskStatsService.reconcile) == 0
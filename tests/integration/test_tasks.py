@@ -1,5 +1,9 @@
+from datetime import datetime
 from uuid import uuid4
 
+from src.database.models import NotificationQueue, TaskReminder
+from src.database.models.enums import NotificationStatus, NotificationType
+
 
 def test_get_tasks_unauthorized(client):
     """Test getting tasks without authentication should return 403."""
@@ -90,3 +94,107 @@ def test_task_endpoints_exist(client):
         assert response.status_code == 403, (
             f"Endpoint {method} {endpoint} returned {response.status_code}"
         )
+
+
+def test_get_task_tree(client, auth_headers):
+    """Test the subtask tree is returned nested with rolled-up aggregates."""
+
+    def create(title, parent=None, **data):
+        response = client.post(
+            "/tasks/",
+            json={"title": title, "parent_task_id": parent, **data},
+            headers=auth_headers,
+        )
+        return response.json()["id"]
+
+    root = create("Project")
+    phase = create("Phase", root)
+    create("Done", phase, estimated_duration=30, status="completed")
+    create("Half", phase, estimated_duration=90, completion_percentage=50)
+    create("Solo", root, estimated_duration=60)
+
+    response = client.get(f"/tasks/{root}/tree", headers=auth_headers)
+    assert response.status_code == 200
+    tree = response.json()
+
+    assert tree["descendant_count"] == 4
+    assert tree["rollup_estimated_duration"] == 180
+    assert tree["rollup_completion_percentage"] == 50
+    assert [t["title"] for t in tree["subtasks"]] == ["Phase", "Solo"]
+    assert tree["subtasks"][0]["rollup_completion_percentage"] == 75
+
+    # Depth limits trim the nesting but keep the full-subtree aggregates
+    response = client.get(
+        f"/tasks/{root}/tree", params={"max_depth": 1}, headers=auth_headers
+    )
+    tree = response.json()
+    assert tree["subtasks"][0]["subtasks"] == []
+    assert tree["subtasks"][0]["subtask_count"] == 2
+    assert tree["rollup_estimated_duration"] == 180
+
+
+def test_get_task_tree_not_found(client, auth_headers):
+    """Test the tree of an unknown task returns 404."""
+    response = client.get(f"/tasks/{uuid4()}/tree", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_delete_and_restore_cascade(client, run, user, auth_headers):
+    """Test deleting a task cascades to its subtree and restore undoes it."""
+
+    def create(title, parent=None):
+        response = client.post(
+            "/tasks/",
+            json={"title": title, "parent_task_id": parent},
+            headers=auth_headers,
+        )
+        return response.json()["id"]
+
+    root = create("Project")
+    child = create("Child", root)
+    grandchild = create("Grandchild", child)
+    unrelated = create("Unrelated")
+
+    run(
+        TaskReminder.create,
+        task_id=grandchild,
+        reminder_minutes=10,
+        notification_type=NotificationType.PUSH,
+    )
+    for notification_status in (NotificationStatus.PENDING, NotificationStatus.SENT):
+        run(
+            NotificationQueue.create,
+            user=user,
+            task_id=child,
+            scheduled_time=datetime.now(),
+            notification_type=NotificationType.PUSH,
+            status=notification_status,
+        )
+
+    response = client.delete(f"/tasks/{root}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["deleted_counts"] == {
+        "task_reminders": 1,
+        "task_time_logs": 0,
+        "notification_queue": 1,
+        "tasks": 3,
+    }
+    for task_id in (root, child, grandchild):
+        response = client.get(f"/tasks/{task_id}", headers=auth_headers)
+        assert response.status_code == 404
+    assert client.get(f"/tasks/{unrelated}", headers=auth_headers).status_code == 200
+
+    response = client.post(f"/tasks/{root}/restore", headers=auth_headers)
+    assert response.status_code == 200
+    tree = client.get(f"/tasks/{root}/tree", headers=auth_headers).json()
+    assert tree["descendant_count"] == 2
+    live_reminders = run(lambda: TaskReminder.filter(deleted_at__isnull=True).count())
+    assert live_reminders == 1
+
+
+def test_restore_task_not_deleted(client, auth_headers):
+    """Test restoring a task that is not deleted returns 404."""
+    response = client.post("/tasks/", json={"title": "Live"}, headers=auth_headers)
+    task_id = response.json()["id"]
+    response = client.post(f"/tasks/{task_id}/restore", headers=auth_headers)
+    assert response.status_code == 404
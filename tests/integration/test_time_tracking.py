@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from tortoise import timezone
+from tortoise.queryset import QuerySet
+
+from src.database.models import TaskTimeLog, TaskTimeRollup
+
+
+async def _zero():
+    return 0
+
+
+def create_task(client, auth_headers, **fields):
+    response = client.post(
+        "/tasks/", json={"title": "Write report", **fields}, headers=auth_headers
+    )
+    return response.json()["id"]
+
+
+def backdate_timer(run, task_id, minutes):
+    """Pretend the running timer of a task was started ``minutes`` ago."""
+    run(
+        TaskTimeLog.filter(task_id=task_id, end_time__isnull=True).update,
+        start_time=timezone.now() - timedelta(minutes=minutes),
+    )
+
+
+def test_time_endpoints_unauthorized(client):
+    """Test time tracking endpoints without authentication should return 403."""
+    assert client.post(f"/time/tasks/{uuid4()}/start").status_code == 403
+    assert client.get("/time/running").status_code == 403
+    assert client.get("/time/report").status_code == 403
+
+
+def test_start_and_stop_timer(client, run, auth_headers):
+    """Test a stopped timer adds its duration to the task."""
+    task_id = create_task(client, auth_headers, actual_duration=10)
+
+    response = client.post(
+        f"/time/tasks/{task_id}/start", json={"notes": "Draft"}, headers=auth_headers
+    )
+    assert response.status_code == 201
+    assert response.json()["end_time"] is None
+    assert response.json()["notes"] == "Draft"
+
+    running = client.get("/time/running", headers=auth_headers).json()
+    assert [timer["task_id"] for timer in running] == [task_id]
+
+    backdate_timer(run, task_id, 25)
+    response = client.post(f"/time/tasks/{task_id}/stop", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["duration_minutes"] == 25
+    assert response.json()["end_time"] is not None
+
+    task = client.get(f"/tasks/{task_id}", headers=auth_headers).json()
+    assert task["actual_duration"] == 35
+    assert client.get("/time/running", headers=auth_headers).json() == []
+
+
+def test_one_running_timer_per_task(client, auth_headers):
+    """Test a second start and a stop without timer are rejected."""
+    task_id = create_task(client, auth_headers)
+
+    response = client.post(f"/time/tasks/{task_id}/stop", headers=auth_headers)
+    assert response.status_code == 422
+
+    client.post(f"/time/tasks/{task_id}/start", headers=auth_headers)
+    response = client.post(f"/time/tasks/{task_id}/start", headers=auth_headers)
+    assert response.status_code == 422
+
+    other_id = create_task(client, auth_headers)
+    response = client.post(f"/time/tasks/{other_id}/start", headers=auth_headers)
+    assert response.status_code == 201
+
+    response = client.post(f"/time/tasks/{uuid4()}/start", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_time_report_per_category(client, run, auth_headers):
+    """Test the report groups tracked time by category and day."""
+    category = client.post(
+        "/categories/", json={"name": "Work"}, headers=auth_headers
+    ).json()
+    work_id = create_task(client, auth_headers, category_id=category["id"])
+    loose_id = create_task(client, auth_headers)
+
+    for task_id, minutes in ((work_id, 30), (work_id, 15), (loose_id, 10)):
+        client.post(f"/time/tasks/{task_id}/start", headers=auth_headers)
+        backdate_timer(run, task_id, minutes)
+        client.post(f"/time/tasks/{task_id}/stop", headers=auth_headers)
+
+    report = client.get("/time/report", headers=auth_headers).json()
+    assert report["total_minutes"] == 55
+    assert [(c["category_name"], c["minutes"]) for c in report["by_category"]] == [
+        ("Work", 45),
+        (None, 10),
+    ]
+    assert sum(day["minutes"] for day in report["by_day"]) == 55
+
+
+@pytest.mark.query_budget(3)
+def test_time_report_reads_rollups(client, run, user, auth_headers):
+    """Test the report does not read time logs, however many there are."""
+    today = datetime.now().date()
+    for offset in range(30):
+        run(
+            TaskTimeRollup.create,
+            user=user,
+            day=today - timedelta(days=offset),
+            seconds=3600,
+        )
+
+    response = client.get(
+        "/time/report",
+        params={"date_from": (today - timedelta(days=29)).isoformat()},
+        headers=auth_headers,
+    )
+    assert response.json()["total_minutes"] == 30 * 60
+    assert len(response.json()["by_day"]) == 30
+
+
+def test_time_report_validation(client, auth_headers):
+    """Test inverted and oversized windows are rejected."""
+    response = client.get(
+        "/time/report",
+        params={"date_from": "2026-02-01", "date_to": "2026-01-01"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+    response = client.get(
+        "/time/report",
+        params={"date_from": "2024-01-01", "date_to": "2026-01-01"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+
+def test_concurrent_stops_share_one_rollup(client, run, auth_headers, monkeypatch):
+    """Test a stop racing another one to create the day's rollup adds to it."""
+    task_id = create_task(client, auth_headers)
+    client.post(f"/time/tasks/{task_id}/start", headers=auth_headers)
+    backdate_timer(run, task_id, 25)
+    client.post(f"/time/tasks/{task_id}/stop", headers=auth_headers)
+
+    # The next stop's update misses, as if the row was created meanwhile.
+    update = QuerySet.update
+    missed = []
+
+    def miss_once(self, **kwargs):
+        if self.model is TaskTimeRollup and not missed:
+            missed.append(True)
+            return _zero()
+        return update(self, **kwargs)
+
+    monkeypatch.setattr(QuerySet, "update", miss_once)
+    client.post(f"/time/tasks/{task_id}/start", headers=auth_headers)
+    backdate_timer(run, task_id, 5)
+    response = client.post(f"/time/tasks/{task_id}/stop", headers=auth_headers)
+    assert response.status_code == 200
+    assert missed
+
+    rows = run(TaskTimeRollup.filter(category_id__isnull=True).values, "day")
+    assert len(rows) == len({row["day"] for row in rows})
+    report = client.get("/time/report", headers=auth_headers).json()
+    assert report["total_minutes"] == 30
@@ -1,12 +1,23 @@
-def test_get_users(client):
-    """Test getting all users - should return empty list initially."""
-    response = client.get("/users/")
+from src.database.models import User
+from src.server.services import user_service
+
+
+def test_get_users(client, user, auth_headers):
+    """Test getting all users - only the authenticated user exists initially."""
+    response = client.get("/users/", headers=auth_headers)
     assert response.status_code == 200
 
     # Parse JSON response
     users = response.json()
     assert isinstance(users, list)
-    assert len(users) == 0
+    assert [u["id"] for u in users] == [str(user.id)]
+
+
+def test_get_users_unauthorized(client):
+    """Test listing users needs a valid token."""
+    assert client.get("/users/").status_code == 403
+    response = client.get("/users/", headers={"Authorization": "Bearer invalid"})
+    assert response.status_code == 401
 
 
 def test_get_user_by_id_not_found(client):
@@ -18,3 +29,54 @@ def test_get_user_by_id_not_found(client):
     error_data = response.json()
     assert "detail" in error_data
     assert "not found" in error_data["detail"].lower()
+
+
+def test_get_users_keyset_pagination(client, run, auth_headers):
+    """Test users are paged by id with a cursor in the X-Next-Cursor header."""
+    for n in range(3):
+        run(User.create, clerk_id=f"page_{n}", email=f"page_{n}@example.com")
+
+    response = client.get("/users/", params={"limit": 2}, headers=auth_headers)
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 2
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == first_page[-1]["id"]
+
+    response = client.get(
+        "/users/", params={"limit": 2, "after": cursor}, headers=auth_headers
+    )
+    second_page = response.json()
+    assert len(second_page) == 2
+    assert "X-Next-Cursor" not in response.headers
+    assert {u["id"] for u in first_page + second_page} == {
+        str(u.id) for u in run(User.all)
+    }
+
+
+def test_get_users_fields(client, user, auth_headers):
+    """Test only the requested fields (plus id) are returned."""
+    response = client.get("/users/", params={"fields": "email"}, headers=auth_headers)
+    assert response.json() == [{"id": str(user.id), "email": user.email}]
+
+    response = client.get(
+        "/users/", params={"fields": "email,password"}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+
+def test_export_users(client, run, auth_headers, monkeypatch):
+    """Test the streaming export returns every user as one JSON array."""
+    monkeypatch.setattr(user_service, "EXPORT_CHUNK_SIZE", 2)
+    for n in range(5):
+        run(User.create, clerk_id=f"export_{n}", email=f"export_{n}@example.com")
+
+    assert client.get("/users/export").status_code == 403
+    response = client.get(
+        "/users/export", params={"fields": "clerk_id"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    users = response.json()
+    assert sorted(u["clerk_id"] for u in users if u["clerk_id"] != "user_test") == [
+        f"export_{n}" for n in range(5)
+    ]
@@ -0,0 +1,41 @@
+"""Pytest plugin that enforces DB query budgets for API requests.
+
+Mark a test with ``@pytest.mark.query_budget(n)`` to fail it when any request
+it sends through the app runs more than ``n`` statements. Requires the
+``QueryStatsMiddleware`` (``QUERY_STATS=true``).
+"""
+
+import pytest
+from src.server.middleware.query_stats import QueryStatsMiddleware
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries): fail if a request runs more DB statements",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    budget = marker.args[0]
+    over_budget = []
+
+    def check(request, log):
+        if log.count > budget:
+            over_budget.append(
+                f"{request.method} {request.url.path} ran {log.count} queries"
+            )
+
+    QueryStatsMiddleware.listeners.append(check)
+    try:
+        result = yield
+    finally:
+        QueryStatsMiddleware.listeners.remove(check)
+    if over_budget:
+        pytest.fail(f"Query budget of {budget} exceeded: " + "; ".join(over_budget))
+    return result
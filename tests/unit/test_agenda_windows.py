@@ -0,0 +1,32 @@
+from datetime import date, datetime, timezone
+
+from src.server.services.agenda_service import get_zone, local_windows
+
+
+def test_local_windows_follow_timezone():
+    """Test the local day and time to midnight are computed in the zone."""
+    now = datetime(2026, 3, 1, 23, 30, tzinfo=timezone.utc)
+
+    today, week_end, seconds = local_windows(get_zone("UTC"), now)
+    assert (today, week_end) == (date(2026, 3, 1), date(2026, 3, 7))
+    assert seconds == 30 * 60
+
+    today, _, seconds = local_windows(get_zone("Asia/Tokyo"), now)
+    assert today == date(2026, 3, 2)
+    assert seconds == 15.5 * 3600
+
+
+def test_local_windows_across_dst_change():
+    """Test the day before a DST change is 23 hours long."""
+    # 2026-03-08 00:00 in New York (EST, UTC-5); clocks skip 02:00 to 03:00.
+    now = datetime(2026, 3, 8, 5, 0, tzinfo=timezone.utc)
+    today, _, seconds = local_windows(get_zone("America/New_York"), now)
+    assert today == date(2026, 3, 8)
+    assert seconds == 23 * 3600
+
+
+def test_get_zone_is_cached_and_tolerant():
+    """Test zones are reused and unknown names fall back to UTC."""
+    assert get_zone("Europe/London") is get_zone("Europe/London")
+    assert get_zone("Not/A_Zone").key == "UTC"
+    assert get_zone("").key == "UTC"
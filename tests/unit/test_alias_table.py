@@ -0,0 +1,29 @@
+import random
+from collections import Counter
+
+from src.server.services.habit_message_service import AliasTable, message_weights
+
+
+def test_alias_table_matches_weights():
+    """Test samples follow the weights, including zero-weight columns."""
+    weights = [5, 3, 0, 2]
+    table = AliasTable(weights)
+    rng = random.Random(7)
+    draws = Counter(table.sample(rng) for _ in range(100_000))
+
+    assert draws[2] == 0
+    for index, weight in enumerate(weights):
+        assert abs(draws[index] / 100_000 - weight / 10) < 0.01
+
+
+def test_alias_table_single_column():
+    """Test a single message is always picked."""
+    table = AliasTable([0.25])
+    assert {table.sample(random.Random(n)) for n in range(20)} == {0}
+
+
+def test_message_weights_favor_less_used():
+    """Test weights depend on usage relative to the least used message."""
+    assert message_weights([0, 0]) == [1.0, 1.0]
+    assert message_weights([10, 11, 13]) == [1.0, 0.5, 0.25]
+    assert message_weights([1000, 1000]) == message_weights([0, 0])
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pytest
+
+from src.database.models.enums import TaskStatus
+from src.server.services.dependency_service import DependencyGraph
+
+
+def make_graph(edges, durations=None, statuses=None):
+    """Build a graph from (prerequisite, dependent) pairs of node names."""
+    ids = {}
+    for edge in edges:
+        for name in edge:
+            ids.setdefault(name, uuid4())
+    graph = DependencyGraph()
+    for prerequisite, dependent in edges:
+        graph.add_edge(ids[prerequisite], ids[dependent])
+    for name, task_id in ids.items():
+        graph.duration[task_id] = (durations or {}).get(name, 0)
+        graph.status[task_id] = (statuses or {}).get(name, TaskStatus.PENDING)
+    return graph, ids
+
+
+def test_cycle_detection():
+    """Test adding an edge that closes a loop is detected."""
+    graph, ids = make_graph([("a", "b"), ("b", "c")])
+    assert graph.cycle_if_added(ids["a"], ids["c"]) is None
+    assert graph.cycle_if_added(ids["c"], ids["a"]) == [
+        ids["c"],
+        ids["a"],
+        ids["b"],
+        ids["c"],
+    ]
+
+
+def test_topological_order():
+    """Test prerequisites always come before their dependents."""
+    graph, ids = make_graph([("a", "c"), ("b", "c"), ("c", "d")])
+    order = graph.topological_order()
+    position = {task_id: i for i, task_id in enumerate(order)}
+    assert len(order) == 4
+    assert position[ids["a"]] < position[ids["c"]] < position[ids["d"]]
+    assert position[ids["b"]] < position[ids["c"]]
+
+
+def test_topological_order_rejects_cycles():
+    """Test a cyclic graph cannot be ordered."""
+    graph, _ = make_graph([("a", "b"), ("b", "a")])
+    with pytest.raises(ValueError):
+        graph.topological_order()
+
+
+def test_critical_path_skips_done_work():
+    """Test the critical path follows the longest chain of open work."""
+    graph, ids = make_graph(
+        [("a", "c"), ("b", "c")],
+        durations={"a": 30, "b": 60, "c": 15},
+    )
+    assert graph.critical_path() == ([ids["b"], ids["c"]], 75)
+
+    graph.status[ids["b"]] = TaskStatus.COMPLETED
+    assert graph.critical_path() == ([ids["a"], ids["c"]], 45)
+
+
+def test_blocked_tasks():
+    """Test only open tasks with unfinished prerequisites are blocked."""
+    graph, ids = make_graph(
+        [("a", "c"), ("b", "c"), ("c", "d")],
+        statuses={"a": TaskStatus.COMPLETED},
+    )
+    assert graph.blocked_tasks() == {ids["c"]: [ids["b"]], ids["d"]: [ids["c"]]}
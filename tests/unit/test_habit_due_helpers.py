@@ -0,0 +1,47 @@
+from datetime import date
+
+from src.database.models.enums import Frequency
+from src.server.services.habit_due_service import (
+    habit_mask,
+    is_day_scheduled,
+    iter_bits,
+    period_window,
+)
+from src.server.services.habit_service import ALL_DAYS
+
+
+def test_iter_bits():
+    """Test set bits are listed lowest first, including beyond 64 bits."""
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b101001)) == [0, 3, 5]
+    assert list(iter_bits(1 << 70 | 2)) == [1, 70]
+
+
+def test_habit_mask_accepts_any_json():
+    """Test masks are decoded (and cached) for names, numbers and bad values."""
+    assert habit_mask(None) == ALL_DAYS
+    assert habit_mask(["mon", "Friday"]) == 0b10001
+    assert habit_mask([0, 4]) == 0b10001
+    assert habit_mask([{"day": "mon"}]) == ALL_DAYS
+
+
+def test_schedule_kinds():
+    """Test which habits follow weekdays and which count per period."""
+    assert is_day_scheduled(Frequency.DAILY, ALL_DAYS)
+    assert is_day_scheduled(Frequency.WEEKLY, 0b1)
+    assert not is_day_scheduled(Frequency.WEEKLY, ALL_DAYS)
+    assert not is_day_scheduled(Frequency.MONTHLY, 0b1)
+
+
+def test_period_window():
+    """Test week, month and year windows around a day."""
+    day = date(2026, 2, 11)
+    assert period_window(Frequency.WEEKLY, day) == (date(2026, 2, 9), date(2026, 2, 15))
+    assert period_window(Frequency.MONTHLY, day) == (
+        date(2026, 2, 1),
+        date(2026, 2, 28),
+    )
+    assert period_window(Frequency.YEARLY, day) == (
+        date(2026, 1, 1),
+        date(2026, 12, 31),
+    )
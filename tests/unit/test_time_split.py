@@ -0,0 +1,37 @@
+from datetime import date, datetime, timezone
+
+from src.server.services.agenda_service import get_zone
+from src.server.services.time_tracking_service import split_by_day
+
+
+def test_split_by_day_at_local_midnight():
+    """Test a timer running over midnight is split at the user's midnight."""
+    start = datetime(2026, 3, 1, 22, 30, tzinfo=timezone.utc)
+    end = datetime(2026, 3, 2, 1, 0, tzinfo=timezone.utc)
+
+    assert split_by_day(start, end, get_zone("UTC")) == [
+        (date(2026, 3, 1), 90 * 60),
+        (date(2026, 3, 2), 60 * 60),
+    ]
+    # Already March 2 in Tokyo for the whole timer.
+    assert split_by_day(start, end, get_zone("Asia/Tokyo")) == [
+        (date(2026, 3, 2), 150 * 60)
+    ]
+
+
+def test_split_by_day_across_dst_change():
+    """Test the 23-hour day of a DST change is counted in real seconds."""
+    zone = get_zone("America/New_York")
+    start = datetime(2026, 3, 8, 0, 0, tzinfo=zone)
+    end = datetime(2026, 3, 9, 1, 0, tzinfo=zone)
+
+    assert split_by_day(start, end, zone) == [
+        (date(2026, 3, 8), 23 * 3600),
+        (date(2026, 3, 9), 3600),
+    ]
+
+
+def test_split_by_day_empty_interval():
+    """Test a zero-length timer yields nothing."""
+    moment = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    assert split_by_day(moment, moment, get_zone("UTC")) == []
@@ -0,0 +1,65 @@
+import asyncio
+
+from src.server.middleware.rate_limit import MemoryBackend, RedisBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_refills():
+    """Test a bucket serves its burst, then one request per refilled token."""
+    clock = FakeClock()
+    backend = MemoryBackend(clock)
+
+    assert [backend.take_now("k", 2, 3) for _ in range(3)] == [0, 0, 0]
+    assert backend.take_now("k", 2, 3) == 0.5
+    clock.now += 0.5
+    assert backend.take_now("k", 2, 3) == 0
+    assert backend.take_now("k", 2, 3) == 0.5
+    # Other keys have their own bucket.
+    assert backend.take_now("other", 2, 3) == 0
+
+    # Refill stops at the burst size.
+    clock.now += 60
+    assert [backend.take_now("k", 2, 3) for _ in range(4)] == [0, 0, 0, 0.5]
+
+
+def test_full_buckets_are_pruned():
+    """Test idle buckets are dropped when the backend is full."""
+    clock = FakeClock()
+    backend = MemoryBackend(clock)
+    backend.MAX_BUCKETS = 3
+    backend.take_now("idle", 1, 2)
+    clock.now += 5
+    backend.take_now("a", 1, 2)
+    backend.take_now("b", 1, 2)
+
+    backend.take_now("c", 1, 2)
+    assert set(backend._buckets) == {"a", "b", "c"}
+
+
+class DownRedis:
+    """A client whose scripts fail like an unreachable server."""
+
+    def register_script(self, script):
+        async def run(keys, args):
+            raise ConnectionError("Connection refused")
+
+        return run
+
+
+def test_redis_outage_falls_back_to_local_buckets():
+    """Test requests are still limited, locally, while Redis is down."""
+    clock = FakeClock()
+    backend = RedisBackend(DownRedis(), fallback=MemoryBackend(clock))
+
+    async def take():
+        return await backend.take("k", 1, 1)
+
+    assert asyncio.run(take()) == 0
+    assert asyncio.run(take()) == 1